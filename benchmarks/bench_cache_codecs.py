@@ -0,0 +1,71 @@
+# benchmarks/bench_cache_codecs.py
+
+"""
+Compare on-disk size and load latency of pickled cache entries under each
+compression codec, for the series the policy rules use by default.
+
+Run from the project root with the package installed (pip install -e .):
+
+    python benchmarks/bench_cache_codecs.py
+"""
+
+import os
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import pyeconomics.api.cache_manager as cache_manager
+
+REPEATS = 50
+
+CODECS = ('none', 'zlib', 'lzma', 'bz2')
+
+# Synthetic stand-ins for the default series of EconomicIndicators and the
+# Federal Funds Target Rate
+SERIES = {
+    'PCETRIM12M159SFRBDAL': pd.date_range('1978-02-01', '2024-05-01',
+                                          freq='MS'),
+    'UNRATE': pd.date_range('1948-01-01', '2024-05-01', freq='MS'),
+    'NROU': pd.date_range('1949-01-01', '2034-10-01', freq='QS'),
+    'DFII10': pd.date_range('2003-01-02', '2024-06-01', freq='B'),
+    'DFEDTAR': pd.date_range('1982-09-27', '2008-12-15', freq='D'),
+    'DFEDTARU': pd.date_range('2008-12-16', '2024-06-01', freq='D'),
+}
+
+
+def make_series(index: pd.DatetimeIndex) -> pd.Series:
+    rng = np.random.default_rng(0)
+    values = np.round(np.cumsum(rng.normal(0, 0.02, len(index))) + 2.0, 2)
+    return pd.Series(values, index=index)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_manager.CACHE_DIR = tmp
+        cache_manager.SERIES_FORMAT = 'pickle'
+        print(f"{'series':<22} {'codec':<6} {'rows':>6} {'bytes':>9} "
+              f"{'ratio':>6} {'load ms':>8}")
+        for series_id, index in SERIES.items():
+            series = make_series(index)
+            plain_size = None
+            for codec in CODECS:
+                key = f'{series_id}_{codec}'
+                cache_manager.save_to_cache(key, series, codec=codec)
+                size = os.path.getsize(cache_manager.cache_filename(key))
+                plain_size = plain_size or size
+
+                def load():
+                    # Bypass the memory tier to time reads from disk
+                    cache_manager.clear_memory_cache()
+                    cache_manager.load_from_cache(key)
+
+                latency = timeit.timeit(load, number=REPEATS) / REPEATS
+                print(f"{series_id:<22} {codec:<6} {len(series):>6} "
+                      f"{size:>9} {plain_size / size:>6.2f} "
+                      f"{latency * 1000:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
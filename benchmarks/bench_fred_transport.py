@@ -0,0 +1,104 @@
+# benchmarks/bench_fred_transport.py
+
+"""
+Compare per-request latency of a bulk prefetch through fredapi's
+connection-per-request urllib transport and the pooled keep-alive
+transport, against a local stand-in for the FRED observations endpoint.
+
+The stand-in sleeps when a connection is opened to model the TCP and TLS
+handshake round trips to api.stlouisfed.org; set it with
+--handshake-ms.
+
+Run from the project root with the package installed (pip install -e .):
+
+    python benchmarks/bench_fred_transport.py --handshake-ms 60
+"""
+
+import argparse
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pyeconomics.api.fred_transport import (
+    FredSession, PooledTransport, UrllibTransport
+)
+
+REQUESTS = 200
+
+WORKERS = 8
+
+OBSERVATIONS = (
+    '<?xml version="1.0" encoding="utf-8" ?><observations>' + ''.join(
+        f'<observation realtime_start="2024-06-01" realtime_end="2024-06-01" '
+        f'date="{year}-01-01" value="{year % 7}.5"/>'
+        for year in range(1950, 2024)) + '</observations>'
+).encode()
+
+
+class FredStandIn(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    handshake = 0.0
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; avoid Nagle delays
+        self.connection.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        type(self).connections += 1
+        time.sleep(self.handshake)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(OBSERVATIONS)))
+        self.end_headers()
+        self.wfile.write(OBSERVATIONS)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(session: FredSession) -> float:
+    """Fetch REQUESTS series on WORKERS threads; return mean latency."""
+    latencies = []
+
+    def fetch(i: int) -> None:
+        start = time.perf_counter()
+        session.get_series(f'SERIES{i}')
+        latencies.append(time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        list(executor.map(fetch, range(REQUESTS)))
+    return sum(latencies) / len(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--handshake-ms', type=float, default=60.0)
+    args = parser.parse_args()
+    FredStandIn.handshake = args.handshake_ms / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FredStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root_url = f"http://127.0.0.1:{server.server_address[1]}/fred"
+
+    print(f"{'transport':<10} {'requests':>8} {'connections':>11} "
+          f"{'mean ms':>8} {'wall s':>7}")
+    for name, transport in (('urllib', UrllibTransport()),
+                            ('pooled', PooledTransport(WORKERS))):
+        FredStandIn.connections = 0
+        session = FredSession('bench-key', transport, root_url=root_url)
+        start = time.perf_counter()
+        latency = run(session)
+        wall = time.perf_counter() - start
+        transport.close()
+        print(f"{name:<10} {REQUESTS:>8} {FredStandIn.connections:>11} "
+              f"{latency * 1000:>8.2f} {wall:>7.2f}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
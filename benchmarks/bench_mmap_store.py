@@ -0,0 +1,87 @@
+# benchmarks/bench_mmap_store.py
+
+"""
+Compare the memory used by N worker processes that each load the same cached
+series from pickle, Parquet and memory-mapped entries.
+
+Memory is reported as proportional set size (PSS), which splits shared pages
+between the processes mapping them, so the total is the real footprint.
+Linux only. Run from the project root with the package installed
+(pip install -e .):
+
+    python benchmarks/bench_mmap_store.py [workers]
+"""
+
+import multiprocessing
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import pyeconomics.api.cache_manager as cache_manager
+
+# Ten million daily observations (~160 MB in memory) so that per-process
+# copies dominate the interpreter's own footprint
+ROWS = 10_000_000
+
+
+def memory_kib(field: str) -> int:
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith(f'{field}:'):
+                return int(line.split()[1])
+    return 0
+
+
+def worker(cache_dir, series_format, barrier, results) -> None:
+    cache_manager.CACHE_DIR = cache_dir
+    cache_manager.SERIES_FORMAT = series_format
+    baseline = memory_kib('Pss')
+    series = cache_manager.load_from_cache('bench_series')
+    # Touch every page of the values and the index
+    series.sum()
+    series.index.asi8.sum()
+    barrier.wait()
+    results.put((memory_kib('Pss') - baseline, memory_kib('Rss')))
+    barrier.wait()
+
+
+def measure(cache_dir: str, series_format: str, workers: int) -> tuple:
+    cache_manager.CACHE_DIR = cache_dir
+    cache_manager.SERIES_FORMAT = series_format
+    index = pd.date_range('1900-01-01', periods=ROWS, freq='min')
+    cache_manager.save_to_cache('bench_series', pd.Series(
+        np.random.default_rng(0).normal(size=ROWS), index=index))
+
+    # Spawned workers start without a copy of the parent's heap
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=worker,
+            args=(cache_dir, series_format, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    usage = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return (sum(pss for pss, _ in usage) / 1024,
+            max(rss for _, rss in usage) / 1024)
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    print(f"{workers} workers, {ROWS:,} rows")
+    print(f"{'format':<8} {'total PSS MiB':>14} {'RSS per worker MiB':>19}")
+    for series_format in ('pickle', 'parquet', 'mmap'):
+        with tempfile.TemporaryDirectory() as tmp:
+            pss, rss = measure(tmp, series_format, workers)
+        print(f"{series_format:<8} {pss:>14.1f} {rss:>19.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_series_store.py
+
+"""
+Compare load latency and on-disk size of the pickle and Parquet cache formats.
+
+Run from the project root with the package installed (pip install -e .):
+
+    python benchmarks/bench_series_store.py
+"""
+
+import os
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import pyeconomics.api.cache_manager as cache_manager
+
+REPEATS = 50
+
+# Synthetic stand-ins for the daily series used by the policy rules
+SERIES = {
+    'DFEDTAR': pd.date_range('1982-09-27', '2008-12-15', freq='D'),
+    'DFEDTARU': pd.date_range('2008-12-16', '2024-06-01', freq='D'),
+    'DFII10': pd.date_range('2003-01-02', '2024-06-01', freq='B'),
+}
+
+
+def make_series(index: pd.DatetimeIndex) -> pd.Series:
+    rng = np.random.default_rng(0)
+    values = np.round(np.cumsum(rng.normal(0, 0.02, len(index))) + 2.0, 2)
+    return pd.Series(values, index=index)
+
+
+def entry_size(key: str) -> int:
+    for extension in ('.parquet', '.pkl'):
+        filename = cache_manager.cache_filename(key, extension)
+        if os.path.exists(filename):
+            return os.path.getsize(filename)
+    return 0
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_manager.CACHE_DIR = tmp
+        print(f"{'series':<10} {'format':<8} {'rows':>7} {'bytes':>9} "
+              f"{'load ms':>8} {'1y ms':>7}")
+        for series_id, index in SERIES.items():
+            series = make_series(index)
+            last_year = str(index[-1] - pd.DateOffset(years=1))
+            for series_format in ('pickle', 'parquet'):
+                cache_manager.SERIES_FORMAT = series_format
+                key = f'{series_id}_{series_format}'
+                cache_manager.save_to_cache(key, series)
+
+                def load(**kwargs):
+                    # Bypass the memory tier to time reads from disk
+                    cache_manager.clear_memory_cache()
+                    cache_manager.load_from_cache(key, **kwargs)
+
+                full = timeit.timeit(load, number=REPEATS) / REPEATS
+                ranged = timeit.timeit(
+                    lambda: load(start=last_year), number=REPEATS) / REPEATS
+                print(f"{series_id:<10} {series_format:<8} {len(series):>7} "
+                      f"{entry_size(key):>9} {full * 1000:>8.3f} "
+                      f"{ranged * 1000:>7.3f}")
+
+
+if __name__ == '__main__':
+    main()
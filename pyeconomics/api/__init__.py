@@ -1,8 +1,30 @@
 # pyeconomics/api/__init__.py
 
-from .cache_manager import save_to_cache, load_from_cache
+from .async_fred_api import AsyncFredClient
+from .cache_manager import cache_usage, load_from_cache, prune, save_to_cache
+from .cache_stats import cache_info, reset_cache_info
+from .data_source import DataSource
 from .fred_api import FredClient, fred_client
-from .fred_data import fetch_historical_fed_funds_rate
+from .fred_transport import FredTransport, PooledTransport, UrllibTransport
+from .local_data_source import LocalFileDataSource
+from .rate_limiter import (
+    PRIORITY_BULK, PRIORITY_INTERACTIVE, RateLimiter, request_priority
+)
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .series_info import SeriesInfo
+from .fred_data import (
+    FED_FUNDS_RATE_SERIES_IDS, combine_fed_funds_rate,
+    fetch_historical_fed_funds_rate
+)
+from .cache_warmup import prefetch, required_series
 
-__all__ = ['FredClient', 'fred_client', 'fetch_historical_fed_funds_rate',
-           'save_to_cache', 'load_from_cache']
+__all__ = ['AsyncFredClient', 'FredClient', 'fred_client',
+           'fetch_historical_fed_funds_rate', 'save_to_cache',
+           'load_from_cache', 'prune', 'cache_usage',
+           'cache_info', 'reset_cache_info', 'prefetch', 'required_series',
+           'combine_fed_funds_rate', 'FED_FUNDS_RATE_SERIES_IDS',
+           'RateLimiter', 'request_priority', 'PRIORITY_BULK',
+           'PRIORITY_INTERACTIVE', 'RetryPolicy', 'CircuitBreaker',
+           'CircuitOpenError', 'FredTransport', 'PooledTransport',
+           'UrllibTransport', 'SeriesInfo', 'DataSource',
+           'LocalFileDataSource']
@@ -0,0 +1,349 @@
+# pyeconomics/api/async_fred_api.py
+
+import asyncio
+import datetime
+import functools
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from typing import (
+    Any, AsyncIterator, ContextManager, Dict, Iterable, Optional, Union
+)
+
+import numpy as np
+import pandas as pd
+
+from pyeconomics.api.cache_backends import CacheBackend, get_cache_backend
+from pyeconomics.api.cache_expiry import (
+    CacheExpiryPolicy, Expiry, SERIES_FREQUENCIES, infer_frequency
+)
+from pyeconomics.api.file_lock import FileLock
+from pyeconomics.api.fred_api import resolve_api_key
+
+# aiohttp is imported when the first request is made, so importing the
+# package does not pay for it
+AIOHTTP_AVAILABLE = importlib.util.find_spec('aiohttp') is not None
+
+FRED_ROOT_URL = 'https://api.stlouisfed.org/fred'
+
+# Seconds between attempts to take a cache lock held by another client
+LOCK_POLL_INTERVAL = 0.01
+
+
+@asynccontextmanager
+async def _holding(lock: ContextManager) -> AsyncIterator[None]:
+    """
+    Hold a cache lock without blocking the event loop or a worker thread.
+
+    File and thread locks are polled with non-blocking attempts, so waiting
+    tasks never occupy the executor threads the holder needs to finish.
+    Other context managers are entered directly.
+    """
+    if isinstance(lock, FileLock):
+        try_acquire = functools.partial(lock.acquire, timeout=0)
+    elif hasattr(lock, 'acquire') and hasattr(lock, 'release'):
+        try_acquire = functools.partial(lock.acquire, blocking=False)
+    else:
+        with lock:
+            yield
+        return
+    while not try_acquire():
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+class AsyncFredClient:
+    """
+    An asyncio client for fetching data from the FRED API.
+
+    Requests are made with aiohttp, at most max_concurrency at a time, and
+    downloaded series are stored under the same cache keys as FredClient, so
+    both clients share cached data. Blocking cache operations run on worker
+    threads.
+
+    Attributes:
+        api_key (str): FRED API key.
+        root_url (str): Base URL of the FRED API.
+        max_concurrency (int): Maximum number of concurrent requests.
+        expiry_policy (CacheExpiryPolicy): Cache expiry by series frequency
+            with per-series overrides.
+        series_frequencies (Dict[str, str]): Known FRED frequency codes by
+            series ID, extended as series are loaded.
+        cache (CacheBackend): Storage tier caching downloaded series.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 8,
+        cache_expiry: Optional[Dict[str, Expiry]] = None,
+        cache_backend: Union[str, CacheBackend, None] = None,
+        root_url: str = FRED_ROOT_URL
+    ):
+        """
+        Args:
+            api_key (Optional[str]): The FRED API key, retrieved from the
+                FRED_API_KEY environment variable or keyring if None.
+            max_concurrency (int): Maximum number of concurrent requests.
+                Defaults to 8.
+            cache_expiry (Optional[Dict[str, Expiry]]): Per-series cache
+                expiry overriding the frequency-based default.
+            cache_backend (Union[str, CacheBackend, None]): Cache backend
+                instance or name ('filesystem', 'memory' or 'sqlite').
+                Defaults to the PYECONOMICS_CACHE_BACKEND environment
+                variable, or 'filesystem' if unset.
+            root_url (str): Base URL of the FRED API.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+            ValueError: If no API key is found.
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "AsyncFredClient requires aiohttp; install it with "
+                "pip install pyeconomics[async].")
+        self.api_key = resolve_api_key(api_key)
+        self.root_url = root_url.rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.expiry_policy = CacheExpiryPolicy(
+            overrides=dict(cache_expiry or {}))
+        self.series_frequencies = dict(SERIES_FREQUENCIES)
+        self.cache = get_cache_backend(cache_backend)
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._downloads: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> 'AsyncFredClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the HTTP session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def get_cache_expiry(self, series_id: str) -> Expiry:
+        """
+        Returns the cache expiry of a series from its override or frequency.
+
+        Args:
+            series_id (str): FRED series ID.
+
+        Returns:
+            Expiry: Maximum age of the cache entry or a release cutoff rule.
+        """
+        return self.expiry_policy.expiry_for(
+            series_id, self.series_frequencies.get(series_id))
+
+    async def _request(self, path: str, **params: str) -> Dict[str, Any]:
+        """
+        Sends a GET request to the FRED API and decodes the JSON response.
+
+        Args:
+            path (str): Endpoint path, e.g. 'series/observations'.
+            **params (str): Query parameters besides the API key and file
+                type.
+
+        Returns:
+            Dict[str, Any]: The decoded response.
+
+        Raises:
+            ValueError: If FRED returns an error.
+        """
+        if self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        query = dict(params, api_key=self.api_key, file_type='json')
+        async with self._semaphore:
+            async with self._session.get(
+                f"{self.root_url}/{path}", params=query
+            ) as response:
+                payload = await response.json(content_type=None)
+                if response.status >= 400:
+                    raise ValueError(
+                        payload.get('error_message') or
+                        f"FRED request failed with status {response.status}")
+                return payload
+
+    async def _download_series(self, series_id: str) -> pd.Series:
+        """
+        Downloads the observations of a series.
+
+        Args:
+            series_id (str): FRED series ID.
+
+        Returns:
+            pandas.Series: Observations indexed by date, with FRED's missing
+                value marker '.' as NaN.
+        """
+        payload = await self._request(
+            'series/observations', series_id=series_id)
+        observations = payload.get('observations', [])
+        index = pd.DatetimeIndex(
+            [observation['date'] for observation in observations])
+        values = np.array([
+            np.nan if observation['value'] == '.'
+            else float(observation['value'])
+            for observation in observations
+        ], dtype='float64')
+        return pd.Series(values, index=index)
+
+    async def fetch_data(self, series_id: str) -> pd.Series:
+        """
+        Fetches data for a given series ID from FRED with caching.
+
+        Args:
+            series_id (str): FRED series ID to fetch data for.
+
+        Returns:
+            pandas.Series: Series containing the requested data.
+
+        Raises:
+            ValueError: If no data is found for series ID.
+            Exception: For fetch operation errors.
+        """
+        cache_key = f"fred_series_{series_id}"
+        data = await asyncio.to_thread(
+            self.cache.get, cache_key, self.get_cache_expiry(series_id))
+        if data is not None:
+            logging.info(f"Data for {series_id} loaded from cache.")
+            self._learn_frequency(series_id, data)
+            return data
+
+        # Concurrent requests for a series share one download; the callers
+        # joining it get their own copy of the result.
+        download = self._downloads.get(series_id)
+        if download is not None:
+            return (await asyncio.shield(download)).copy()
+        download = asyncio.ensure_future(self._fetch_locked(series_id))
+        self._downloads[series_id] = download
+        download.add_done_callback(
+            lambda _: self._downloads.pop(series_id, None))
+        return await asyncio.shield(download)
+
+    async def _fetch_locked(self, series_id: str) -> pd.Series:
+        """
+        Downloads and caches a series while holding its cache lock.
+
+        Only one client sharing the cache fetches a given series at a time;
+        the others wait and then find it in the cache.
+
+        Args:
+            series_id (str): FRED series ID.
+
+        Returns:
+            pandas.Series: Series containing the requested data.
+
+        Raises:
+            ValueError: If no data is found for series ID.
+            Exception: For fetch operation errors.
+        """
+        cache_key = f"fred_series_{series_id}"
+        async with _holding(self.cache.lock(cache_key)):
+            data = await asyncio.to_thread(
+                self.cache.get, cache_key, self.get_cache_expiry(series_id))
+            if data is not None:
+                logging.info(f"Data for {series_id} loaded from cache.")
+                self._learn_frequency(series_id, data)
+                return data
+
+            try:
+                data = await self._download_series(series_id)
+                if data.empty:
+                    raise ValueError(
+                        f"No data found for series ID {series_id}")
+                await asyncio.to_thread(self.cache.put, cache_key, data)
+                logging.info(f"Data for {series_id} fetched and cached.")
+                self._learn_frequency(series_id, data)
+                return data
+            except Exception as e:
+                logging.error(f"Fetching error for {series_id}: {e}")
+                raise
+
+    async def fetch_many(
+        self,
+        series_ids: Iterable[str],
+        as_frame: bool = False
+    ) -> Union[Dict[str, pd.Series], pd.DataFrame]:
+        """
+        Fetches several series concurrently, bounded by max_concurrency.
+
+        Args:
+            series_ids (Iterable[str]): FRED series IDs to fetch.
+            as_frame (bool): Whether to return a DataFrame with one column
+                per series, aligned on the union of their dates. Defaults to
+                False.
+
+        Returns:
+            Union[Dict[str, pd.Series], pd.DataFrame]: Series by ID in the
+                order requested, or the aligned DataFrame.
+
+        Raises:
+            ValueError: If no data is found for one of the series.
+            Exception: For fetch operation errors.
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        series = await asyncio.gather(
+            *(self.fetch_data(series_id) for series_id in series_ids))
+        results = dict(zip(series_ids, series))
+        return pd.DataFrame(results) if as_frame else results
+
+    async def get_latest_value(self, series_id: str) -> Optional[float]:
+        """
+        Fetches the latest value for a FRED series ID, considering only dates
+        up to today.
+
+        Args:
+            series_id (str): Identifier for the FRED data series.
+
+        Returns:
+            Optional[float]: Most recent data point up to today, or None if no
+                data.
+        """
+        try:
+            data = await self.fetch_data(series_id)
+            today = datetime.date.today()
+            filtered_data = data[:str(today)]
+            return filtered_data.iloc[-1] if not filtered_data.empty else None
+        except Exception as e:
+            logging.error(f"Error in getting latest value for {series_id}: {e}")
+            raise
+
+    async def get_series_name(self, series_id: str) -> str:
+        """
+        Fetches the name of a FRED series given its ID.
+
+        Args:
+            series_id (str): Identifier for the FRED data series.
+
+        Returns:
+            str: Name of the FRED series.
+        """
+        try:
+            payload = await self._request('series', series_id=series_id)
+            return payload['seriess'][0]['title']
+        except Exception as e:
+            logging.error(f"Error in getting series name for {series_id}: {e}")
+            raise
+
+    def _learn_frequency(self, series_id: str, data: pd.Series) -> None:
+        """
+        Records the frequency of a series not yet known to the client.
+
+        Args:
+            series_id (str): FRED series ID.
+            data (pandas.Series): Observations of the series.
+        """
+        if series_id not in self.series_frequencies:
+            frequency = infer_frequency(data)
+            if frequency is not None:
+                self.series_frequencies[series_id] = frequency
@@ -0,0 +1,291 @@
+# pyeconomics/api/cache_backends.py
+
+import os
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, ContextManager, Dict, Iterable, Optional, Union
+
+from pyeconomics.api import cache_manager, cache_stats
+from pyeconomics.api.cache_codecs import check_codec
+from pyeconomics.api.cache_expiry import Expiry
+from pyeconomics.api.memory_cache import MemoryCache
+from pyeconomics.api.sqlite_cache import SQLiteCache
+
+# Backend used when neither FredClient nor the environment selects one
+DEFAULT_CACHE_BACKEND = 'filesystem'
+
+
+class CacheBackend:
+    """
+    Abstract base class for the storage tiers caching downloaded series.
+
+    Subclasses implement get, put, invalidate and stats; get_many and
+    put_many fall back to one call per key unless overridden.
+    """
+
+    def get(
+        self,
+        key: str,
+        expiry: Expiry = timedelta(days=1),
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Load data from the cache if available and not expired.
+
+        Args:
+            key (str): The key for the cache entry.
+            expiry (Expiry): The expiration time for the cache entry.
+            start (str, optional): First observation date to load for time
+                series entries.
+            end (str, optional): Last observation date to load for time
+                series entries.
+
+        Returns:
+            The cached data if available and not expired, otherwise None.
+
+        Raises:
+            NotImplementedError: If method is not implemented.
+        """
+        raise NotImplementedError(
+            "This method should be overridden by subclasses."
+        )
+
+    def put(self, key: str, data: Any) -> None:
+        """
+        Save data to the cache.
+
+        Args:
+            key (str): The key for the cache entry.
+            data: The data to be cached.
+
+        Raises:
+            NotImplementedError: If method is not implemented.
+        """
+        raise NotImplementedError(
+            "This method should be overridden by subclasses."
+        )
+
+    def get_many(
+        self,
+        keys: Iterable[str],
+        expiry: Expiry = timedelta(days=1)
+    ) -> Dict[str, Any]:
+        """
+        Load several entries from the cache.
+
+        Args:
+            keys (Iterable[str]): The keys of the cache entries.
+            expiry (Expiry): The expiration time for the cache entries.
+
+        Returns:
+            Dict[str, Any]: Cached data of every key found and not expired.
+        """
+        results = {}
+        for key in keys:
+            data = self.get(key, expiry)
+            if data is not None:
+                results[key] = data
+        return results
+
+    def put_many(self, items: Dict[str, Any]) -> None:
+        """
+        Save several entries to the cache.
+
+        Args:
+            items (Dict[str, Any]): Data to be cached by key.
+        """
+        for key, data in items.items():
+            self.put(key, data)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove an entry from the cache if present.
+
+        Args:
+            key (str): The key for the cache entry.
+
+        Raises:
+            NotImplementedError: If method is not implemented.
+        """
+        raise NotImplementedError(
+            "This method should be overridden by subclasses."
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the size of the cache.
+
+        Returns:
+            Dict[str, Any]: At least 'entries' and 'total_bytes'.
+
+        Raises:
+            NotImplementedError: If method is not implemented.
+        """
+        raise NotImplementedError(
+            "This method should be overridden by subclasses."
+        )
+
+    def lock(self, key: str) -> ContextManager:
+        """
+        Return a lock serializing downloads of one key between the clients
+        sharing this cache.
+
+        Args:
+            key (str): The key for the cache entry.
+
+        Returns:
+            ContextManager: Lock to hold while fetching and saving the entry.
+        """
+        return nullcontext()
+
+
+class FilesystemCacheBackend(CacheBackend):
+    """
+    Cache backend storing one file per entry in cache_manager.CACHE_DIR, in
+    front of the in-process memory tier. Shared by every process on the
+    host.
+
+    Attributes:
+        codec (str): Compression codec of pickled entries.
+    """
+
+    def __init__(self, codec: Optional[str] = None):
+        self.codec = check_codec(codec)
+
+    def get(self, key, expiry=timedelta(days=1), start=None, end=None):
+        return cache_manager.load_from_cache(key, expiry, start, end)
+
+    def put(self, key, data):
+        cache_manager.save_to_cache(key, data, self.codec)
+
+    def invalidate(self, key):
+        cache_manager.remove_from_cache(key)
+
+    def stats(self):
+        return asdict(cache_manager.cache_usage())
+
+    def lock(self, key):
+        return cache_manager.cache_lock(key)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Cache backend holding entries in process memory only, for short-lived
+    jobs and tests that should not touch the disk.
+
+    Attributes:
+        cache (MemoryCache): The bounded in-memory store.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = cache_manager.MEMORY_CACHE_MAX_ENTRIES,
+        max_bytes: int = cache_manager.MEMORY_CACHE_MAX_BYTES
+    ):
+        self.cache = MemoryCache(max_entries, max_bytes)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def get(self, key, expiry=timedelta(days=1), start=None, end=None):
+        with cache_stats.timed('load'):
+            data = self.cache.get(key, expiry)
+            if data is None:
+                cache_stats.record_miss()
+            else:
+                cache_stats.record_hit(memory=True)
+        return cache_manager._slice(data, start, end)
+
+    def put(self, key, data):
+        self.cache.put(key, data, time.time())
+
+    def invalidate(self, key):
+        self.cache.invalidate(key)
+
+    def stats(self):
+        return {'entries': len(self.cache),
+                'total_bytes': self.cache.total_bytes}
+
+    def lock(self, key):
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache backend storing every entry in a single SQLite database, so a
+    batch of keys is resolved in one query and the cache can be copied
+    between hosts as one file.
+
+    Attributes:
+        cache (SQLiteCache): The database holding the entries.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        codec: Optional[str] = None
+    ):
+        self.cache = SQLiteCache(path, codec=codec)
+
+    def get(self, key, expiry=timedelta(days=1), start=None, end=None):
+        return cache_manager._slice(self.cache.load(key, expiry), start, end)
+
+    def put(self, key, data):
+        self.cache.save(key, data)
+
+    def get_many(self, keys, expiry=timedelta(days=1)):
+        return self.cache.load_many(keys, expiry)
+
+    def put_many(self, items):
+        self.cache.save_many(items)
+
+    def invalidate(self, key):
+        self.cache.invalidate(key)
+
+    def stats(self):
+        return self.cache.usage()
+
+    def lock(self, key):
+        return cache_manager.cache_lock(key)
+
+
+# Backends selectable by name
+CACHE_BACKENDS = {
+    'filesystem': FilesystemCacheBackend,
+    'memory': MemoryCacheBackend,
+    'sqlite': SQLiteCacheBackend,
+}
+
+
+def get_cache_backend(
+    backend: Union[str, CacheBackend, None] = None
+) -> CacheBackend:
+    """
+    Resolve a cache backend instance.
+
+    Args:
+        backend (Union[str, CacheBackend, None]): A backend instance, the
+            name of one in CACHE_BACKENDS, or None to use the
+            PYECONOMICS_CACHE_BACKEND environment variable, falling back to
+            DEFAULT_CACHE_BACKEND.
+
+    Returns:
+        CacheBackend: The selected backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if isinstance(backend, CacheBackend):
+        return backend
+    name = backend or os.getenv(
+        'PYECONOMICS_CACHE_BACKEND', DEFAULT_CACHE_BACKEND)
+    try:
+        return CACHE_BACKENDS[name.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache backend '{name}'; expected one of "
+            f"{', '.join(CACHE_BACKENDS)}.") from None
@@ -0,0 +1,91 @@
+# pyeconomics/api/cache_codecs.py
+
+import bz2
+import lzma
+import os
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+# Codec applied to newly written entries unless a backend selects another.
+# One of CODECS; 'none' stores entries uncompressed.
+DEFAULT_CODEC = os.getenv('PYECONOMICS_CACHE_CODEC', 'none')
+
+# Identifier of uncompressed entries in the entry header
+NO_CODEC = 0
+
+# Codec name -> (identifier byte, compress, decompress)
+CODECS: Dict[str, Tuple[int, Callable[[bytes], bytes],
+                        Callable[[bytes], bytes]]] = {
+    'zlib': (1, lambda data: zlib.compress(data, 6), zlib.decompress),
+    'lzma': (2, lzma.compress, lzma.decompress),
+    'bz2': (3, lambda data: bz2.compress(data, 9), bz2.decompress),
+}
+
+_DECOMPRESSORS = {
+    identifier: decompress for identifier, _, decompress in CODECS.values()
+}
+
+
+def check_codec(codec: Optional[str]) -> str:
+    """
+    Validate a codec name.
+
+    Args:
+        codec (str, optional): Name of a codec in CODECS, 'none', or None for
+            DEFAULT_CODEC.
+
+    Returns:
+        str: The validated codec name.
+
+    Raises:
+        ValueError: If the codec is unknown.
+    """
+    codec = (codec or DEFAULT_CODEC).lower()
+    if codec != 'none' and codec not in CODECS:
+        raise ValueError(
+            f"Unknown cache codec '{codec}'; expected one of "
+            f"none, {', '.join(CODECS)}.")
+    return codec
+
+
+def compress(data: bytes, codec: Optional[str] = None) -> Tuple[int, bytes]:
+    """
+    Compress a serialized cache entry.
+
+    Args:
+        data (bytes): Serialized entry.
+        codec (str, optional): Codec name. Defaults to DEFAULT_CODEC.
+
+    Returns:
+        Tuple[int, bytes]: Identifier of the codec, recorded in the entry
+            header, and the compressed data, or data unchanged for 'none'.
+    """
+    codec = check_codec(codec)
+    if codec == 'none':
+        return NO_CODEC, data
+    identifier, compressor, _ = CODECS[codec]
+    return identifier, compressor(data)
+
+
+def decompress(identifier: int, data: bytes) -> bytes:
+    """
+    Restore a serialized cache entry written by compress with any codec.
+
+    Args:
+        identifier (int): Identifier of the codec returned by compress.
+        data (bytes): Compressed data.
+
+    Returns:
+        bytes: The serialized entry.
+
+    Raises:
+        ValueError: If the identifier names an unknown codec.
+    """
+    if identifier == NO_CODEC:
+        return data
+    try:
+        decompressor = _DECOMPRESSORS[identifier]
+    except KeyError:
+        raise ValueError(f"Unknown cache codec identifier {identifier}.") \
+            from None
+    return decompressor(data)
@@ -0,0 +1,169 @@
+# pyeconomics/api/cache_expiry.py
+
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Union
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ReleaseCutoff:
+    """
+    Expiry rule that keeps an entry until the next daily release cutoff.
+
+    Attributes:
+        hour (int): Hour of the daily cutoff. Defaults to 16.
+        minute (int): Minute of the daily cutoff. Defaults to 0.
+        timezone (str): IANA time zone of the cutoff. Defaults to
+            'America/New_York'.
+        grace (timedelta): Time an entry is kept after the cutoff. Defaults
+            to zero.
+    """
+    hour: int = 16
+    minute: int = 0
+    timezone: str = 'America/New_York'
+    grace: timedelta = timedelta(0)
+
+    def expires_at(self, saved_at: float) -> float:
+        """
+        Compute when an entry saved at the given time expires.
+
+        Args:
+            saved_at (float): POSIX timestamp at which the entry was saved.
+
+        Returns:
+            float: POSIX timestamp of the first cutoff after saved_at, plus
+                the grace period.
+        """
+        saved = datetime.fromtimestamp(saved_at, ZoneInfo(self.timezone))
+        cutoff = saved.replace(
+            hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if cutoff <= saved:
+            cutoff += timedelta(days=1)
+        return cutoff.timestamp() + self.grace.total_seconds()
+
+
+Expiry = Union[timedelta, ReleaseCutoff]
+
+
+def with_grace(expiry: Expiry, grace: timedelta) -> Expiry:
+    """
+    Extend an expiry rule so that entries stay valid for a grace period after
+    they expire.
+
+    Args:
+        expiry (Expiry): Maximum age of the entry or a release cutoff rule.
+        grace (timedelta): Time an entry is kept after it expires.
+
+    Returns:
+        Expiry: The extended rule.
+    """
+    if isinstance(expiry, timedelta):
+        return expiry + grace
+    return replace(expiry, grace=expiry.grace + grace)
+
+
+def is_expired(
+    expiry: Expiry,
+    saved_at: float,
+    now: Optional[float] = None
+) -> bool:
+    """
+    Check whether an entry saved at the given time has expired.
+
+    Args:
+        expiry (Expiry): Maximum age of the entry or a release cutoff rule.
+        saved_at (float): POSIX timestamp at which the entry was saved.
+        now (float, optional): Current POSIX timestamp. Defaults to the
+            current time.
+
+    Returns:
+        bool: True if the entry has expired.
+    """
+    now = time.time() if now is None else now
+    if isinstance(expiry, timedelta):
+        return now - saved_at >= expiry.total_seconds()
+    return now >= expiry.expires_at(saved_at)
+
+
+# Cache expiry by FRED frequency code
+DEFAULT_EXPIRY_BY_FREQUENCY: Dict[str, Expiry] = {
+    'D': ReleaseCutoff(),
+    'W': timedelta(days=1),
+    'BW': timedelta(days=1),
+    'M': timedelta(days=1),
+    'Q': timedelta(days=7),
+    'SA': timedelta(days=14),
+    'A': timedelta(days=30),
+}
+
+# Frequencies of the series used by the monetary policy rules by default
+SERIES_FREQUENCIES: Dict[str, str] = {
+    'DFEDTAR': 'D',
+    'DFEDTARU': 'D',
+    'DFII10': 'D',
+    'NROU': 'Q',
+    'PCETRIM12M159SFRBDAL': 'M',
+    'UNRATE': 'M',
+}
+
+
+@dataclass
+class CacheExpiryPolicy:
+    """
+    Data class mapping FRED series to cache expiry rules.
+
+    Attributes:
+        by_frequency (Dict[str, Expiry]): Expiry by FRED frequency code.
+        overrides (Dict[str, Expiry]): Expiry by series ID, taking precedence
+            over the frequency.
+        default (Expiry): Expiry for series of unknown frequency. Defaults to
+            one day.
+    """
+    by_frequency: Dict[str, Expiry] = field(
+        default_factory=lambda: dict(DEFAULT_EXPIRY_BY_FREQUENCY))
+    overrides: Dict[str, Expiry] = field(default_factory=dict)
+    default: Expiry = timedelta(days=1)
+
+    def expiry_for(
+        self,
+        series_id: str,
+        frequency: Optional[str] = None
+    ) -> Expiry:
+        """
+        Look up the cache expiry of a series.
+
+        Args:
+            series_id (str): FRED series ID.
+            frequency (str, optional): FRED frequency code of the series.
+
+        Returns:
+            Expiry: The expiry rule for the series.
+        """
+        if series_id in self.overrides:
+            return self.overrides[series_id]
+        return self.by_frequency.get(frequency, self.default)
+
+
+def infer_frequency(series: pd.Series) -> Optional[str]:
+    """
+    Infer the FRED frequency code of a series from its observation dates.
+
+    Args:
+        series (pd.Series): Series indexed by observation date.
+
+    Returns:
+        Optional[str]: Frequency code, or None if it cannot be inferred.
+    """
+    if not isinstance(series.index, pd.DatetimeIndex) or len(series) < 2:
+        return None
+    spacing = pd.Series(series.index[-50:]).diff().dt.days.median()
+    for frequency, max_days in (
+        ('D', 4), ('W', 8), ('BW', 16), ('M', 35), ('Q', 95), ('SA', 190)
+    ):
+        if spacing <= max_days:
+            return frequency
+    return 'A'
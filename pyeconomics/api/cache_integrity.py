@@ -0,0 +1,69 @@
+# pyeconomics/api/cache_integrity.py
+
+import struct
+import zlib
+from typing import Optional
+
+from pyeconomics.api import cache_codecs
+
+# Version of the serialized entry layout. Entries written with another
+# version are treated as corrupt and fetched again.
+ENTRY_FORMAT_VERSION = 2
+
+# Pickled entries start with this header: a marker, the format version, the
+# identifier of the compression codec and the CRC-32 of the stored payload.
+# Pickles never start with a zero byte, so entries written before the header
+# existed are still recognised.
+_MAGIC = b'\x00PYE'
+_HEADER = struct.Struct('>4sBBI')
+
+
+class CorruptCacheEntryError(ValueError):
+    """Raised when a cache entry fails its integrity checks."""
+
+
+def seal(data: bytes, codec: Optional[str] = None) -> bytes:
+    """
+    Compress a serialized cache entry and prefix it with its header.
+
+    Args:
+        data (bytes): Serialized entry.
+        codec (str, optional): Compression codec name. Defaults to
+            cache_codecs.DEFAULT_CODEC.
+
+    Returns:
+        bytes: The sealed entry.
+    """
+    identifier, payload = cache_codecs.compress(data, codec)
+    return _HEADER.pack(_MAGIC, ENTRY_FORMAT_VERSION, identifier,
+                        zlib.crc32(payload)) + payload
+
+
+def unseal(blob: bytes) -> bytes:
+    """
+    Verify a sealed cache entry, strip its header and decompress it. Entries
+    without a header are returned unchanged.
+
+    Args:
+        blob (bytes): Stored entry.
+
+    Returns:
+        bytes: The serialized entry.
+
+    Raises:
+        CorruptCacheEntryError: If the entry is truncated, has another
+            format version or does not match its checksum.
+        ValueError: If the entry names an unknown codec.
+    """
+    if not blob.startswith(_MAGIC):
+        return blob
+    if len(blob) < _HEADER.size:
+        raise CorruptCacheEntryError("Truncated cache entry header.")
+    _, version, identifier, checksum = _HEADER.unpack_from(blob)
+    if version != ENTRY_FORMAT_VERSION:
+        raise CorruptCacheEntryError(
+            f"Unsupported cache entry format version {version}.")
+    payload = blob[_HEADER.size:]
+    if zlib.crc32(payload) != checksum:
+        raise CorruptCacheEntryError("Cache entry checksum mismatch.")
+    return cache_codecs.decompress(identifier, payload)
@@ -1,10 +1,33 @@
 # pyeconomics/api/cache_manager.py
 
+import atexit
+import json
+import logging
 import os
 import pickle
-from datetime import datetime, timedelta
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
 from hashlib import sha256
-from typing import Any
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from pyeconomics.api import cache_integrity, cache_stats
+from pyeconomics.api.cache_expiry import Expiry, is_expired
+from pyeconomics.api.file_lock import FileLock
+from pyeconomics.api.memory_cache import MemoryCache
+from pyeconomics.api.mmap_store import (
+    MMAP_EXTENSION, is_mappable_series, read_mapped_series,
+    write_mapped_series
+)
+from pyeconomics.api.series_store import (
+    PYARROW_AVAILABLE, SERIES_EXTENSION, is_storable_series, read_series,
+    write_series
+)
 
 # Define the cache directory relative to the root of the project
 CACHE_DIR = os.path.join(
@@ -13,49 +36,513 @@ CACHE_DIR = os.path.join(
 if not os.path.exists(CACHE_DIR):
     os.makedirs(CACHE_DIR)
 
+# Storage format for time series entries: 'pickle' keeps the original
+# per-key pickle files, 'parquet' stores them in the columnar series store
+# and 'mmap' as raw arrays that worker processes map from shared pages.
+# Pickle is the default as full loads, the only kind FredClient makes, are
+# fastest from it; parquet pays off for date-range reads.
+SERIES_FORMAT = os.getenv('PYECONOMICS_SERIES_FORMAT', 'pickle')
+
+PICKLE_EXTENSION = '.pkl'
+LOCK_EXTENSION = '.lock'
+
+# Extensions of every entry format, in the order they are looked up
+ENTRY_EXTENSIONS = (SERIES_EXTENSION, MMAP_EXTENSION, PICKLE_EXTENSION)
+
+# In-process tier in front of the disk cache, bounded by entry count and by
+# total bytes. Set the entry limit to 0 to disable it.
+MEMORY_CACHE_MAX_ENTRIES = int(
+    os.getenv('PYECONOMICS_MEMORY_CACHE_MAX_ENTRIES', '128'))
+MEMORY_CACHE_MAX_BYTES = int(
+    os.getenv('PYECONOMICS_MEMORY_CACHE_MAX_BYTES', str(256 << 20)))
+
+memory_cache = MemoryCache(MEMORY_CACHE_MAX_ENTRIES, MEMORY_CACHE_MAX_BYTES)
+
+# Bounds of the cache directory, enforced whenever an entry is saved. Entries
+# older than the maximum age are removed, then least recently used entries
+# until the total size fits. Set either variable to 0 to disable the bound.
+MAX_CACHE_BYTES = int(
+    os.getenv('PYECONOMICS_CACHE_MAX_BYTES', str(1 << 30))) or None
+MAX_CACHE_AGE = timedelta(days=float(
+    os.getenv('PYECONOMICS_CACHE_MAX_AGE_DAYS', '90'))) or None
+
+# Small JSON index of the entries in CACHE_DIR, so that usage and eviction
+# never need to walk and stat the directory
+INDEX_FILENAME = 'index.json'
+INDEX_LOCK_FILENAME = 'index.lock'
+
+# Access times recorded by this process since the index was last written
+_access_times: Dict[str, float] = {}
+_access_lock = Lock()
+
+
+@dataclass
+class CacheUsage:
+    """
+    Data class describing the disk usage of the cache directory.
+
+    Attributes:
+        entries (int): Number of cache entries.
+        total_bytes (int): Total size of the cache entries in bytes.
+        max_bytes (int, optional): Configured maximum total size.
+        max_age (timedelta, optional): Configured maximum entry age.
+    """
+    entries: int
+    total_bytes: int
+    max_bytes: Optional[int]
+    max_age: Optional[timedelta]
+
+
+def _hashed_key(key: str) -> str:
+    """Hash a cache key into the base name of its files."""
+    return sha256(key.encode('utf-8')).hexdigest()
 
-def cache_filename(key: str) -> str:
+
+def cache_filename(key: str, extension: str = PICKLE_EXTENSION) -> str:
     """Generate a filename for the cache based on a hashed key.
 
     Args:
         key (str): The key to hash for generating the cache filename.
+        extension (str): The file extension of the cache entry.
 
     Returns:
         str: The path to the cache file.
     """
-    hashed_key = sha256(key.encode('utf-8')).hexdigest()
-    return os.path.join(CACHE_DIR, f"{hashed_key}.pkl")
+    return os.path.join(CACHE_DIR, f"{_hashed_key(key)}{extension}")
+
+
+def _remove_file(filename: str) -> None:
+    """Remove a file, ignoring it if it does not exist."""
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+
+
+def _atomic_write(filename: str, write: Callable[[str], None]) -> None:
+    """Write a file under a temporary name and rename it into place.
+
+    Readers in other processes see either the previous file or the complete
+    new one, never a partially written file.
+
+    Args:
+        filename (str): Final path of the file.
+        write (Callable[[str], None]): Function writing the contents to the
+            path it is given.
+
+    Returns:
+        None
+    """
+    directory = os.path.dirname(filename)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_filename = tempfile.mkstemp(
+        dir=directory, prefix='.', suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_filename)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        _remove_file(tmp_filename)
+        raise
+
+
+def _write_pickle(
+    filename: str,
+    data: Any,
+    codec: Optional[str] = None
+) -> None:
+    """Pickle data to a file, compressed with the given codec and sealed
+    with a checksum."""
+    payload = cache_integrity.seal(
+        pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), codec)
+    with open(filename, 'wb') as f:
+        f.write(payload)
+
+
+def cache_lock(key: str) -> FileLock:
+    """Create the advisory inter-process lock of a cache entry.
+
+    Holding the lock while checking the cache and fetching a missing entry
+    ensures only one process fetches a given key at a time.
+
+    Args:
+        key (str): The key for the cache entry.
+
+    Returns:
+        FileLock: Unlocked lock; use it as a context manager to acquire it.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return FileLock(cache_filename(key, LOCK_EXTENSION))
+
+
+def _scan_cache_dir() -> Dict[str, dict]:
+    """Build index records for every entry file found in CACHE_DIR.
+
+    Used only when the index is missing or unreadable.
+    """
+    index = {}
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except FileNotFoundError:
+        return index
+    for entry in entries:
+        name, extension = os.path.splitext(entry.name)
+        if extension not in ENTRY_EXTENSIONS or name.startswith('.'):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        index[name] = {
+            'key': None,
+            'extension': extension,
+            'size': stat.st_size,
+            'saved_at': stat.st_mtime,
+            'accessed_at': stat.st_mtime,
+        }
+    return index
+
+
+def _read_index() -> Dict[str, dict]:
+    """Read the cache index, rebuilding it from the directory if needed."""
+    try:
+        with open(os.path.join(CACHE_DIR, INDEX_FILENAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return _scan_cache_dir()
+
+
+def _write_json(filename: str, data: Any) -> None:
+    """Write data to a file as JSON."""
+    with open(filename, 'w') as f:
+        json.dump(data, f)
+
+
+@contextmanager
+def _updating_index() -> Iterator[Dict[str, dict]]:
+    """Lock, read and yield the cache index, then write it back.
+
+    Access times recorded by this process are merged in before yielding.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with FileLock(os.path.join(CACHE_DIR, INDEX_LOCK_FILENAME)):
+        index = _read_index()
+        with _access_lock:
+            access_times = dict(_access_times)
+            _access_times.clear()
+        for name, accessed_at in access_times.items():
+            if name in index:
+                index[name]['accessed_at'] = max(
+                    index[name]['accessed_at'], accessed_at)
+        yield index
+        _atomic_write(
+            os.path.join(CACHE_DIR, INDEX_FILENAME),
+            lambda path: _write_json(path, index))
+
+
+def _record_access(key: str) -> None:
+    """Remember that an entry was read, for least-recent-access eviction."""
+    with _access_lock:
+        _access_times[_hashed_key(key)] = time.time()
+
+
+def _flush_access_times() -> None:
+    """Write pending access times to the index at interpreter exit."""
+    if not _access_times:
+        return
+    try:
+        with _updating_index():
+            pass
+    except OSError:
+        pass
+
+
+atexit.register(_flush_access_times)
+
+
+def _evict(
+    index: Dict[str, dict],
+    max_bytes: Optional[int],
+    max_age: Optional[timedelta],
+    keep: Optional[str] = None
+) -> List[str]:
+    """Remove entries beyond the given bounds from the index and disk.
+
+    Args:
+        index (Dict[str, dict]): The cache index, updated in place.
+        max_bytes (int, optional): Maximum total size of the entries.
+        max_age (timedelta, optional): Maximum age of an entry.
+        keep (str, optional): Hashed name of an entry never to evict.
+
+    Returns:
+        List[str]: Keys of the removed entries, or their hashed names when
+            the key is unknown.
+    """
+    now = time.time()
+    evicted = []
+    if max_age is not None:
+        evicted = [
+            name for name, entry in index.items()
+            if name != keep and
+            now - entry['saved_at'] > max_age.total_seconds()
+        ]
+    if max_bytes is not None:
+        remaining = sorted(
+            (name for name in index if name not in evicted),
+            key=lambda name: index[name]['accessed_at'])
+        total = sum(index[name]['size'] for name in remaining)
+        for name in remaining:
+            if total <= max_bytes:
+                break
+            if name != keep:
+                total -= index[name]['size']
+                evicted.append(name)
+
+    removed = []
+    for name in evicted:
+        entry = index.pop(name)
+        _remove_file(os.path.join(CACHE_DIR, name + entry['extension']))
+        if entry['key'] is not None:
+            memory_cache.invalidate(entry['key'])
+        removed.append(entry['key'] or name)
+    return removed
+
+
+def prune(
+    max_bytes: Optional[int] = None,
+    max_age: Optional[timedelta] = None
+) -> List[str]:
+    """Remove expired and least recently used entries from the cache.
+
+    Args:
+        max_bytes (int, optional): Maximum total size of the cache entries.
+            Defaults to MAX_CACHE_BYTES.
+        max_age (timedelta, optional): Maximum age of a cache entry. Defaults
+            to MAX_CACHE_AGE.
+
+    Returns:
+        List[str]: Keys of the removed entries, or their hashed names for
+            entries created before the index existed.
+    """
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    max_age = MAX_CACHE_AGE if max_age is None else max_age
+    with _updating_index() as index:
+        return _evict(index, max_bytes, max_age)
+
+
+def cache_usage() -> CacheUsage:
+    """Report the number and total size of entries in the cache directory.
+
+    Returns:
+        CacheUsage: Usage of the cache directory and its configured bounds.
+    """
+    index = _read_index()
+    return CacheUsage(
+        entries=len(index),
+        total_bytes=sum(entry['size'] for entry in index.values()),
+        max_bytes=MAX_CACHE_BYTES,
+        max_age=MAX_CACHE_AGE
+    )
+
+
+def remove_from_cache(key: str) -> None:
+    """Remove an entry from the memory tier and the cache directory.
+
+    Args:
+        key (str): The key for the cache entry.
+
+    Returns:
+        None
+    """
+    memory_cache.invalidate(key)
+    for extension in ENTRY_EXTENSIONS:
+        _remove_file(cache_filename(key, extension))
+    with _updating_index() as index:
+        index.pop(_hashed_key(key), None)
+
+
+def _discard_corrupt_entry(
+    key: str,
+    filename: str,
+    stat: os.stat_result
+) -> None:
+    """Remove an entry file that failed to load, unless another process has
+    replaced it since it was read."""
+    name = _hashed_key(key)
+    with _updating_index() as index:
+        try:
+            current = os.stat(filename)
+        except FileNotFoundError:
+            index.pop(name, None)
+            return
+        if (current.st_ino, current.st_size, current.st_mtime_ns) != \
+                (stat.st_ino, stat.st_size, stat.st_mtime_ns):
+            return
+        _remove_file(filename)
+        index.pop(name, None)
+
+
+def clear_memory_cache() -> None:
+    """Drop every entry held by the in-process memory tier.
+
+    Returns:
+        None
+    """
+    memory_cache.clear()
+
+
+def _slice(data: Any, start: Optional[str], end: Optional[str]) -> Any:
+    """Restrict pandas data to the [start, end] date range if given."""
+    if (start is not None or end is not None) and \
+            isinstance(data, (pd.Series, pd.DataFrame)):
+        return data.loc[start:end]
+    return data
+
+
+def _entry_writer(
+    data: Any,
+    codec: Optional[str] = None
+) -> Tuple[str, Callable[[str], None]]:
+    """Choose the entry format of data according to SERIES_FORMAT.
+
+    Args:
+        data: The data to be cached.
+        codec (str, optional): Compression codec of pickled entries.
+
+    Returns:
+        Tuple[str, Callable[[str], None]]: The file extension of the format
+            and a function writing data to a given path.
+    """
+    if SERIES_FORMAT == 'mmap' and is_mappable_series(data):
+        return MMAP_EXTENSION, lambda path: write_mapped_series(path, data)
+    if SERIES_FORMAT == 'parquet' and PYARROW_AVAILABLE and \
+            is_storable_series(data):
+        return SERIES_EXTENSION, lambda path: write_series(path, data)
+    return PICKLE_EXTENSION, lambda path: _write_pickle(path, data, codec)
 
 
-def save_to_cache(key: str, data: Any) -> None:
+def _read_entry(
+    filename: str,
+    extension: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> Any:
+    """Read a cache entry file in the format given by its extension."""
+    if extension == SERIES_EXTENSION:
+        return read_series(filename, start, end)
+    if extension == MMAP_EXTENSION:
+        return read_mapped_series(filename, start, end)
+    with open(filename, 'rb') as f:
+        payload = f.read()
+    payload = cache_integrity.unseal(payload)
+    return _slice(pickle.loads(payload), start, end)
+
+
+def save_to_cache(key: str, data: Any, codec: Optional[str] = None) -> None:
     """Save data to the cache.
 
+    Time series are written in SERIES_FORMAT when they fit it; all other data
+    is pickled and compressed with the given codec. Entries are decompressed
+    transparently on load, whatever codec wrote them. Files are written
+    atomically and replace an entry stored in any other format. Any copy of
+    the entry held by the memory tier is dropped, so the next load reads the
+    new file and picks up its modification time. The entry is recorded in
+    the cache index, and entries beyond MAX_CACHE_AGE or MAX_CACHE_BYTES are
+    evicted.
+
     Args:
         key (str): The key for the cache entry.
         data: The data to be cached.
+        codec (str, optional): Compression codec of pickled entries, one of
+            'none', 'zlib', 'lzma' or 'bz2'. Defaults to the
+            PYECONOMICS_CACHE_CODEC environment variable, or 'none' if unset.
 
     Returns:
         None
     """
-    filename = cache_filename(key)
-    with open(filename, 'wb') as f:
-        pickle.dump(data, f)
+    with cache_stats.timed('save'):
+        memory_cache.invalidate(key)
+        extension, write = _entry_writer(data, codec)
+        filename = cache_filename(key, extension)
+        _atomic_write(filename, write)
+        for other in ENTRY_EXTENSIONS:
+            if other != extension:
+                _remove_file(cache_filename(key, other))
 
+        name = _hashed_key(key)
+        stat = os.stat(filename)
+        cache_stats.record_write(stat.st_size)
+        with _updating_index() as index:
+            index[name] = {
+                'key': key,
+                'extension': extension,
+                'size': stat.st_size,
+                'saved_at': stat.st_mtime,
+                'accessed_at': stat.st_mtime,
+            }
+            _evict(index, MAX_CACHE_BYTES, MAX_CACHE_AGE, keep=name)
 
-def load_from_cache(key: str, expiry: timedelta = timedelta(days=1)):
+
+def load_from_cache(
+    key: str,
+    expiry: Expiry = timedelta(days=1),
+    start: Optional[str] = None,
+    end: Optional[str] = None
+):
     """Load data from the cache if available and not expired.
 
+    Entries are served from the memory tier when possible. Full loads from
+    disk populate the memory tier with the file's modification time, so an
+    entry expires from both tiers at the same moment. An entry that fails its
+    checksum or cannot be decoded is deleted and reported as a miss, so the
+    caller fetches and saves it again.
+
     Args:
         key (str): The key for the cache entry.
-        expiry (timedelta): The expiration time for the cache entry.
+        expiry (Expiry): The expiration time for the cache entry, either a
+            maximum age or a release cutoff rule.
+        start (str, optional): First observation date to load for time series
+            entries. Only the requested rows are read from columnar and
+            memory-mapped entries.
+        end (str, optional): Last observation date to load for time series
+            entries.
 
     Returns:
         The cached data if available and not expired, otherwise None.
     """
-    filename = cache_filename(key)
-    if os.path.exists(filename):
-        file_mtime = datetime.fromtimestamp(os.path.getmtime(filename))
-        if datetime.now() - file_mtime < expiry:
-            with open(filename, 'rb') as f:
-                return pickle.load(f)
-    return None
+    with cache_stats.timed('load'):
+        data = memory_cache.get(key, expiry)
+        if data is not None:
+            _record_access(key)
+            cache_stats.record_hit(memory=True)
+            return _slice(data, start, end)
+
+        for extension in ENTRY_EXTENSIONS:
+            if extension == SERIES_EXTENSION and not PYARROW_AVAILABLE:
+                continue
+            filename = cache_filename(key, extension)
+            try:
+                stat = os.stat(filename)
+            except FileNotFoundError:
+                continue
+            if is_expired(expiry, stat.st_mtime):
+                cache_stats.record_miss(expired=True)
+                return None
+            try:
+                data = _read_entry(filename, extension, start, end)
+            except FileNotFoundError:
+                # Replaced by another format since it was listed
+                continue
+            except Exception as e:
+                logging.warning(
+                    f"Discarding corrupt cache entry for {key}: {e}")
+                _discard_corrupt_entry(key, filename, stat)
+                cache_stats.record_miss(corrupt=True)
+                return None
+            if start is None and end is None:
+                memory_cache.put(key, data, stat.st_mtime)
+            _record_access(key)
+            cache_stats.record_hit(stat.st_size)
+            return data
+        cache_stats.record_miss()
+        return None
@@ -0,0 +1,151 @@
+# pyeconomics/api/cache_stats.py
+
+import copy
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Iterator, List, Tuple
+
+# Upper bounds in seconds of the latency histogram buckets; the last bucket
+# collects everything slower
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float('inf')
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Histogram of operation latencies.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Upper bounds of the buckets in seconds.
+        counts (List[int]): Number of operations per bucket.
+        total_seconds (float): Sum of all observed latencies.
+    """
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    counts: List[int] = field(
+        default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    total_seconds: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observed operations."""
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds, or 0.0 if nothing was observed."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add one latency in seconds to the histogram."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total_seconds += seconds
+
+
+@dataclass
+class CacheInfo:
+    """
+    Cache effectiveness counters, aggregated over every cache backend in the
+    process.
+
+    Attributes:
+        hits (int): Loads answered from the cache.
+        memory_hits (int): Hits answered by the in-process memory tier
+            without reading storage.
+        misses (int): Loads finding no usable entry, including expirations
+            and corrupt entries.
+        expirations (int): Misses caused by an entry older than its expiry.
+        corruptions (int): Misses caused by an entry failing its integrity
+            checks; the entry is discarded and fetched again.
+        bytes_read (int): Bytes of cache entries read from storage.
+        bytes_written (int): Bytes of cache entries written to storage.
+        load_latency (LatencyHistogram): Latency of cache loads.
+        save_latency (LatencyHistogram): Latency of cache saves.
+    """
+    hits: int = 0
+    memory_hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    corruptions: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    load_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    save_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of loads answered from the cache, or 0.0 without loads."""
+        loads = self.hits + self.misses
+        return self.hits / loads if loads else 0.0
+
+
+_info = CacheInfo()
+_lock = Lock()
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return a snapshot of the cache statistics of this process.
+
+    Returns:
+        CacheInfo: Copy of the counters, unaffected by later cache use.
+    """
+    with _lock:
+        return copy.deepcopy(_info)
+
+
+def reset_cache_info() -> None:
+    """
+    Reset every cache statistic to zero.
+
+    Returns:
+        None
+    """
+    global _info
+    with _lock:
+        _info = CacheInfo()
+
+
+def record_hit(nbytes: int = 0, memory: bool = False) -> None:
+    """Count a cache hit that read nbytes from storage."""
+    with _lock:
+        _info.hits += 1
+        _info.bytes_read += nbytes
+        if memory:
+            _info.memory_hits += 1
+
+
+def record_miss(expired: bool = False, corrupt: bool = False) -> None:
+    """Count a cache miss, caused by an expired entry if expired is True or
+    by a corrupt entry if corrupt is True."""
+    with _lock:
+        _info.misses += 1
+        if expired:
+            _info.expirations += 1
+        if corrupt:
+            _info.corruptions += 1
+
+
+def record_write(nbytes: int) -> None:
+    """Count nbytes written to cache storage."""
+    with _lock:
+        _info.bytes_written += nbytes
+
+
+@contextmanager
+def timed(operation: str) -> Iterator[None]:
+    """
+    Record the duration of the enclosed block in the latency histogram of
+    operation, 'load' or 'save'.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        with _lock:
+            getattr(_info, f'{operation}_latency').observe(elapsed)
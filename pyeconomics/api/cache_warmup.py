@@ -0,0 +1,140 @@
+# pyeconomics/api/cache_warmup.py
+
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from pyeconomics.api.fred_api import FredClient, fred_client
+from pyeconomics.api.fred_data import FED_FUNDS_RATE_SERIES_IDS
+from pyeconomics.api.rate_limiter import PRIORITY_BULK, request_priority
+from pyeconomics.data.economic_indicators import EconomicIndicators
+
+# Default number of series downloaded at the same time
+DEFAULT_MAX_WORKERS = 8
+
+
+def required_series(
+    indicators: EconomicIndicators = EconomicIndicators()
+) -> List[str]:
+    """
+    List the FRED series needed by calculate_policy_rule_estimates and
+    calculate_historical_policy_rates for the given indicators.
+
+    Args:
+        indicators (EconomicIndicators): Instance containing the series IDs
+            of the economic indicators.
+
+    Returns:
+        List[str]: Unique series IDs in a stable order.
+    """
+    series_ids = [
+        indicators.inflation_series_id,
+        indicators.unemployment_rate_series_id,
+        indicators.natural_unemployment_series_id,
+        indicators.real_interest_rate_series_id,
+        *FED_FUNDS_RATE_SERIES_IDS,
+    ]
+    return list(dict.fromkeys(series_ids))
+
+
+def prefetch(
+    series_ids: Optional[Iterable[str]] = None,
+    indicators: EconomicIndicators = EconomicIndicators(),
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    client: Optional[FredClient] = None
+) -> Dict[str, Optional[Exception]]:
+    """
+    Fill the cache with the given series, downloading them concurrently.
+    Series already cached and not expired are not downloaded again, and
+    downloads are queued behind interactive requests by the client's rate
+    limiter.
+
+    Args:
+        series_ids (Iterable[str], optional): FRED series IDs to prefetch.
+            Defaults to the series required by the monetary policy rules
+            for indicators.
+        indicators (EconomicIndicators): Indicators whose series are
+            prefetched when series_ids is None.
+        max_workers (int): Maximum number of concurrent downloads. Defaults
+            to 8.
+        client (FredClient, optional): Client used to fetch the series.
+            Defaults to the global fred_client.
+
+    Returns:
+        Dict[str, Optional[Exception]]: The error raised for each series, or
+            None if it was cached successfully.
+    """
+    client = client or fred_client
+    series_ids = list(dict.fromkeys(
+        required_series(indicators) if series_ids is None else series_ids))
+
+    def fetch(series_id: str) -> Optional[Exception]:
+        try:
+            # Yield to interactive requests when the rate limit is reached
+            with request_priority(PRIORITY_BULK):
+                client.fetch_data(series_id)
+        except Exception as e:
+            logging.error(f"Prefetching {series_id} failed: {e}")
+            return e
+        return None
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(series_ids) or 1))
+    ) as executor:
+        results = dict(zip(series_ids, executor.map(fetch, series_ids)))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Console entry point warming up the cache before traffic arrives.
+
+    Args:
+        argv (List[str], optional): Command line arguments. Defaults to
+            sys.argv.
+
+    Returns:
+        int: Exit status, 1 if any series failed to download.
+    """
+    parser = argparse.ArgumentParser(
+        prog='pyeconomics-prefetch',
+        description='Download the FRED series used by the monetary policy '
+                    'rules into the cache.')
+    parser.add_argument(
+        'series_ids', nargs='*', metavar='SERIES_ID',
+        help='FRED series IDs to prefetch in addition to those required by '
+             'the rules.')
+    defaults = EconomicIndicators()
+    parser.add_argument(
+        '--inflation-series-id', default=defaults.inflation_series_id)
+    parser.add_argument(
+        '--unemployment-rate-series-id',
+        default=defaults.unemployment_rate_series_id)
+    parser.add_argument(
+        '--natural-unemployment-series-id',
+        default=defaults.natural_unemployment_series_id)
+    parser.add_argument(
+        '--real-interest-rate-series-id',
+        default=defaults.real_interest_rate_series_id)
+    parser.add_argument(
+        '--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+        help='Maximum number of concurrent downloads.')
+    args = parser.parse_args(argv)
+
+    indicators = EconomicIndicators(
+        inflation_series_id=args.inflation_series_id,
+        unemployment_rate_series_id=args.unemployment_rate_series_id,
+        natural_unemployment_series_id=args.natural_unemployment_series_id,
+        real_interest_rate_series_id=args.real_interest_rate_series_id,
+    )
+    results = prefetch(
+        required_series(indicators) + args.series_ids,
+        max_workers=args.max_workers)
+    for series_id, error in results.items():
+        print(f"{series_id:<24} {'failed: ' + str(error) if error else 'ok'}")
+    return 1 if any(results.values()) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+# pyeconomics/api/data_source.py
+
+import datetime
+from typing import Optional
+
+import pandas as pd
+
+
+class DataSource:
+    """
+    Abstract base class for all data source clients.
+
+    Attributes:
+        api_key (Optional[str]): API key for accessing the data source.
+    """
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key
+
+    def fetch_data(self, series_id: str) -> pd.Series:
+        """
+        Abstract method to fetch data from a data source given a series ID.
+
+        Args:
+            series_id (str): The identifier for the data series.
+
+        Returns:
+            pandas.Series: Series containing the requested data.
+
+        Raises:
+            NotImplementedError: If method is not implemented.
+        """
+        raise NotImplementedError(
+            "This method should be overridden by subclasses."
+        )
+
+    def get_latest_value(self, series_id: str) -> Optional[float]:
+        """
+        Fetches the latest value of a series, considering only dates up to
+        today.
+
+        Args:
+            series_id (str): The identifier for the data series.
+
+        Returns:
+            Optional[float]: Most recent data point up to today, or None if no
+                data.
+        """
+        data = self.fetch_data(series_id)
+        filtered_data = data[:str(datetime.date.today())]
+        return filtered_data.iloc[-1] if not filtered_data.empty else None
+
+    def get_historical_value(
+        self,
+        series_id: str,
+        periods: int = -1
+    ) -> Optional[float]:
+        """
+        Fetches a historical value of a series.
+
+        Args:
+            series_id (str): The identifier for the data series.
+            periods (int): Index of period to retrieve (negative for
+                historical).
+
+        Returns:
+            Optional[float]: Historical data point value, or None if
+                unavailable.
+        """
+        series = self.fetch_data(series_id)
+        return series.iloc[periods] \
+            if not series.empty and len(series) > -periods else None
@@ -0,0 +1,112 @@
+# pyeconomics/api/file_lock.py
+
+import os
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class FileLock:
+    """
+    Advisory exclusive lock on a lock file, shared between processes.
+
+    Each FileLock opens its own file descriptor, so separate instances also
+    exclude each other between threads of the same process.
+
+    Attributes:
+        path (str): Path of the lock file. Created if it does not exist.
+        poll_interval (float): Seconds between attempts while waiting for a
+            lock with a timeout.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.01):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    @property
+    def is_locked(self) -> bool:
+        """bool: Whether this instance currently holds the lock."""
+        return self._fd is not None
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the lock, waiting up to timeout seconds.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait.
+                Waits indefinitely if None.
+
+        Returns:
+            bool: True if the lock was acquired, False on timeout.
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"Lock {self.path} is already held.")
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            if fcntl is not None and deadline is None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                while not self._try_lock(fd):
+                    if deadline is not None and time.monotonic() >= deadline:
+                        os.close(fd)
+                        return False
+                    time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """
+        Release the lock.
+
+        Returns:
+            None
+        """
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        """Attempt to take the lock without blocking."""
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+        if msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            except OSError:
+                return False
+        return True
@@ -1,13 +1,34 @@
 import os
+import time
+import inspect
 import logging
 import datetime
-from threading import Lock
-from typing import Optional, Any
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
-from fredapi import Fred
 
-from pyeconomics.api.cache_manager import save_to_cache, load_from_cache
+from pyeconomics.api.cache_backends import CacheBackend, get_cache_backend
+from pyeconomics.api.cache_expiry import (
+    CacheExpiryPolicy, Expiry, SERIES_FREQUENCIES, infer_frequency,
+    with_grace
+)
+from pyeconomics.api.data_source import DataSource
+from pyeconomics.api.fred_transport import FredSession, FredTransport
+from pyeconomics.api.local_data_source import LocalFileDataSource
+from pyeconomics.api.rate_limiter import (
+    PRIORITY_INTERACTIVE, RateLimiter, current_priority, default_rate_limiter,
+    request_priority
+)
+from pyeconomics.api.retry import (
+    CircuitBreaker, CircuitOpenError, RetryPolicy, is_retryable
+)
+from pyeconomics.api.series_info import METADATA_EXPIRY, SeriesInfo
+from pyeconomics.api.series_summary import SeriesSummary
+from pyeconomics.api.single_flight import SingleFlight
+from pyeconomics.api.vintage_store import DateLike, VintageHistory
 
 try:
     import keyring
@@ -17,33 +38,37 @@ except ImportError:
     KEYRING_AVAILABLE = False
 
 
-class DataSource:
+def resolve_api_key(api_key: Optional[str] = None) -> str:
     """
-    Abstract base class for all data source clients.
+    Resolves the FRED API key from the argument, the FRED_API_KEY
+    environment variable or the keyring, in that order.
 
-    Attributes:
-        api_key (Optional[str]): API key for accessing the data source.
-    """
-
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
+    Args:
+        api_key (Optional[str]): Explicit FRED API key.
 
-    def fetch_data(self, series_id: str) -> pd.Series:
-        """
-        Abstract method to fetch data from a data source given a series ID.
-
-        Args:
-            series_id (str): The identifier for the data series.
-
-        Returns:
-            pandas.Series: Series containing the requested data.
+    Returns:
+        str: The API key.
 
-        Raises:
-            NotImplementedError: If method is not implemented.
-        """
-        raise NotImplementedError(
-            "This method should be overridden by subclasses."
-        )
+    Raises:
+        ValueError: If no API key is found.
+    """
+    api_key_retrieved = api_key or os.getenv('FRED_API_KEY')
+    logging.debug(f"API key from environment variable: "
+                  f"{api_key_retrieved}")
+    if not api_key_retrieved and KEYRING_AVAILABLE:
+        logging.debug("Attempting to retrieve API key from keyring")
+        try:
+            api_key_retrieved = keyring.get_password("fred", "api_key")
+            logging.debug(f"API key from keyring: {api_key_retrieved}")
+        except Exception as e:
+            logging.debug(f"Keyring not available: {e}")
+    if not api_key_retrieved:
+        logging.debug("API Key not found, raising ValueError.")
+        raise ValueError(
+            "API Key for FRED must be provided "
+            "or retrievable from keyring.")
+    logging.debug(f"Using API Key: {api_key_retrieved}")
+    return api_key_retrieved
 
 
 class FredClient(DataSource):
@@ -51,47 +76,192 @@ class FredClient(DataSource):
     A client for fetching data from the FRED API.
 
     Inherits from DataSource and implements methods to fetch data from FRED.
+
+    Attributes:
+        incremental_refresh (bool): Whether expired cache entries are
+            refreshed by downloading only recent observations instead of the
+            full history.
+        revision_window (int): Number of trailing cached observations that
+            are downloaded again on an incremental refresh to pick up
+            revisions.
+        expiry_policy (CacheExpiryPolicy): Cache expiry by series frequency
+            with per-series overrides.
+        series_frequencies (Dict[str, str]): Known FRED frequency codes by
+            series ID, extended as series are loaded.
+        cache (CacheBackend): Storage tier caching downloaded series.
+        stale_while_revalidate (bool): Whether an expired cache entry is
+            returned immediately while a background thread refreshes it.
+        max_staleness (datetime.timedelta): How long past its expiry an
+            entry is returned in stale-while-revalidate mode or while FRED
+            is unavailable; older entries are downloaded in the foreground.
+        rate_limiter (RateLimiter): Token bucket every FRED request waits
+            on, keeping the client under the API key's request quota.
+        retry_policy (RetryPolicy): Backoff schedule for requests failing
+            with timeouts, connection errors, throttling or server errors.
+        circuit_breaker (CircuitBreaker): Breaker failing requests at once
+            while FRED keeps failing.
+        stale_if_error (bool): Whether an expired cache entry is returned
+            when FRED is unavailable.
+        metadata_expiry (datetime.timedelta): How long cached series
+            metadata is used before it is fetched again.
+        local_source (Optional[LocalFileDataSource]): Directory serving
+            every request instead of FRED in offline mode, or None.
+        recorder (Optional[LocalFileDataSource]): Directory receiving every
+            series and metadata record the client returns, or None.
+
+    Concurrent cache misses for the same series within the process share
+    one download, and every caller receives its result or its error. When
+    the rate limit is reached, requests made by get_latest_value,
+    get_historical_value and get_series_name are served before queued bulk
+    downloads.
     """
     _instance: Optional['FredClient'] = None
     _lock: Lock = Lock()
 
-    def __new__(cls, api_key: Optional[str] = None) -> 'FredClient':
+    def __new__(
+        cls,
+        api_key: Optional[str] = None,
+        incremental_refresh: bool = False,
+        revision_window: int = 12,
+        cache_expiry: Optional[Dict[str, Expiry]] = None,
+        cache_backend: Union[str, CacheBackend, None] = None,
+        stale_while_revalidate: bool = False,
+        max_staleness: datetime.timedelta = datetime.timedelta(days=7),
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        stale_if_error: bool = True,
+        transport: Optional[FredTransport] = None,
+        metadata_expiry: datetime.timedelta = METADATA_EXPIRY,
+        data_dir: Optional[str] = None,
+        record_dir: Optional[str] = None
+    ) -> 'FredClient':
         """
         Ensures a single instance of FredClient using a thread-safe singleton
-        pattern.
+        pattern. The options of the first call configure the instance; later
+        calls return it unchanged and warn if they pass different options.
 
         Args:
             api_key (Optional[str]): The FRED API key, retrieved from
                 keyring if None.
+            incremental_refresh (bool): Whether to refresh expired cache
+                entries incrementally. Defaults to False.
+            revision_window (int): Number of trailing observations downloaded
+                again on an incremental refresh. Defaults to 12.
+            cache_expiry (Optional[Dict[str, Expiry]]): Per-series cache
+                expiry overriding the frequency-based default, e.g.
+                {'NROU': timedelta(days=30)}.
+            cache_backend (Union[str, CacheBackend, None]): Cache backend
+                instance or name ('filesystem', 'memory' or 'sqlite').
+                Defaults to the PYECONOMICS_CACHE_BACKEND environment
+                variable, or 'filesystem' if unset.
+            stale_while_revalidate (bool): Whether to return expired cache
+                entries immediately and refresh them in the background.
+                Defaults to False.
+            max_staleness (datetime.timedelta): How long past its expiry an
+                entry is returned in stale-while-revalidate mode or while
+                FRED is unavailable. Defaults to 7 days.
+            rate_limiter (Optional[RateLimiter]): Limiter for FRED requests.
+                Defaults to 120 requests per minute, shared between
+                processes through the PYECONOMICS_RATE_LIMIT_FILE
+                environment variable's file if set.
+            retry_policy (Optional[RetryPolicy]): Retry schedule for
+                transient failures. Defaults to RetryPolicy().
+            circuit_breaker (Optional[CircuitBreaker]): Breaker shared by
+                all requests. Defaults to CircuitBreaker().
+            stale_if_error (bool): Whether to return an entry expired for
+                less than max_staleness when FRED is unavailable after
+                retries. Defaults to True.
+            transport (Optional[FredTransport]): Transport sending FRED
+                requests. Defaults to a PooledTransport reusing keep-alive
+                connections.
+            metadata_expiry (datetime.timedelta): Cache expiry of series
+                metadata. Defaults to 1 day.
+            data_dir (Optional[str]): Directory of series files to serve
+                offline instead of FRED; no API key is needed. Defaults to
+                the PYECONOMICS_DATA_DIR environment variable, or online
+                mode if unset.
+            record_dir (Optional[str]): Directory to record fetched series
+                and metadata to, for later offline use. Defaults to the
+                PYECONOMICS_RECORD_DIR environment variable, or no recording
+                if unset.
 
         Returns:
             FredClient: Singleton instance.
+
+        Warns:
+            RuntimeWarning: If the instance already exists and options
+                differing from its configuration are passed.
         """
+        options = {name: value for name, value in locals().items()
+                   if name != 'cls'}
         with cls._lock:
-            if cls._instance is None:
+            if cls._instance is not None:
+                cls._instance._warn_ignored_options(options)
+            else:
                 logging.debug("Creating new FredClient instance")
-                cls._instance = object.__new__(cls)
-                api_key_retrieved = api_key or os.getenv('FRED_API_KEY')
-                logging.debug(f"API key from environment variable: "
-                              f"{api_key_retrieved}")
-                if not api_key_retrieved and KEYRING_AVAILABLE:
-                    logging.debug("Attempting to retrieve API key from keyring")
-                    try:
-                        api_key_retrieved = keyring.get_password(
-                            "fred", "api_key")
-                        logging.debug(f"API key from keyring: "
-                                      f"{api_key_retrieved}")
-                    except Exception as e:
-                        logging.debug(f"Keyring not available: {e}")
-                if not api_key_retrieved:
-                    logging.debug("API Key not found, raising ValueError.")
-                    raise ValueError(
-                        "API Key for FRED must be provided "
-                        "or retrievable from keyring.")
-                logging.debug(f"Using API Key: {api_key_retrieved}")
-                cls._instance.client = Fred(api_key=api_key_retrieved)
+                # Configure the instance before publishing it, so callers
+                # reading _instance without the lock never see it half-built
+                # and a failed creation, e.g. without an API key, leaves
+                # nothing behind
+                instance = object.__new__(cls)
+                data_dir = data_dir or os.getenv('PYECONOMICS_DATA_DIR')
+                record_dir = record_dir or os.getenv('PYECONOMICS_RECORD_DIR')
+                instance.local_source = \
+                    LocalFileDataSource(data_dir) if data_dir else None
+                instance.recorder = \
+                    LocalFileDataSource(record_dir) if record_dir else None
+                instance.api_key = \
+                    None if data_dir else resolve_api_key(api_key)
+                instance.client = None if data_dir else FredSession(
+                    api_key=instance.api_key, transport=transport)
+                instance.incremental_refresh = incremental_refresh
+                instance.revision_window = revision_window
+                instance.expiry_policy = CacheExpiryPolicy(
+                    overrides=dict(cache_expiry or {}))
+                instance.series_frequencies = dict(SERIES_FREQUENCIES)
+                instance.cache = get_cache_backend(cache_backend)
+                instance.stale_while_revalidate = stale_while_revalidate
+                instance.max_staleness = max_staleness
+                instance._refreshes = {}
+                instance._refreshes_lock = Lock()
+                instance._flights = SingleFlight()
+                instance.rate_limiter = rate_limiter or default_rate_limiter()
+                instance.retry_policy = retry_policy or RetryPolicy()
+                instance.circuit_breaker = circuit_breaker or CircuitBreaker()
+                instance.stale_if_error = stale_if_error
+                instance.metadata_expiry = metadata_expiry
+                instance._options = _explicit_options(options)
+                cls._instance = instance
             return cls._instance
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        The singleton is configured once in __new__; later calls with other
+        arguments return it unchanged.
+        """
+
+    def _warn_ignored_options(self, options: Dict[str, Any]) -> None:
+        """
+        Warns about options that differ from those the instance was created
+        with, since the existing instance is returned unchanged.
+
+        Args:
+            options (Dict[str, Any]): Arguments of the constructor call.
+        """
+        configured = getattr(self, '_options', {})
+        ignored = [
+            name for name, value in _explicit_options(options).items()
+            if not _same_option(
+                value, configured.get(name, _OPTION_DEFAULTS[name]))
+        ]
+        if ignored:
+            warnings.warn(
+                f"FredClient already exists; ignoring {', '.join(ignored)}. "
+                f"Construct it with these options before first use, or call "
+                f"FredClient.reset_instance() first.",
+                RuntimeWarning, stacklevel=3)
+
     @classmethod
     def reset_instance(cls) -> None:
         """
@@ -101,9 +271,28 @@ class FredClient(DataSource):
             cls._instance = None
             logging.debug("FredClient instance reset")
 
+    def get_cache_expiry(self, series_id: str) -> Expiry:
+        """
+        Returns the cache expiry of a series from its override or frequency.
+
+        Args:
+            series_id (str): FRED series ID.
+
+        Returns:
+            Expiry: Maximum age of the cache entry or a release cutoff rule.
+        """
+        return self.expiry_policy.expiry_for(
+            series_id, self.series_frequencies.get(series_id))
+
     def fetch_data(self, series_id: str) -> pd.Series:
         """
-        Fetches data for a given series ID from FRED with caching.
+        Fetches data for a given series ID from FRED with caching. Cache
+        entries expire according to the series' frequency or override. In
+        stale-while-revalidate mode an entry expired for less than
+        max_staleness is returned at once and refreshed in the background.
+        Such an entry is also returned if FRED is unavailable and
+        stale_if_error is set. In offline mode the series is read from
+        local_source.
 
         Args:
             series_id (str): FRED series ID to fetch data for.
@@ -113,30 +302,538 @@ class FredClient(DataSource):
 
         Raises:
             ValueError: If no data is found for series ID.
+            CircuitOpenError: If FRED is unavailable and no stale entry can
+                be returned.
             Exception: For fetch operation errors.
         """
+        if self.local_source is not None:
+            return self.local_source.fetch_data(series_id)
+        data = self._load_series(series_id)
+        self._record_series(series_id, data)
+        return data
+
+    def _load_series(self, series_id: str) -> pd.Series:
+        """
+        Loads a series from the cache or FRED as described in fetch_data.
+
+        Args:
+            series_id (str): FRED series ID to fetch data for.
+
+        Returns:
+            pandas.Series: Series containing the requested data.
+        """
         cache_key = f"fred_series_{series_id}"
-        data = load_from_cache(cache_key)
+        data = self.cache.get(cache_key, self.get_cache_expiry(series_id))
 
         if data is not None:
             logging.info(f"Data for {series_id} loaded from cache.")
+            self._learn_frequency(series_id, data)
             return data
 
+        if self.stale_while_revalidate:
+            data = self.cache.get(cache_key, self._stale_expiry(series_id))
+            if data is not None:
+                logging.info(f"Stale data for {series_id} loaded from cache, "
+                             f"refreshing in the background.")
+                self._start_refresh(series_id, cache_key)
+                return data
+
         try:
-            data = self.client.get_series(series_id)
-            if data.empty:
-                raise ValueError(f"No data found for series ID {series_id}")
-            save_to_cache(cache_key, data)
-            logging.info(f"Data for {series_id} fetched and cached.")
+            return self._fetch_and_cache(series_id, cache_key)
+        except Exception as e:
+            if not self.stale_if_error or not (
+                    isinstance(e, CircuitOpenError) or is_retryable(e)):
+                raise
+            data = self.cache.get(cache_key, self._stale_expiry(series_id))
+            if data is None:
+                raise
+            logging.warning(f"FRED unavailable, stale data for {series_id} "
+                            f"loaded from cache: {e}")
             return data
+
+    def fetch_many(
+        self,
+        series_ids: Iterable[str],
+        max_workers: int = 8,
+        as_frame: bool = False
+    ) -> Union[Dict[str, pd.Series], pd.DataFrame]:
+        """
+        Fetches several series, resolving cache hits first and downloading
+        the misses in parallel.
+
+        Args:
+            series_ids (Iterable[str]): FRED series IDs to fetch.
+            max_workers (int): Maximum number of concurrent downloads.
+                Defaults to 8.
+            as_frame (bool): Whether to return a DataFrame with one column
+                per series, aligned on the union of their dates. Defaults to
+                False.
+
+        Returns:
+            Union[Dict[str, pd.Series], pd.DataFrame]: Series by ID in the
+                order requested, or the aligned DataFrame.
+
+        Raises:
+            ValueError: If no data is found for one of the series.
+            Exception: For fetch operation errors.
+        """
+        if self.local_source is not None:
+            return self.local_source.fetch_many(series_ids, as_frame)
+        series_ids = list(dict.fromkeys(series_ids))
+
+        # One batched lookup per distinct expiry
+        by_expiry: Dict[Expiry, list] = {}
+        for series_id in series_ids:
+            by_expiry.setdefault(
+                self.get_cache_expiry(series_id), []).append(series_id)
+        results: Dict[str, pd.Series] = {}
+        for expiry, ids in by_expiry.items():
+            cached = self.cache.get_many(
+                [f"fred_series_{series_id}" for series_id in ids], expiry)
+            for series_id in ids:
+                data = cached.get(f"fred_series_{series_id}")
+                if data is not None:
+                    logging.info(f"Data for {series_id} loaded from cache.")
+                    self._learn_frequency(series_id, data)
+                    self._record_series(series_id, data)
+                    results[series_id] = data
+
+        misses = [s for s in series_ids if s not in results]
+        if misses:
+            results.update(zip(misses, self._map_concurrently(
+                self.fetch_data, misses, max_workers)))
+
+        results = {series_id: results[series_id] for series_id in series_ids}
+        return pd.DataFrame(results) if as_frame else results
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        """
+        Blocks until the background refreshes started so far have finished.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait for
+                each refresh. Waits indefinitely if None.
+        """
+        with self._refreshes_lock:
+            threads = list(self._refreshes.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def _fetch_and_cache(self, series_id: str, cache_key: str) -> pd.Series:
+        """
+        Downloads a series and saves it to the cache unless another client
+        cached a fresh copy while this one waited for the lock. Threads
+        missing the same series while a download is in flight wait for it
+        instead of starting their own.
+
+        Args:
+            series_id (str): FRED series ID to fetch data for.
+            cache_key (str): Cache key of the series.
+
+        Returns:
+            pandas.Series: Series containing the requested data.
+
+        Raises:
+            ValueError: If no data is found for series ID.
+            Exception: For fetch operation errors.
+        """
+        return self._flights.do(
+            cache_key, self._fetch_and_cache_locked, series_id, cache_key)
+
+    def _fetch_and_cache_locked(
+        self,
+        series_id: str,
+        cache_key: str
+    ) -> pd.Series:
+        """
+        Downloads and caches a series while holding its cache lock.
+
+        Args:
+            series_id (str): FRED series ID to fetch data for.
+            cache_key (str): Cache key of the series.
+
+        Returns:
+            pandas.Series: Series containing the requested data.
+        """
+        # Only one process fetches a given series at a time; the others wait
+        # and then find it in the cache.
+        with self.cache.lock(cache_key):
+            data = self.cache.get(cache_key, self.get_cache_expiry(series_id))
+            if data is not None:
+                logging.info(f"Data for {series_id} loaded from cache.")
+                self._learn_frequency(series_id, data)
+                return data
+
+            try:
+                data = self._download_series(series_id, cache_key)
+                if data.empty:
+                    raise ValueError(
+                        f"No data found for series ID {series_id}")
+                self.cache.put(cache_key, data)
+                self.cache.put(f"fred_summary_{series_id}",
+                               SeriesSummary.from_series(data))
+                logging.info(f"Data for {series_id} fetched and cached.")
+                self._learn_frequency(series_id, data)
+                return data
+            except Exception as e:
+                logging.error(f"Fetching error for {series_id}: {e}")
+                raise
+
+    def _start_refresh(self, series_id: str, cache_key: str) -> None:
+        """
+        Starts a background refresh of a series unless one is running.
+
+        Args:
+            series_id (str): FRED series ID to refresh.
+            cache_key (str): Cache key of the series.
+        """
+        with self._refreshes_lock:
+            if series_id in self._refreshes:
+                return
+            thread = Thread(
+                target=self._refresh_in_background,
+                args=(series_id, cache_key),
+                name=f"fred-refresh-{series_id}",
+                daemon=True
+            )
+            self._refreshes[series_id] = thread
+        thread.start()
+
+    def _refresh_in_background(self, series_id: str, cache_key: str) -> None:
+        """
+        Refreshes a series on a background thread. Failures are logged and
+        the stale entry is kept, so the next call tries again.
+
+        Args:
+            series_id (str): FRED series ID to refresh.
+            cache_key (str): Cache key of the series.
+        """
+        try:
+            self._fetch_and_cache(series_id, cache_key)
         except Exception as e:
-            logging.error(f"Fetching error for {series_id}: {e}")
-            raise
+            logging.warning(
+                f"Background refresh of {series_id} failed: {e}")
+        finally:
+            with self._refreshes_lock:
+                self._refreshes.pop(series_id, None)
+
+    def _request(self, function: Callable[..., Any], *args: Any,
+                 **kwargs: Any) -> Any:
+        """
+        Calls the FRED API once the rate limiter allows another request.
+        Requests are served in the priority of the calling context.
+        Transient failures are retried with backoff unless the circuit
+        breaker opens.
+
+        Args:
+            function (Callable[..., Any]): Method of the fredapi client.
+            *args (Any): Positional arguments for function.
+            **kwargs (Any): Keyword arguments for function.
+
+        Returns:
+            Any: The result of the call.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            Exception: The error of the last attempt.
+        """
+        attempts = max(self.retry_policy.max_attempts, 1)
+        for attempt in range(1, attempts + 1):
+            self.circuit_breaker.before_call()
+            self.rate_limiter.acquire()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    # FRED answered, so it is up
+                    self.circuit_breaker.record_success()
+                    raise
+                self.circuit_breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                logging.warning(f"FRED request failed ({e}), retrying in "
+                                f"{delay:.1f}s.")
+                time.sleep(delay)
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+    def _fetch_series_info(self, series_id: str, cache_key: str) -> SeriesInfo:
+        """
+        Downloads the metadata of a series and caches it.
+
+        Args:
+            series_id (str): FRED series ID.
+            cache_key (str): Cache key of the metadata.
+
+        Returns:
+            SeriesInfo: Metadata of the series.
+        """
+        info = SeriesInfo.from_fred(
+            series_id, self._request(self.client.get_series_info, series_id))
+        self.cache.put(cache_key, info)
+        logging.info(f"Metadata for {series_id} fetched and cached.")
+        return info
+
+    def _learn_info_frequency(self, info: SeriesInfo) -> None:
+        """
+        Records the frequency reported in a series' metadata.
+
+        Args:
+            info (SeriesInfo): Metadata of the series.
+        """
+        if info.frequency_short and \
+                info.series_id not in self.series_frequencies:
+            self.series_frequencies[info.series_id] = info.frequency_short
+
+    def _map_concurrently(
+        self,
+        function: Callable[[str], Any],
+        series_ids: List[str],
+        max_workers: int
+    ) -> List[Any]:
+        """
+        Calls a function for each series on a thread pool, keeping the
+        request priority of the calling context.
+
+        Args:
+            function (Callable[[str], Any]): Function taking a series ID.
+            series_ids (List[str]): FRED series IDs.
+            max_workers (int): Maximum number of concurrent calls.
+
+        Returns:
+            List[Any]: Results in the order of series_ids.
+        """
+        priority = current_priority()
+
+        def call(series_id: str) -> Any:
+            with request_priority(priority):
+                return function(series_id)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(series_ids)))
+        ) as executor:
+            return list(executor.map(call, series_ids))
+
+    def _load_summary(self, series_id: str) -> Optional[SeriesSummary]:
+        """
+        Loads the summary saved with a series if it has not expired. The
+        summary is skipped while recording or offline, so lookups go through
+        fetch_data.
+
+        Args:
+            series_id (str): FRED series ID.
+
+        Returns:
+            Optional[SeriesSummary]: The summary, or None if not cached.
+        """
+        if self.local_source is not None or self.recorder is not None:
+            return None
+        summary = self.cache.get(
+            f"fred_summary_{series_id}", self.get_cache_expiry(series_id))
+        return summary if isinstance(summary, SeriesSummary) else None
+
+    def _stale_expiry(self, series_id: str) -> Expiry:
+        """
+        Returns how long an entry of a series may be served stale: until
+        max_staleness past its expiry.
+
+        Args:
+            series_id (str): FRED series ID.
+
+        Returns:
+            Expiry: The series' cache expiry extended by max_staleness.
+        """
+        return with_grace(self.get_cache_expiry(series_id), self.max_staleness)
+
+    def _record_series(self, series_id: str, data: pd.Series) -> None:
+        """
+        Writes a series to the recording directory, if recording.
+
+        Args:
+            series_id (str): FRED series ID.
+            data (pandas.Series): Observations of the series.
+        """
+        recorder = self.recorder
+        if recorder is not None:
+            try:
+                recorder.save_series(series_id, data)
+            except Exception as e:
+                logging.warning(f"Recording of {series_id} failed: {e}")
+
+    def _record_info(self, info: SeriesInfo) -> None:
+        """
+        Writes series metadata to the recording directory, if recording.
+
+        Args:
+            info (SeriesInfo): Metadata of the series.
+        """
+        recorder = self.recorder
+        if recorder is not None:
+            try:
+                recorder.save_info(info)
+            except Exception as e:
+                logging.warning(
+                    f"Recording of {info.series_id} metadata failed: {e}")
+
+    def _learn_frequency(self, series_id: str, data: pd.Series) -> None:
+        """
+        Records the frequency of a series not yet known to the client.
+
+        Args:
+            series_id (str): FRED series ID.
+            data (pandas.Series): Observations of the series.
+        """
+        if series_id not in self.series_frequencies:
+            frequency = infer_frequency(data)
+            if frequency is not None:
+                self.series_frequencies[series_id] = frequency
+
+    def _download_series(self, series_id: str, cache_key: str) -> pd.Series:
+        """
+        Downloads a series from FRED, incrementally when enabled and an
+        expired cache entry is available.
+
+        Args:
+            series_id (str): FRED series ID to download.
+            cache_key (str): Cache key of the series.
+
+        Returns:
+            pandas.Series: Series containing the full history.
+        """
+        if self.incremental_refresh:
+            cached = self.cache.get(
+                cache_key, expiry=datetime.timedelta.max)
+            if cached is not None and not cached.empty:
+                return self._refresh_series(series_id, cached)
+        return self._request(self.client.get_series, series_id)
+
+    def _refresh_series(self, series_id: str, cached: pd.Series) -> pd.Series:
+        """
+        Updates a cached series with observations from the start of its
+        trailing revision window onwards.
+
+        Args:
+            series_id (str): FRED series ID to refresh.
+            cached (pandas.Series): Previously cached series.
+
+        Returns:
+            pandas.Series: Cached history with the refreshed window appended.
+        """
+        window = max(self.revision_window, 1)
+        window_start = cached.index[max(len(cached) - window, 0)]
+        update = self._request(
+            self.client.get_series, series_id,
+            observation_start=window_start.strftime('%Y-%m-%d')
+        )
+        if update.empty:
+            return cached
+        logging.info(f"Data for {series_id} refreshed from "
+                     f"{window_start:%Y-%m-%d} ({len(update)} observations).")
+        return pd.concat([cached[cached.index < window_start], update])
+
+    def fetch_vintages(self, series_id: str) -> VintageHistory:
+        """
+        Fetches every vintage of a series from ALFRED with caching. Only the
+        observations released or revised in each vintage are stored. With
+        incremental refresh enabled, an expired history is updated with the
+        vintages published since its latest one.
+
+        Args:
+            series_id (str): FRED series ID to fetch vintages for.
+
+        Returns:
+            VintageHistory: Real-time history of the series.
+
+        Raises:
+            ValueError: If no data is found for series ID, or in offline
+                mode.
+            Exception: For fetch operation errors.
+        """
+        if self.local_source is not None:
+            raise ValueError(
+                f"Vintages of {series_id} are not available offline")
+        cache_key = f"fred_vintages_{series_id}"
+        expiry = self.get_cache_expiry(series_id)
+        history = self.cache.get(cache_key, expiry)
+        if history is not None:
+            logging.info(f"Vintages for {series_id} loaded from cache.")
+            return history
+
+        return self._flights.do(
+            cache_key, self._fetch_and_cache_vintages, series_id, cache_key)
+
+    def _fetch_and_cache_vintages(
+        self,
+        series_id: str,
+        cache_key: str
+    ) -> VintageHistory:
+        """
+        Downloads and caches the vintages of a series while holding its cache
+        lock, unless another client cached them in the meantime.
+
+        Args:
+            series_id (str): FRED series ID to fetch vintages for.
+            cache_key (str): Cache key of the vintage history.
+
+        Returns:
+            VintageHistory: Real-time history of the series.
+        """
+        expiry = self.get_cache_expiry(series_id)
+        with self.cache.lock(cache_key):
+            history = self.cache.get(cache_key, expiry)
+            if history is not None:
+                logging.info(f"Vintages for {series_id} loaded from cache.")
+                return history
+
+            try:
+                cached = self.cache.get(
+                    cache_key, expiry=datetime.timedelta.max) \
+                    if self.incremental_refresh else None
+                if cached is not None and not cached.empty:
+                    latest = cached.vintage_dates[-1]
+                    update = VintageHistory.from_releases(
+                        series_id, self._request(
+                            self.client.get_series_all_releases, series_id,
+                            realtime_start=latest.strftime('%Y-%m-%d')))
+                    history = cached.merge(update)
+                else:
+                    history = VintageHistory.from_releases(
+                        series_id,
+                        self._request(self.client.get_series_all_releases,
+                                      series_id))
+                if history.empty:
+                    raise ValueError(
+                        f"No data found for series ID {series_id}")
+                self.cache.put(cache_key, history)
+                logging.info(f"Vintages for {series_id} fetched and cached.")
+                return history
+            except Exception as e:
+                logging.error(f"Fetching error for {series_id} vintages: {e}")
+                raise
+
+    def get_series_as_of(
+        self,
+        series_id: str,
+        as_of: DateLike
+    ) -> pd.Series:
+        """
+        Fetches a series as it was published on a given date.
+
+        Args:
+            series_id (str): FRED series ID.
+            as_of (DateLike): Vintage date, e.g. '2008-09-15'.
+
+        Returns:
+            pandas.Series: Observations known on as_of.
+        """
+        return self.fetch_vintages(series_id).as_of(as_of)
 
     def get_latest_value(self, series_id: str) -> Optional[float]:
         """
         Fetches the latest value for a FRED series ID, considering only dates
-        up to today.
+        up to today. Answered from the series summary when one is cached.
 
         Args:
             series_id (str): Identifier for the FRED data series.
@@ -146,8 +843,12 @@ class FredClient(DataSource):
                 data.
         """
         try:
-            data = self.fetch_data(series_id)
             today = datetime.date.today()
+            summary = self._load_summary(series_id)
+            if summary is not None and summary.covers_latest(today):
+                return summary.latest_value(today)
+            with request_priority(PRIORITY_INTERACTIVE):
+                data = self.fetch_data(series_id)
             filtered_data = data[:str(today)]
             return filtered_data.iloc[-1] if not filtered_data.empty else None
         except Exception as e:
@@ -160,7 +861,8 @@ class FredClient(DataSource):
         periods: int = -1
     ) -> Optional[float]:
         """
-        Fetches a historical value for a FRED series ID.
+        Fetches a historical value for a FRED series ID. Recent periods are
+        answered from the series summary when one is cached.
 
         Args:
             series_id (str): Identifier for the FRED data series.
@@ -172,7 +874,11 @@ class FredClient(DataSource):
                 unavailable.
         """
         try:
-            series = self.fetch_data(series_id)
+            summary = self._load_summary(series_id)
+            if summary is not None and summary.covers_lag(periods):
+                return summary.historical_value(periods)
+            with request_priority(PRIORITY_INTERACTIVE):
+                series = self.fetch_data(series_id)
             return series.iloc[periods] \
                 if not series.empty and len(series) > -periods else None
         except Exception as e:
@@ -180,6 +886,85 @@ class FredClient(DataSource):
                 f"Error in getting historical value for {series_id}: {e}")
             raise
 
+    def get_series_info(self, series_id: str) -> SeriesInfo:
+        """
+        Fetches the metadata of a FRED series, cached for metadata_expiry.
+        The series' frequency is recorded for its cache expiry.
+
+        Args:
+            series_id (str): Identifier for the FRED data series.
+
+        Returns:
+            SeriesInfo: Metadata of the series.
+        """
+        if self.local_source is not None:
+            return self.local_source.get_series_info(series_id)
+        cache_key = f"fred_info_{series_id}"
+        info = self.cache.get(cache_key, self.metadata_expiry)
+        if info is None:
+            info = self._flights.do(
+                cache_key, self._fetch_series_info, series_id, cache_key)
+        self._learn_info_frequency(info)
+        self._record_info(info)
+        return info
+
+    def get_series_info_many(
+        self,
+        series_ids: Iterable[str],
+        max_workers: int = 8
+    ) -> Dict[str, SeriesInfo]:
+        """
+        Fetches the metadata of several series, resolving cached metadata in
+        one lookup and fetching the rest in parallel.
+
+        Args:
+            series_ids (Iterable[str]): FRED series IDs.
+            max_workers (int): Maximum number of concurrent requests.
+                Defaults to 8.
+
+        Returns:
+            Dict[str, SeriesInfo]: Metadata by series ID in the order
+                requested.
+        """
+        if self.local_source is not None:
+            return self.local_source.get_series_info_many(series_ids)
+        series_ids = list(dict.fromkeys(series_ids))
+        cached = self.cache.get_many(
+            [f"fred_info_{series_id}" for series_id in series_ids],
+            self.metadata_expiry)
+        results = {series_id: cached[f"fred_info_{series_id}"]
+                   for series_id in series_ids
+                   if cached.get(f"fred_info_{series_id}") is not None}
+        for info in results.values():
+            self._learn_info_frequency(info)
+            self._record_info(info)
+
+        misses = [s for s in series_ids if s not in results]
+        if misses:
+            results.update(zip(misses, self._map_concurrently(
+                self.get_series_info, misses, max_workers)))
+        return {series_id: results[series_id] for series_id in series_ids}
+
+    def start_recording(self, directory: str) -> LocalFileDataSource:
+        """
+        Starts recording every series and metadata record the client returns
+        to a directory, which can then be served offline with data_dir.
+
+        Args:
+            directory (str): Directory to write the files to.
+
+        Returns:
+            LocalFileDataSource: The recording directory.
+        """
+        self.recorder = LocalFileDataSource(directory)
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """
+        Stops recording fetched series.
+        """
+        self.recorder = None
+
     def get_series_name(self, series_id: str) -> str:
         """
         Fetches the name of a FRED series given its ID.
@@ -191,7 +976,8 @@ class FredClient(DataSource):
             str: Name of the FRED series.
         """
         try:
-            return self.client.get_series_info(series_id)["title"]
+            with request_priority(PRIORITY_INTERACTIVE):
+                return self.get_series_info(series_id).title
         except Exception as e:
             logging.error(f"Error in getting series name for {series_id}: {e}")
             raise
@@ -220,16 +1006,81 @@ class FredClient(DataSource):
             return default
         else:
             try:
+                client = cls._instance or cls()
                 if periods == 0:
-                    return cls._instance.get_latest_value(series_id)
+                    return client.get_latest_value(series_id)
                 else:
-                    return cls._instance.get_historical_value(
-                        series_id, periods)
+                    return client.get_historical_value(series_id, periods)
             except Exception as e:
                 logging.error(
                     f"Error in get_data_or_fetch for {series_id}: {e}")
                 raise
 
 
-# Global instance of the FredClient
-fred_client = FredClient()
+# Defaults of the FredClient constructor options
+_OPTION_DEFAULTS = {
+    name: parameter.default for name, parameter in
+    inspect.signature(FredClient.__new__).parameters.items()
+    if name != 'cls'
+}
+
+
+def _same_option(value: Any, other: Any) -> bool:
+    return value is other or (
+        type(value) is type(other) and value == other)
+
+
+def _explicit_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Selects the constructor options that differ from their defaults.
+
+    Args:
+        options (Dict[str, Any]): Arguments of a FredClient constructor call.
+
+    Returns:
+        Dict[str, Any]: The options passed explicitly.
+    """
+    return {name: value for name, value in options.items()
+            if not _same_option(value, _OPTION_DEFAULTS[name])}
+
+
+class LazyFredClient:
+    """
+    Stand-in for the FredClient singleton that creates it on first use.
+
+    Importing the package therefore neither looks up the API key, which
+    may query the system keyring, nor fails when no key is configured.
+    Attribute reads, writes and deletions are forwarded to the singleton,
+    so a FredClient constructed with custom settings before first use is
+    the one served.
+    """
+
+    def _resolve(self) -> FredClient:
+        """
+        Returns the singleton, creating it with default settings if needed.
+
+        Returns:
+            FredClient: The singleton instance.
+
+        Raises:
+            ValueError: If no API key can be found.
+        """
+        return FredClient._instance or FredClient()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        instance = FredClient._instance
+        return repr(instance) if instance is not None \
+            else '<LazyFredClient (not yet created)>'
+
+
+# Global FredClient, created on first use
+fred_client = LazyFredClient()
@@ -4,13 +4,17 @@ import pandas as pd
 
 from pyeconomics.api.fred_api import fred_client
 
+# Federal Funds Target Rate series: the single target until 2008-12-15 and
+# the upper limit of the target range afterwards
+FED_FUNDS_RATE_SERIES_IDS = ('DFEDTAR', 'DFEDTARU')
 
-def fetch_historical_fed_funds_rate() -> pd.DataFrame:
+
+def fetch_historical_fed_funds_rate() -> pd.Series:
     """
     Fetches and combines Federal Funds Target Rate historical data.
 
     Returns:
-        pandas.DataFrame: DataFrame containing the Federal Funds Target Rate
+        pandas.Series: Series containing the Federal Funds Target Rate
             historical data.
 
     Notes:
@@ -19,9 +23,25 @@ def fetch_historical_fed_funds_rate() -> pd.DataFrame:
         - This function uses the single value up to 2008-12-15, and the upper
           limit of the range post 2008-12-15.
     """
-    dfedtar = fred_client.fetch_data('DFEDTAR')
-    dfedtaru = fred_client.fetch_data('DFEDTARU')
+    series = fred_client.fetch_many(FED_FUNDS_RATE_SERIES_IDS)
+    return combine_fed_funds_rate(series['DFEDTAR'], series['DFEDTARU'])
+
+
+def combine_fed_funds_rate(
+    dfedtar: pd.Series,
+    dfedtaru: pd.Series
+) -> pd.Series:
+    """
+    Combines already fetched Federal Funds Target Rate series.
 
+    Args:
+        dfedtar (pandas.Series): DFEDTAR data.
+        dfedtaru (pandas.Series): DFEDTARU data.
+
+    Returns:
+        pandas.Series: The single target rate up to 2008-12-15 followed by
+            the upper limit of the target range.
+    """
     # Use only the upper limit post 2008-12-15
     df = pd.concat([
         dfedtar[dfedtar.index <= '2008-12-15'],
@@ -0,0 +1,250 @@
+# pyeconomics/api/fred_transport.py
+
+import http.client
+import io
+import queue
+import ssl
+import xml.etree.ElementTree as ET
+from threading import Lock
+from typing import Dict, Optional, Tuple, Union
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+from fredapi import Fred
+
+# Seconds to wait for FRED to accept a connection or send a response
+DEFAULT_TIMEOUT = 30.0
+
+# Idle connections kept open per host
+DEFAULT_MAX_CONNECTIONS = 8
+
+# Errors raised when reusing a connection the server has already closed
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError
+)
+
+Connection = Union[http.client.HTTPConnection, http.client.HTTPSConnection]
+
+# Scheme, host name and port of a pool of connections
+Host = Tuple[str, str, Optional[int]]
+
+
+class FredTransport:
+    """
+    Sends HTTP GET requests to the FRED API on behalf of FredSession.
+    Subclass to send requests elsewhere, e.g. to a local stand-in.
+    """
+
+    def get(self, url: str) -> bytes:
+        """
+        Send a GET request.
+
+        Args:
+            url (str): Full request URL including the query string.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            HTTPError: If the response status is 400 or above.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close any open connections."""
+
+
+class UrllibTransport(FredTransport):
+    """
+    Transport opening a new connection for every request, as fredapi does.
+
+    Attributes:
+        timeout (float): Connection and read timeout in seconds.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+        self.timeout = timeout
+
+    def get(self, url):
+        with urlopen(url, timeout=self.timeout) as response:
+            return response.read()
+
+
+class PooledTransport(FredTransport):
+    """
+    Transport reusing keep-alive connections across requests and threads.
+
+    Each request borrows an idle connection to the host, or opens one if
+    none is idle, and returns it to the pool once the response is read.
+    A pooled connection the server has closed is replaced transparently.
+
+    Attributes:
+        max_connections (int): Idle connections kept per host; further
+            connections are closed after use.
+        timeout (float): Connection and read timeout in seconds.
+        ssl_context (ssl.SSLContext): Context of HTTPS connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        ssl_context: Optional[ssl.SSLContext] = None
+    ):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._pools: Dict[Host, queue.LifoQueue] = {}
+        self._lock = Lock()
+
+    def get(self, url):
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.hostname, parts.port)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+        while True:
+            connection, reused = self._checkout(host)
+            try:
+                connection.request('GET', path or '/')
+                response = connection.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(host, connection)
+            break
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason,
+                            response.headers, io.BytesIO(body))
+        return body
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def _pool(self, host: Host) -> queue.LifoQueue:
+        with self._lock:
+            return self._pools.setdefault(
+                host, queue.LifoQueue(self.max_connections))
+
+    def _checkout(self, host: Host) -> Tuple[Connection, bool]:
+        """
+        Borrow an idle connection to host, or open a new one.
+
+        Args:
+            host (Host): Scheme, host name and port.
+
+        Returns:
+            Tuple[Connection, bool]: The connection and whether it was used
+                before.
+        """
+        try:
+            return self._pool(host).get_nowait(), True
+        except queue.Empty:
+            pass
+        scheme, hostname, port = host
+        if scheme == 'https':
+            return http.client.HTTPSConnection(
+                hostname, port, timeout=self.timeout,
+                context=self.ssl_context), False
+        return http.client.HTTPConnection(
+            hostname, port, timeout=self.timeout), False
+
+    def _checkin(self, host: Host, connection: Connection) -> None:
+        """
+        Return a connection to the pool, closing it if the pool is full.
+
+        Args:
+            host (Host): Scheme, host name and port.
+            connection (Connection): Connection whose response was read.
+        """
+        try:
+            self._pool(host).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
+class FredSession(Fred):
+    """
+    fredapi client sending its requests through a FredTransport.
+
+    Requests are rerouted by overriding fredapi's private Fred.__fetch_data,
+    which every public Fred method calls; it exists in every fredapi 0.5
+    release, the series pinned in requirements.txt. Proxy support, which
+    bypasses the transport, only arrived in fredapi 0.5.2.
+
+    Attributes:
+        transport (FredTransport): Transport sending the requests.
+        root_url (str): Base URL of the FRED API.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[FredTransport] = None,
+        root_url: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            api_key (Optional[str]): The FRED API key.
+            transport (Optional[FredTransport]): Transport sending the
+                requests. Defaults to a PooledTransport.
+            root_url (Optional[str]): Base URL of the FRED API. Defaults to
+                fredapi's.
+            **kwargs: Further arguments of fredapi.Fred.
+
+        Raises:
+            RuntimeError: If the installed fredapi has no Fred.__fetch_data
+                to override, so requests would bypass the transport.
+        """
+        if not callable(getattr(Fred, '_Fred__fetch_data', None)):
+            raise RuntimeError(
+                "The installed fredapi does not define Fred.__fetch_data, "
+                "which FredSession overrides to send requests through its "
+                "transport; install fredapi 0.5 (see requirements.txt).")
+        super().__init__(api_key=api_key, **kwargs)
+        self.transport = transport or PooledTransport()
+        if root_url is not None:
+            self.root_url = root_url.rstrip('/')
+
+    def _Fred__fetch_data(self, url: str) -> ET.Element:
+        """
+        Fetch and parse a FRED response, replacing fredapi's urlopen call.
+        Requests go through urllib when proxies are configured, which
+        fredapi supports from 0.5.2.
+
+        Args:
+            url (str): Request URL without the API key.
+
+        Returns:
+            ET.Element: Root of the XML response.
+
+        Raises:
+            ValueError: With FRED's message if the request failed.
+        """
+        if getattr(self, 'proxies', None):
+            return Fred._Fred__fetch_data(self, url)
+        url += '&api_key=' + self.api_key
+        try:
+            root = ET.fromstring(self.transport.get(url))
+        except HTTPError as exc:
+            root = ET.fromstring(exc.read())
+            raise ValueError(root.get('message'))
+        return root
@@ -0,0 +1,291 @@
+# pyeconomics/api/local_data_source.py
+
+import json
+import logging
+import os
+from dataclasses import asdict, fields
+from threading import Lock
+from typing import (
+    Dict, Hashable, Iterable, List, Optional, Tuple, Union
+)
+
+import pandas as pd
+
+from pyeconomics.api.cache_manager import _atomic_write
+from pyeconomics.api.data_source import DataSource
+from pyeconomics.api.series_info import SeriesInfo
+from pyeconomics.api.series_store import PYARROW_AVAILABLE
+
+# Series file formats in order of preference when reading
+SERIES_FORMATS = ('.parquet', '.csv')
+
+# Suffix of the JSON files holding series metadata
+INFO_SUFFIX = '.info.json'
+
+# Length, last date and content hash identifying a written series
+Fingerprint = Tuple[int, Optional[Hashable], int]
+
+
+class LocalFileDataSource(DataSource):
+    """
+    Data source serving series from a directory of files, for hosts without
+    access to FRED.
+
+    Each series is stored as <series_id>.parquet or <series_id>.csv, with the
+    observation dates in the first column and the values in the second.
+    CSV files downloaded from the FRED website can be used as they are.
+    Metadata is read from <series_id>.info.json when present.
+
+    Loaded series are kept in memory until their file changes.
+
+    Attributes:
+        directory (str): Directory holding the files.
+        series_format (str): Extension of series written by save_series,
+            '.parquet' if pyarrow is installed, otherwise '.csv'.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        series_format: Optional[str] = None
+    ):
+        """
+        Args:
+            directory (str): Directory holding the files.
+            series_format (Optional[str]): '.parquet' or '.csv'. Defaults to
+                '.parquet' if pyarrow is installed, otherwise '.csv'.
+
+        Raises:
+            ValueError: If series_format is not supported.
+        """
+        super().__init__()
+        series_format = series_format or (
+            '.parquet' if PYARROW_AVAILABLE else '.csv')
+        if series_format not in SERIES_FORMATS:
+            raise ValueError(
+                f"Unsupported series format '{series_format}'; expected one "
+                f"of {', '.join(SERIES_FORMATS)}.")
+        self.directory = directory
+        self.series_format = series_format
+        self._loaded: Dict[str, Tuple[Tuple[str, int], pd.Series]] = {}
+        self._saved: Dict[str, Fingerprint] = {}
+        self._lock = Lock()
+
+    def series_ids(self) -> List[str]:
+        """
+        Lists the series available in the directory.
+
+        Returns:
+            List[str]: Sorted series IDs.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted({
+            name[:-len(extension)]
+            for name in os.listdir(self.directory)
+            for extension in SERIES_FORMATS
+            if name.endswith(extension) and not name.startswith('.')
+        })
+
+    def fetch_data(self, series_id: str) -> pd.Series:
+        """
+        Loads a series from its file.
+
+        Args:
+            series_id (str): Series ID.
+
+        Returns:
+            pandas.Series: Observations indexed by date.
+
+        Raises:
+            ValueError: If no file is found for the series.
+        """
+        filename = self._series_file(series_id)
+        if filename is None:
+            raise ValueError(f"No data found for series ID {series_id}")
+        version = (filename, os.stat(filename).st_mtime_ns)
+        with self._lock:
+            loaded = self._loaded.get(series_id)
+        if loaded is not None and loaded[0] == version:
+            return loaded[1].copy()
+
+        data = self._read_series(filename)
+        with self._lock:
+            self._loaded[series_id] = (version, data)
+        logging.info(f"Data for {series_id} loaded from {filename}.")
+        return data.copy()
+
+    def fetch_many(
+        self,
+        series_ids: Iterable[str],
+        as_frame: bool = False
+    ) -> Union[Dict[str, pd.Series], pd.DataFrame]:
+        """
+        Loads several series.
+
+        Args:
+            series_ids (Iterable[str]): Series IDs.
+            as_frame (bool): Whether to return a DataFrame with one column
+                per series, aligned on the union of their dates. Defaults to
+                False.
+
+        Returns:
+            Union[Dict[str, pd.Series], pd.DataFrame]: Series by ID in the
+                order requested, or the aligned DataFrame.
+        """
+        results = {series_id: self.fetch_data(series_id)
+                   for series_id in dict.fromkeys(series_ids)}
+        return pd.DataFrame(results) if as_frame else results
+
+    def get_series_info(self, series_id: str) -> SeriesInfo:
+        """
+        Loads the metadata of a series. Series without a metadata file are
+        described by their ID alone.
+
+        Args:
+            series_id (str): Series ID.
+
+        Returns:
+            SeriesInfo: Metadata of the series.
+        """
+        filename = os.path.join(self.directory, f"{series_id}{INFO_SUFFIX}")
+        try:
+            with open(filename) as f:
+                info = json.load(f)
+        except FileNotFoundError:
+            return SeriesInfo(series_id, title=series_id)
+        known = {field.name for field in fields(SeriesInfo)}
+        return SeriesInfo.from_fred(
+            series_id, {k: v for k, v in info.items() if k in known})
+
+    def get_series_info_many(
+        self,
+        series_ids: Iterable[str]
+    ) -> Dict[str, SeriesInfo]:
+        """
+        Loads the metadata of several series.
+
+        Args:
+            series_ids (Iterable[str]): Series IDs.
+
+        Returns:
+            Dict[str, SeriesInfo]: Metadata by series ID in the order
+                requested.
+        """
+        return {series_id: self.get_series_info(series_id)
+                for series_id in dict.fromkeys(series_ids)}
+
+    def get_series_name(self, series_id: str) -> str:
+        """
+        Returns the name of a series.
+
+        Args:
+            series_id (str): Series ID.
+
+        Returns:
+            str: Title of the series, or its ID if unknown.
+        """
+        return self.get_series_info(series_id).title or series_id
+
+    def save_series(self, series_id: str, data: pd.Series) -> None:
+        """
+        Writes a series to the directory unless the same data was already
+        written by this instance.
+
+        Args:
+            series_id (str): Series ID.
+            data (pd.Series): Observations indexed by date.
+        """
+        fingerprint = self._fingerprint(data)
+        with self._lock:
+            if self._saved.get(series_id) == fingerprint:
+                return
+
+        filename = os.path.join(
+            self.directory, f"{series_id}{self.series_format}")
+        frame = data.rename(series_id).rename_axis('date').to_frame()
+        if self.series_format == '.parquet':
+            _atomic_write(filename, frame.to_parquet)
+        else:
+            _atomic_write(filename, frame.to_csv)
+        # Remove a file of the other format, which would shadow this one
+        for extension in SERIES_FORMATS:
+            other = os.path.join(self.directory, f"{series_id}{extension}")
+            if other != filename and os.path.exists(other):
+                os.remove(other)
+        with self._lock:
+            self._saved[series_id] = fingerprint
+        logging.info(f"Data for {series_id} recorded to {filename}.")
+
+    def save_info(self, info: SeriesInfo) -> None:
+        """
+        Writes the metadata of a series to the directory.
+
+        Args:
+            info (SeriesInfo): Metadata of the series.
+        """
+        record = {k: (v.isoformat() if isinstance(v, pd.Timestamp) else v)
+                  for k, v in asdict(info).items()}
+        filename = os.path.join(
+            self.directory, f"{info.series_id}{INFO_SUFFIX}")
+
+        def write(path: str) -> None:
+            with open(path, 'w') as f:
+                json.dump(record, f, indent=2)
+
+        _atomic_write(filename, write)
+
+    def _series_file(self, series_id: str) -> Optional[str]:
+        """
+        Finds the file of a series.
+
+        Args:
+            series_id (str): Series ID.
+
+        Returns:
+            Optional[str]: Path of the file, or None if there is none.
+        """
+        for extension in SERIES_FORMATS:
+            filename = os.path.join(
+                self.directory, f"{series_id}{extension}")
+            if os.path.exists(filename):
+                return filename
+        return None
+
+    @staticmethod
+    def _fingerprint(data: pd.Series) -> Fingerprint:
+        """
+        Summarises a series to tell whether it was already written, without
+        keeping the series itself.
+
+        Args:
+            data (pd.Series): Observations indexed by date.
+
+        Returns:
+            Fingerprint: Length, last date and hash of the index and values.
+        """
+        last = data.index[-1] if len(data) else None
+        return len(data), last, int(pd.util.hash_pandas_object(data).sum())
+
+    @staticmethod
+    def _read_series(filename: str) -> pd.Series:
+        """
+        Reads a series file.
+
+        Args:
+            filename (str): Path of a Parquet or CSV file.
+
+        Returns:
+            pandas.Series: Values of the second column, indexed by the dates
+                in the first, with FRED's missing value marker '.' as NaN.
+        """
+        if filename.endswith('.parquet'):
+            frame = pd.read_parquet(filename)
+            if not isinstance(frame.index, pd.DatetimeIndex):
+                frame = frame.set_index(frame.columns[0])
+        else:
+            frame = pd.read_csv(filename, index_col=0, na_values='.')
+        values = pd.to_numeric(frame.iloc[:, 0], errors='coerce')
+        return pd.Series(
+            values.to_numpy(dtype='float64'),
+            index=pd.DatetimeIndex(pd.to_datetime(frame.index)))
@@ -0,0 +1,156 @@
+# pyeconomics/api/memory_cache.py
+
+import copy
+import sys
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from pyeconomics.api.cache_expiry import Expiry, is_expired
+
+
+def estimate_size(data: Any) -> int:
+    """Estimate the number of bytes held by a cached object.
+
+    Args:
+        data: The cached object.
+
+    Returns:
+        int: Approximate size of the object in bytes.
+    """
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(index=True, deep=True))
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=True).sum())
+    if isinstance(data, np.ndarray):
+        return int(data.nbytes)
+    if isinstance(getattr(data, 'nbytes', None), int):
+        return data.nbytes
+    return sys.getsizeof(data)
+
+
+def _detach(data: Any) -> Any:
+    """Return a copy that callers can modify without touching the cache.
+
+    Copies are deep, so that every hit is independent of the cached entry as
+    a load from disk would be. Read-only values, such as memory-mapped
+    entries, are shared instead; only their index is copied.
+    """
+    if isinstance(data, pd.Series) and not data.values.flags.writeable:
+        detached = data.copy(deep=False)
+        detached.index = data.index.copy()
+        return detached
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return data.copy(deep=True)
+    return copy.deepcopy(data)
+
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache bounded by entry count and total bytes.
+
+    Each entry remembers when its data was saved so that expiry is judged
+    against the same timestamp as the disk entry it was loaded from.
+
+    Attributes:
+        max_entries (int): Maximum number of entries held. Zero disables the
+            cache.
+        max_bytes (int): Maximum total estimated size of all entries.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 256 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """int: Total estimated size of the cached entries in bytes."""
+        return self._total_bytes
+
+    def get(
+        self,
+        key: str,
+        expiry: Expiry = timedelta(days=1)
+    ) -> Optional[Any]:
+        """
+        Return the cached data for a key if present and not expired.
+
+        Args:
+            key (str): The key for the cache entry.
+            expiry (Expiry): The expiration time for the cache entry.
+
+        Returns:
+            The cached data if available and not expired, otherwise None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            data, saved_at, _ = entry
+            if is_expired(expiry, saved_at):
+                return None
+            self._entries.move_to_end(key)
+        return _detach(data)
+
+    def put(self, key: str, data: Any, saved_at: float) -> None:
+        """
+        Add or replace an entry, evicting least recently used entries until
+        the cache fits within its bounds.
+
+        Args:
+            key (str): The key for the cache entry.
+            data: The data to be cached.
+            saved_at (float): POSIX timestamp at which the data was saved.
+
+        Returns:
+            None
+        """
+        size = estimate_size(data)
+        with self._lock:
+            self._pop(key)
+            if self.max_entries <= 0 or size > self.max_bytes:
+                return
+            self._entries[key] = (_detach(data), saved_at, size)
+            self._total_bytes += size
+            while (len(self._entries) > self.max_entries or
+                   self._total_bytes > self.max_bytes):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove an entry from the cache if present.
+
+        Args:
+            key (str): The key for the cache entry.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
@@ -0,0 +1,98 @@
+# pyeconomics/api/mmap_store.py
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from pyeconomics.api.series_store import date_bounds
+
+# File extension used for memory-mapped series entries
+MMAP_EXTENSION = '.npy'
+
+
+def is_mappable_series(data) -> bool:
+    """Check whether data can be written to the memory-mapped series store.
+
+    Only unnamed float64 series with a timezone-naive DatetimeIndex are
+    mappable, since the file holds nothing but the raw index and values.
+
+    Args:
+        data: The object to check.
+
+    Returns:
+        bool: True if data can be stored without losing information.
+    """
+    return (
+        isinstance(data, pd.Series) and
+        len(data) > 0 and
+        isinstance(data.index, pd.DatetimeIndex) and
+        data.index.tz is None and
+        data.index.name is None and
+        data.name is None and
+        data.dtype == np.float64
+    )
+
+
+def write_mapped_series(filename: str, series: pd.Series) -> None:
+    """Write a time series as raw arrays that can be memory-mapped.
+
+    The file is a single .npy array of shape (2, n): the first row holds the
+    datetime64[ns] index and the second the float64 values, both stored as
+    int64 bit patterns.
+
+    Args:
+        filename (str): The path of the file to write.
+        series (pd.Series): Float64 series indexed by date.
+
+    Returns:
+        None
+    """
+    arrays = np.empty((2, len(series)), dtype='<i8')
+    arrays[0] = series.index.values.astype('datetime64[ns]').view('<i8')
+    arrays[1] = series.to_numpy(dtype='<f8').view('<i8')
+    with open(filename, 'wb') as f:
+        np.save(f, arrays)
+
+
+def read_mapped_series(
+    filename: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> pd.Series:
+    """Read a time series backed by read-only memory-mapped pages.
+
+    The returned Series shares the operating system's page cache with every
+    other process mapping the same file instead of holding a private copy.
+    The array header is validated, but the values are not checksummed so
+    that pages are only touched when they are used.
+
+    Args:
+        filename (str): The path of the file to read.
+        start (str, optional): First observation date to include.
+        end (str, optional): Last observation date to include.
+
+    Returns:
+        pd.Series: The stored series, restricted to [start, end] if given.
+
+    Raises:
+        ValueError: If the file is truncated or not a mapped series.
+    """
+    arrays = np.load(filename, mmap_mode='r')
+    if arrays.ndim != 2 or arrays.shape[0] != 2 or arrays.dtype != '<i8':
+        raise ValueError(f"{filename} is not a memory-mapped series.")
+    dates = arrays[0].view('datetime64[ns]')
+    values = arrays[1].view('<f8')
+
+    lower, upper = date_bounds(start, end)
+    first, last = 0, len(dates)
+    if lower is not None:
+        first = np.searchsorted(dates, lower.to_datetime64())
+    if upper is not None:
+        last = np.searchsorted(dates, upper.to_datetime64(), side='right')
+
+    index = pd.DatetimeIndex(dates[first:last])
+    series = pd.Series(values[first:last], index=index, copy=False)
+    if start is not None or end is not None:
+        series = series.loc[start:end]
+    return series
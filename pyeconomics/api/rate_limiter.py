@@ -0,0 +1,210 @@
+# pyeconomics/api/rate_limiter.py
+
+import heapq
+import itertools
+import os
+import struct
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Condition
+from typing import Iterator, List, Optional, Tuple
+
+from pyeconomics.api.file_lock import FileLock
+
+# Requests per minute allowed for one FRED API key
+FRED_REQUESTS_PER_MINUTE = 120
+
+# Priorities of queued requests; lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BULK = 10
+
+# Shared bucket state: available tokens and the wall-clock time they were
+# counted at
+_STATE = struct.Struct('>dd')
+
+_priority: ContextVar[int] = ContextVar(
+    'pyeconomics_request_priority', default=PRIORITY_DEFAULT)
+
+
+def current_priority() -> int:
+    """
+    Returns the priority of requests made in the current context.
+
+    Returns:
+        int: The priority set by the innermost request_priority block, or
+            PRIORITY_DEFAULT.
+    """
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """
+    Sets the priority of requests made within the block.
+
+    Args:
+        priority (int): Priority of the requests, e.g. PRIORITY_INTERACTIVE
+            or PRIORITY_BULK.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the rate of requests, shared by every thread using
+    the instance and, when given a state file, by every process using that
+    file.
+
+    Waiting requests are served in priority order, then in arrival order.
+
+    Attributes:
+        rate (int): Number of requests allowed per period.
+        period (float): Length of the period in seconds.
+        burst (int): Maximum number of requests made back to back after an
+            idle spell.
+        path (Optional[str]): State file shared between processes, or None
+            to keep the bucket in process memory.
+    """
+
+    def __init__(
+        self,
+        rate: int = FRED_REQUESTS_PER_MINUTE,
+        period: float = 60.0,
+        burst: Optional[int] = None,
+        path: Optional[str] = None
+    ):
+        if rate <= 0 or period <= 0:
+            raise ValueError("Rate and period must be positive.")
+        self.rate = rate
+        self.period = period
+        self.burst = burst or rate
+        self.path = path
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+        self._condition = Condition()
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+
+    def acquire(
+        self,
+        priority: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Waits for permission to make one request.
+
+        Args:
+            priority (Optional[int]): Priority of the request. Defaults to
+                the priority of the current context.
+            timeout (Optional[float]): Maximum number of seconds to wait.
+                Waits indefinitely if None.
+
+        Returns:
+            bool: True if the request may be made, False on timeout.
+        """
+        if priority is None:
+            priority = current_priority()
+        ticket = (priority, next(self._sequence))
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            # A new request may outrank the one waiting for the next token
+            self._condition.notify_all()
+            try:
+                while True:
+                    wait = None
+                    if self._waiters[0] == ticket:
+                        wait = self._take()
+                        if wait == 0:
+                            return True
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = remaining if wait is None \
+                            else min(wait, remaining)
+                    self._condition.wait(wait)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def _take(self) -> float:
+        """
+        Takes a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the number of seconds
+                until the next token.
+        """
+        if self.path is None:
+            self._tokens, self._updated, wait = self._refill_and_take(
+                self._tokens, self._updated)
+            return wait
+
+        with FileLock(f"{self.path}.lock"):
+            tokens, updated = self._read_state()
+            tokens, updated, wait = self._refill_and_take(tokens, updated)
+            with open(self.path, 'wb') as f:
+                f.write(_STATE.pack(tokens, updated))
+            return wait
+
+    def _refill_and_take(
+        self,
+        tokens: float,
+        updated: float
+    ) -> Tuple[float, float, float]:
+        """
+        Adds the tokens accrued since updated and takes one if available.
+
+        Args:
+            tokens (float): Tokens available at updated.
+            updated (float): Time the tokens were counted at.
+
+        Returns:
+            Tuple[float, float, float]: Tokens left, the time they were
+                counted at, and 0 if a token was taken or otherwise the
+                number of seconds until the next token.
+        """
+        now = time.time()
+        tokens = min(float(self.burst), tokens + max(now - updated, 0.0) *
+                     self.rate / self.period)
+        if tokens >= 1:
+            return tokens - 1, now, 0.0
+        return tokens, now, (1 - tokens) * self.period / self.rate
+
+    def _read_state(self) -> Tuple[float, float]:
+        """
+        Reads the shared bucket state, starting with a full bucket if the
+        state file is missing or unreadable.
+
+        Returns:
+            Tuple[float, float]: Available tokens and the time they were
+                counted at.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                return _STATE.unpack(f.read(_STATE.size))
+        except (OSError, struct.error):
+            return float(self.burst), time.time()
+
+
+def default_rate_limiter() -> RateLimiter:
+    """
+    Creates the rate limiter for FRED requests, shared between processes
+    through the file named by the PYECONOMICS_RATE_LIMIT_FILE environment
+    variable if set.
+
+    Returns:
+        RateLimiter: Limiter allowing FRED_REQUESTS_PER_MINUTE requests per
+            minute.
+    """
+    path = os.getenv('PYECONOMICS_RATE_LIMIT_FILE')
+    return RateLimiter(FRED_REQUESTS_PER_MINUTE, 60.0, path=path or None)
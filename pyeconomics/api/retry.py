@@ -0,0 +1,151 @@
+# pyeconomics/api/retry.py
+
+import random
+import socket
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+from urllib.error import HTTPError, URLError
+
+# HTTP status codes of responses worth retrying: throttling and server-side
+# failures
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling FRED while the circuit breaker is open."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Tells whether a failed FRED request may succeed if sent again.
+
+    fredapi turns HTTP errors into ValueError with FRED's message, so the
+    chain of exceptions is searched for the original HTTPError.
+
+    Args:
+        error (BaseException): Exception raised by the request.
+
+    Returns:
+        bool: True for timeouts, connection failures and the status codes in
+            RETRYABLE_STATUS_CODES.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, HTTPError):
+            return error.code in RETRYABLE_STATUS_CODES
+        if isinstance(error, (URLError, socket.timeout, TimeoutError,
+                              ConnectionError)):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry schedule with exponential backoff and full jitter.
+
+    Attributes:
+        max_attempts (int): Number of attempts, including the first.
+            Defaults to 4.
+        base_delay (float): Upper bound of the delay in seconds before the
+            first retry, doubled for every further retry. Defaults to 0.5.
+        max_delay (float): Upper bound of any delay in seconds. Defaults to
+            30.
+    """
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int) -> float:
+        """
+        Draw the delay before retrying a failed attempt.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 1.
+
+        Returns:
+            float: Seconds to wait, uniformly drawn between 0 and the
+                backoff cap so that retrying clients spread out.
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing service until it has had time to recover.
+
+    The breaker opens after failure_threshold consecutive failures. While
+    open, calls fail at once with CircuitOpenError. After reset_timeout
+    seconds one trial call is let through; its success closes the breaker
+    and its failure opens it again.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures opening the breaker.
+        reset_timeout (float): Seconds the breaker stays open before a trial
+            call.
+    """
+
+    def __init__(self, failure_threshold: int = 5,
+                 reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        """str: 'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return 'open'
+            return 'half-open'
+
+    def before_call(self) -> None:
+        """
+        Checks that a call may be made.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a
+                trial call already running.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - \
+                (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpenError(
+                    f"FRED is unavailable; retrying in "
+                    f"{max(remaining, 0):.0f}s.")
+            self._trial_running = True
+
+    def record_success(self) -> None:
+        """
+        Records a call that reached the service, closing the breaker.
+        """
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """
+        Records a call that failed because the service is unavailable.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or \
+                    self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
@@ -0,0 +1,74 @@
+# pyeconomics/api/series_info.py
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Mapping, Optional
+
+import pandas as pd
+
+# How long cached series metadata is used before it is fetched again. FRED
+# updates last_updated and observation_end with each release.
+METADATA_EXPIRY = timedelta(days=1)
+
+
+def _timestamp(value: Any) -> Optional[pd.Timestamp]:
+    return pd.Timestamp(value) if value else None
+
+
+@dataclass(frozen=True)
+class SeriesInfo:
+    """
+    Metadata of a FRED series.
+
+    Attributes:
+        series_id (str): FRED series ID.
+        title (Optional[str]): Name of the series.
+        units (Optional[str]): Units of the observations.
+        frequency (Optional[str]): Frequency, e.g. 'Monthly'.
+        frequency_short (Optional[str]): FRED frequency code, e.g. 'M'.
+        seasonal_adjustment_short (Optional[str]): Seasonal adjustment code,
+            e.g. 'SA'.
+        last_updated (Optional[pd.Timestamp]): Time of the latest update.
+        observation_start (Optional[pd.Timestamp]): Date of the first
+            observation.
+        observation_end (Optional[pd.Timestamp]): Date of the last
+            observation.
+    """
+    series_id: str
+    title: Optional[str] = None
+    units: Optional[str] = None
+    frequency: Optional[str] = None
+    frequency_short: Optional[str] = None
+    seasonal_adjustment_short: Optional[str] = None
+    last_updated: Optional[pd.Timestamp] = None
+    observation_start: Optional[pd.Timestamp] = None
+    observation_end: Optional[pd.Timestamp] = None
+
+    @classmethod
+    def from_fred(
+        cls,
+        series_id: str,
+        info: Mapping[str, Any]
+    ) -> 'SeriesInfo':
+        """
+        Build the metadata from a FRED series info response.
+
+        Args:
+            series_id (str): FRED series ID.
+            info (Mapping[str, Any]): Fields as returned by
+                Fred.get_series_info.
+
+        Returns:
+            SeriesInfo: The metadata.
+        """
+        return cls(
+            series_id=series_id,
+            title=info.get('title'),
+            units=info.get('units'),
+            frequency=info.get('frequency'),
+            frequency_short=info.get('frequency_short'),
+            seasonal_adjustment_short=info.get('seasonal_adjustment_short'),
+            last_updated=_timestamp(info.get('last_updated')),
+            observation_start=_timestamp(info.get('observation_start')),
+            observation_end=_timestamp(info.get('observation_end')),
+        )
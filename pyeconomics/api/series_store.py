@@ -0,0 +1,168 @@
+# pyeconomics/api/series_store.py
+
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+# File extension used for columnar series entries
+SERIES_EXTENSION = '.parquet'
+
+# Version of the Parquet entry layout, stored in the schema metadata. Files
+# written with another version are rejected by read_series.
+SERIES_FORMAT_VERSION = '1'
+
+# Rows per Parquet row group. Small row groups let date-range reads skip
+# whole blocks of a multi-decade daily series using the column statistics.
+ROW_GROUP_SIZE = 4096
+
+
+def is_storable_series(data) -> bool:
+    """Check whether data can be written to the columnar series store.
+
+    Args:
+        data: The object to check.
+
+    Returns:
+        bool: True if data is a numeric pandas Series with a timezone-naive
+            DatetimeIndex.
+    """
+    return (
+        isinstance(data, pd.Series) and
+        isinstance(data.index, pd.DatetimeIndex) and
+        data.index.tz is None and
+        pd.api.types.is_numeric_dtype(data.dtype)
+    )
+
+
+def date_bounds(
+    start: Optional[str],
+    end: Optional[str]
+) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """Resolve the earliest and latest timestamps a date range covers.
+
+    Partial dates cover their whole period, as in .loc slicing: an end of
+    '2020-01' includes every observation in January 2020. Use the bounds to
+    skip stored data, then apply series.loc[start:end] for the exact range.
+
+    Args:
+        start (str, optional): First observation date to include.
+        end (str, optional): Last observation date to include.
+
+    Returns:
+        Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]: The bounds,
+            None where the range is open.
+    """
+    first = pd.Timestamp(start) if start is not None else None
+    last = None
+    if end is not None:
+        last = pd.Timestamp(end)
+        if isinstance(end, str):
+            try:
+                last = pd.Period(end).end_time
+            except ValueError:
+                pass
+    return first, last
+
+
+def write_series(filename: str, series: pd.Series) -> None:
+    """Write a time series to a Parquet file with date and value columns.
+
+    Every data page carries a CRC-32 checksum that read_series verifies.
+
+    Args:
+        filename (str): The path of the Parquet file to write.
+        series (pd.Series): Numeric series indexed by date.
+
+    Returns:
+        None
+    """
+    metadata = {
+        b'format_version': SERIES_FORMAT_VERSION,
+        b'name': '' if series.name is None else str(series.name),
+        b'index_name': ('' if series.index.name is None
+                        else str(series.index.name)),
+    }
+    table = pa.table({
+        'date': pa.array(series.index.values),
+        'value': pa.array(series.to_numpy()),
+    }).replace_schema_metadata(metadata)
+    pq.write_table(table, filename, row_group_size=ROW_GROUP_SIZE,
+                   write_page_checksum=True)
+
+
+def _row_groups_in_range(
+    parquet_file,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp]
+) -> List[int]:
+    """Select the row groups whose date statistics overlap [start, end]."""
+    metadata = parquet_file.metadata
+    if start is None and end is None:
+        return list(range(metadata.num_row_groups))
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        statistics = metadata.row_group(i).column(0).statistics
+        if statistics is None or not statistics.has_min_max:
+            row_groups.append(i)
+            continue
+        if start is not None and pd.Timestamp(statistics.max) < start:
+            continue
+        if end is not None and pd.Timestamp(statistics.min) > end:
+            continue
+        row_groups.append(i)
+    return row_groups
+
+
+def read_series(
+    filename: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> pd.Series:
+    """Read a time series from a Parquet file written by write_series.
+
+    Only the row groups overlapping the requested date range are read, and
+    the checksums of their pages are verified.
+
+    Args:
+        filename (str): The path of the Parquet file to read.
+        start (str, optional): First observation date to include.
+        end (str, optional): Last observation date to include.
+
+    Returns:
+        pd.Series: The stored series, restricted to [start, end] if given.
+
+    Raises:
+        ValueError: If the file was written with another format version.
+        OSError: If the file is truncated or fails its page checksums.
+    """
+    first, last = date_bounds(start, end)
+
+    parquet_file = pq.ParquetFile(filename, page_checksum_verification=True)
+    metadata = parquet_file.schema_arrow.metadata or {}
+    version = metadata.get(b'format_version', SERIES_FORMAT_VERSION.encode())
+    if version.decode('utf-8') != SERIES_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported series format version {version.decode('utf-8')}.")
+    table = parquet_file.read_row_groups(
+        _row_groups_in_range(parquet_file, first, last),
+        columns=['date', 'value'])
+
+    name = metadata.get(b'name', b'').decode('utf-8') or None
+    index_name = metadata.get(b'index_name', b'').decode('utf-8') or None
+
+    index = pd.DatetimeIndex(
+        table.column('date').to_numpy(), name=index_name)
+    series = pd.Series(
+        table.column('value').to_numpy(), index=index, name=name)
+    if start is not None or end is not None:
+        series = series.loc[start:end]
+    return series
@@ -0,0 +1,125 @@
+# pyeconomics/api/series_summary.py
+
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+# Trailing observations kept for lagged lookups; covers the 12-month lag of
+# the first difference rule with room to spare
+SUMMARY_TAIL = 24
+
+
+@dataclass
+class SeriesSummary:
+    """
+    Small summary of a cached series answering point lookups without
+    loading its full history.
+
+    Attributes:
+        length (int): Number of observations in the series.
+        tail (pd.Series): The last observations of the series.
+        current (Optional[pd.Series]): Observations from the last one dated
+            on or before as_of onwards, or None if the series is not
+            indexed by date.
+        as_of (pd.Timestamp): Day the summary was computed.
+    """
+    length: int
+    tail: pd.Series
+    current: Optional[pd.Series]
+    as_of: pd.Timestamp
+
+    @classmethod
+    def from_series(
+        cls,
+        data: pd.Series,
+        as_of: Optional[pd.Timestamp] = None,
+        tail: int = SUMMARY_TAIL
+    ) -> 'SeriesSummary':
+        """
+        Summarize a series.
+
+        Args:
+            data (pd.Series): Observations sorted by date.
+            as_of (pd.Timestamp, optional): Day of the summary. Defaults to
+                today.
+            tail (int): Number of trailing observations kept. Defaults to
+                SUMMARY_TAIL.
+
+        Returns:
+            SeriesSummary: The summary.
+        """
+        as_of = (pd.Timestamp.today() if as_of is None
+                 else pd.Timestamp(as_of)).normalize()
+        current = None
+        if isinstance(data.index, pd.DatetimeIndex):
+            # Keep the latest observation up to as_of and any later ones, so
+            # lookups on as_of or any later day find their answer here
+            start = max(len(data[:str(as_of.date())]) - 1, 0)
+            current = data.iloc[start:].copy()
+        return cls(length=len(data), tail=data.iloc[-tail:].copy(),
+                   current=current, as_of=as_of)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the stored observations."""
+        nbytes = self.tail.memory_usage(index=True)
+        if self.current is not None:
+            nbytes += self.current.memory_usage(index=True)
+        return int(nbytes)
+
+    def covers_latest(self, today: pd.Timestamp) -> bool:
+        """
+        Whether latest_value can answer for a day.
+
+        Args:
+            today (pd.Timestamp): Day of the lookup.
+
+        Returns:
+            bool: True if the day is on or after as_of.
+        """
+        return self.current is not None and \
+            pd.Timestamp(today).normalize() >= self.as_of
+
+    def latest_value(self, today: pd.Timestamp) -> Optional[float]:
+        """
+        Return the latest observation dated on or before a day.
+
+        Args:
+            today (pd.Timestamp): Day of the lookup, covered by the summary.
+
+        Returns:
+            Optional[float]: The observation, or None if there is none.
+        """
+        known = self.current[:str(pd.Timestamp(today).date())]
+        return known.iloc[-1] if not known.empty else None
+
+    def covers_lag(self, periods: int) -> bool:
+        """
+        Whether historical_value can answer for a position.
+
+        Args:
+            periods (int): Position of the observation, negative from the
+                end.
+
+        Returns:
+            bool: True if the tail holds the whole series or the position.
+        """
+        return len(self.tail) == self.length or \
+            -len(self.tail) <= periods < 0
+
+    def historical_value(self, periods: int) -> Optional[float]:
+        """
+        Return the observation at a position of the series.
+
+        Args:
+            periods (int): Position covered by the summary, negative from
+                the end.
+
+        Returns:
+            Optional[float]: The observation, or None if the series is too
+                short.
+        """
+        if self.length == 0 or self.length <= -periods:
+            return None
+        return self.tail.iloc[periods]
@@ -0,0 +1,92 @@
+# pyeconomics/api/single_flight.py
+
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas as pd
+
+
+class _Flight:
+    """A call in progress and, once it finishes, its outcome."""
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key into one execution.
+
+    The first caller for a key runs the function. Callers arriving with the
+    same key while it runs wait for it and receive its result, or its
+    exception, instead of running the function again. Waiters receive a
+    copy of pandas results, so no caller sees another's changes. Once the call
+    finishes the key is free, so later callers start a new call.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, function: Callable[..., Any],
+           *args: Any, **kwargs: Any) -> Any:
+        """
+        Run function, or wait for the call already in progress for key.
+
+        Args:
+            key (Hashable): Identifies calls that may share a result.
+            function (Callable[..., Any]): Function to call.
+            *args (Any): Positional arguments for function.
+            **kwargs (Any): Keyword arguments for function.
+
+        Returns:
+            Any: The result of the call, copied for callers that waited
+                if it is a pandas object.
+
+        Raises:
+            Exception: Any exception raised by the call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if isinstance(flight.result, (pd.Series, pd.DataFrame)):
+                return flight.result.copy()
+            return flight.result
+
+        try:
+            flight.result = function(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def in_flight(self, key: Hashable) -> int:
+        """
+        Count the callers of the call in progress for key.
+
+        Args:
+            key (Hashable): Key of the call.
+
+        Returns:
+            int: Number of callers, including the one running the call, or
+                0 if no call is in progress.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            return 0 if flight is None else flight.waiters + 1
@@ -0,0 +1,258 @@
+# pyeconomics/api/sqlite_cache.py
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import weakref
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from pyeconomics.api import (
+    cache_codecs, cache_integrity, cache_manager, cache_stats
+)
+from pyeconomics.api.cache_expiry import Expiry, is_expired
+
+DATABASE_FILENAME = 'cache.sqlite3'
+
+# SQLite limits the number of bound parameters per statement
+_MAX_PARAMETERS = 500
+
+
+class _ConnectionHolder:
+    """Thread-local holder of a connection. The connection is closed when
+    the holder is garbage collected, that is when its thread exits."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.finalizer = weakref.finalize(self, connection.close)
+
+
+class SQLiteCache:
+    """
+    Cache backend storing every entry and its metadata in a single SQLite
+    database in write-ahead-log mode.
+
+    Readers never block writers, several processes can share the database,
+    and a batch of keys is resolved with one query. Each thread uses its own
+    connection, which is closed when the thread exits.
+
+    Attributes:
+        path (str): Path of the database file.
+        timeout (float): Seconds to wait for a lock held by another
+            connection.
+        codec (str): Compression codec of newly saved entries. Entries are
+            decompressed transparently whatever codec wrote them.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        timeout: float = 30.0,
+        codec: Optional[str] = None
+    ):
+        self.path = path or os.path.join(
+            cache_manager.CACHE_DIR, DATABASE_FILENAME)
+        self.timeout = timeout
+        self.codec = cache_codecs.check_codec(codec)
+        self._local = threading.local()
+        self._finalizers: List[weakref.finalize] = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it if
+        needed."""
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False,
+                isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, '
+                'data BLOB NOT NULL, '
+                'saved_at REAL NOT NULL, '
+                'size INTEGER NOT NULL)')
+            holder = _ConnectionHolder(connection)
+            self._local.holder = holder
+            with self._connections_lock:
+                self._finalizers = [
+                    finalizer for finalizer in self._finalizers
+                    if finalizer.alive]
+                self._finalizers.append(holder.finalizer)
+        return holder.connection
+
+    def save(self, key: str, data: Any) -> None:
+        """
+        Save data to the cache.
+
+        Args:
+            key (str): The key for the cache entry.
+            data: The data to be cached.
+
+        Returns:
+            None
+        """
+        self.save_many({key: data})
+
+    def save_many(self, items: Dict[str, Any]) -> None:
+        """
+        Save several entries in a single transaction.
+
+        Args:
+            items (Dict[str, Any]): Data to be cached by key.
+
+        Returns:
+            None
+        """
+        with cache_stats.timed('save'):
+            saved_at = time.time()
+            rows = []
+            for key, data in items.items():
+                blob = cache_integrity.seal(
+                    pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+                    self.codec)
+                rows.append((key, blob, saved_at, len(blob)))
+                cache_stats.record_write(len(blob))
+            connection = self._connection()
+            with connection:
+                connection.execute('BEGIN IMMEDIATE')
+                connection.executemany(
+                    'INSERT OR REPLACE INTO entries '
+                    '(key, data, saved_at, size) VALUES (?, ?, ?, ?)', rows)
+
+    def load(
+        self,
+        key: str,
+        expiry: Expiry = timedelta(days=1)
+    ) -> Optional[Any]:
+        """
+        Load data from the cache if available and not expired.
+
+        Args:
+            key (str): The key for the cache entry.
+            expiry (Expiry): The expiration time for the cache entry.
+
+        Returns:
+            The cached data if available and not expired, otherwise None.
+        """
+        return self.load_many([key], expiry).get(key)
+
+    def load_many(
+        self,
+        keys: Iterable[str],
+        expiry: Expiry = timedelta(days=1)
+    ) -> Dict[str, Any]:
+        """
+        Load several entries with a single query per batch of keys.
+
+        Args:
+            keys (Iterable[str]): The keys of the cache entries.
+            expiry (Expiry): The expiration time for the cache entries.
+
+        Returns:
+            Dict[str, Any]: Cached data of every key found and not expired.
+                Missing and expired keys are left out, as are corrupt
+                entries, which are deleted.
+        """
+        keys = list(dict.fromkeys(keys))
+        connection = self._connection()
+        results = {}
+        found = 0
+        with cache_stats.timed('load'):
+            for i in range(0, len(keys), _MAX_PARAMETERS):
+                batch = keys[i:i + _MAX_PARAMETERS]
+                placeholders = ', '.join('?' * len(batch))
+                rows = connection.execute(
+                    f'SELECT key, data, saved_at FROM entries '
+                    f'WHERE key IN ({placeholders})', batch).fetchall()
+                found += len(rows)
+                for key, blob, saved_at in rows:
+                    if is_expired(expiry, saved_at):
+                        cache_stats.record_miss(expired=True)
+                        continue
+                    try:
+                        results[key] = pickle.loads(
+                            cache_integrity.unseal(blob))
+                    except Exception as e:
+                        logging.warning(
+                            f"Discarding corrupt cache entry for {key}: {e}")
+                        connection.execute(
+                            'DELETE FROM entries WHERE key = ? AND '
+                            'saved_at = ?', (key, saved_at))
+                        cache_stats.record_miss(corrupt=True)
+                        continue
+                    cache_stats.record_hit(len(blob))
+            for _ in range(len(keys) - found):
+                cache_stats.record_miss()
+        return results
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove an entry from the cache if present.
+
+        Args:
+            key (str): The key for the cache entry.
+
+        Returns:
+            None
+        """
+        self._connection().execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+
+        Returns:
+            None
+        """
+        self._connection().execute('DELETE FROM entries')
+
+    def usage(self) -> Dict[str, int]:
+        """
+        Report the number and total size of the cached entries.
+
+        Returns:
+            Dict[str, int]: 'entries' and 'total_bytes' of the cache.
+        """
+        entries, total_bytes = self._connection().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        return {'entries': entries, 'total_bytes': total_bytes}
+
+    def export(self, path: str) -> None:
+        """
+        Copy the whole cache into a standalone database file, for example to
+        ship a warm cache to another node.
+
+        Args:
+            path (str): Path of the database file to write.
+
+        Returns:
+            None
+        """
+        target = sqlite3.connect(path)
+        try:
+            self._connection().backup(target)
+        finally:
+            target.close()
+
+    def close(self) -> None:
+        """
+        Close the connections opened by every thread still running.
+        Connections of exited threads are already closed.
+
+        Returns:
+            None
+        """
+        with self._connections_lock:
+            for finalizer in self._finalizers:
+                finalizer()
+            self._finalizers.clear()
+        self._local = threading.local()
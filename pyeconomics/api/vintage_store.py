@@ -0,0 +1,148 @@
+# pyeconomics/api/vintage_store.py
+
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+DateLike = Union[str, pd.Timestamp, np.datetime64]
+
+
+@dataclass
+class VintageHistory:
+    """
+    Every vintage of a FRED series, stored as the observations that changed
+    in each vintage rather than one full series per vintage.
+
+    The three arrays are aligned and sorted by observation date, then by
+    vintage date. A row means that from realtime_start on, the observation
+    at date has the given value, until a later row for the same date revises
+    it. Rows repeating the previous value of their observation are dropped.
+
+    Attributes:
+        series_id (str): FRED series ID.
+        dates (np.ndarray): Observation dates as datetime64[ns].
+        realtime_start (np.ndarray): Vintage dates as datetime64[ns].
+        values (np.ndarray): Observation values as float64.
+    """
+    series_id: str
+    dates: np.ndarray
+    realtime_start: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_releases(
+        cls,
+        series_id: str,
+        releases: pd.DataFrame
+    ) -> 'VintageHistory':
+        """
+        Build a history from FRED observations with real-time periods.
+
+        Args:
+            series_id (str): FRED series ID.
+            releases (pd.DataFrame): Columns 'date', 'realtime_start' and
+                'value', as returned by Fred.get_series_all_releases.
+
+        Returns:
+            VintageHistory: The compacted history.
+        """
+        frame = pd.DataFrame({
+            'date': pd.to_datetime(releases['date']).to_numpy(
+                dtype='datetime64[ns]'),
+            'realtime_start': pd.to_datetime(
+                releases['realtime_start']).to_numpy(dtype='datetime64[ns]'),
+            'value': pd.to_numeric(releases['value']).to_numpy(
+                dtype='float64'),
+        })
+        frame = frame.sort_values(
+            ['date', 'realtime_start'], kind='stable').drop_duplicates(
+            ['date', 'realtime_start'], keep='last')
+
+        dates = frame['date'].to_numpy()
+        values = frame['value'].to_numpy()
+        same_date = np.r_[False, dates[1:] == dates[:-1]]
+        same_value = np.r_[False, (values[1:] == values[:-1]) |
+                           (np.isnan(values[1:]) & np.isnan(values[:-1]))]
+        keep = ~(same_date & same_value)
+        return cls(
+            series_id=series_id,
+            dates=dates[keep],
+            realtime_start=frame['realtime_start'].to_numpy()[keep],
+            values=values[keep],
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def empty(self) -> bool:
+        """Whether the history holds no observations."""
+        return len(self) == 0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the stored arrays."""
+        return int(self.dates.nbytes + self.realtime_start.nbytes +
+                   self.values.nbytes)
+
+    @property
+    def vintage_dates(self) -> pd.DatetimeIndex:
+        """Dates on which at least one observation was released or
+        revised."""
+        return pd.DatetimeIndex(np.unique(self.realtime_start))
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the stored rows.
+
+        Returns:
+            pd.DataFrame: Columns 'date', 'realtime_start' and 'value'.
+        """
+        return pd.DataFrame({
+            'date': self.dates,
+            'realtime_start': self.realtime_start,
+            'value': self.values,
+        })
+
+    def as_of(self, as_of: Optional[DateLike] = None) -> pd.Series:
+        """
+        Reconstruct the series as it was published on a given date.
+
+        Args:
+            as_of (DateLike, optional): Vintage date. Defaults to the latest
+                vintage.
+
+        Returns:
+            pd.Series: Values known on as_of, indexed by observation date.
+                Observations not yet released on as_of are left out.
+        """
+        if as_of is None:
+            dates, values = self.dates, self.values
+        else:
+            known = self.realtime_start <= \
+                pd.Timestamp(as_of).to_datetime64()
+            dates, values = self.dates[known], self.values[known]
+        # Rows are sorted by vintage within each date, so the last row of
+        # each date holds the value in force
+        last = np.r_[dates[1:] != dates[:-1], True] if len(dates) else \
+            np.zeros(0, dtype=bool)
+        return pd.Series(
+            values[last], index=pd.DatetimeIndex(dates[last]),
+            name=self.series_id)
+
+    def merge(self, update: 'VintageHistory') -> 'VintageHistory':
+        """
+        Combine this history with rows downloaded later.
+
+        Args:
+            update (VintageHistory): History of the same series covering
+                recent vintages.
+
+        Returns:
+            VintageHistory: The compacted union, where update wins for rows
+                with the same date and vintage.
+        """
+        return VintageHistory.from_releases(
+            self.series_id, pd.concat([self.to_frame(), update.to_frame()]))
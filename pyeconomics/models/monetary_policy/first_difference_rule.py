@@ -5,7 +5,9 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from typing import Optional
 
-from pyeconomics.api import fetch_historical_fed_funds_rate, fred_client
+from pyeconomics.api import (
+    FED_FUNDS_RATE_SERIES_IDS, combine_fed_funds_rate, fred_client
+)
 from pyeconomics.data.economic_indicators import EconomicIndicators
 from pyeconomics.data.model_parameters import FirstDifferenceRuleParameters
 from pyeconomics.utils import verbose_first_difference_rule
@@ -127,15 +129,21 @@ def historical_first_difference_rule(
         pd.DataFrame: DataFrame with computed First Difference Rule rates.
     """
     try:
-        # Fetch historical data for all series
-        inflation = fred_client.fetch_data(indicators.inflation_series_id)
-        unemployment_rate = fred_client.fetch_data(
-            indicators.unemployment_rate_series_id)
+        # Fetch historical data for all series concurrently
+        series = fred_client.fetch_many([
+            indicators.inflation_series_id,
+            indicators.unemployment_rate_series_id,
+            indicators.natural_unemployment_series_id,
+            *FED_FUNDS_RATE_SERIES_IDS
+        ])
+        inflation = series[indicators.inflation_series_id]
+        unemployment_rate = series[indicators.unemployment_rate_series_id]
         lagged_unemployment_rate = unemployment_rate.shift(12)
-        natural_unemployment = fred_client.fetch_data(
-            indicators.natural_unemployment_series_id)
+        natural_unemployment = series[
+            indicators.natural_unemployment_series_id]
         lagged_natural_unemployment = natural_unemployment.shift(4)
-        fed_rate = fetch_historical_fed_funds_rate()
+        fed_rate = combine_fed_funds_rate(*(
+            series[series_id] for series_id in FED_FUNDS_RATE_SERIES_IDS))
 
         # Check for missing data
         if (inflation is None or
@@ -40,19 +40,23 @@ def print_fred_series_names(
     Returns:
         None
     """
+    info = fred_client.get_series_info_many([
+        inflation_series_id, unemployment_rate_series_id,
+        natural_unemployment_series_id, real_interest_rate_series_id])
+
     # Print the series names and their IDs
     print(
         f"Inflation Series ID:               "
-        f"{fred_client.get_series_name(inflation_series_id)}")
+        f"{info[inflation_series_id].title}")
     print(
         f"Unemployment Rate Series ID:       "
-        f"{fred_client.get_series_name(unemployment_rate_series_id)}")
+        f"{info[unemployment_rate_series_id].title}")
     print(
         f"Natural Unemployment Series ID:    "
-        f"{fred_client.get_series_name(natural_unemployment_series_id)}")
+        f"{info[natural_unemployment_series_id].title}")
     print(
         f"Real Interest Rate Series ID:      "
-        f"{fred_client.get_series_name(real_interest_rate_series_id)}")
+        f"{info[real_interest_rate_series_id].title}")
 
 
 def print_verbose_output(
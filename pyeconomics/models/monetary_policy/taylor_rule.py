@@ -4,7 +4,9 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from typing import Optional
 
-from pyeconomics.api import fetch_historical_fed_funds_rate, fred_client
+from pyeconomics.api import (
+    FED_FUNDS_RATE_SERIES_IDS, combine_fed_funds_rate, fred_client
+)
 from pyeconomics.data.economic_indicators import EconomicIndicators
 from pyeconomics.data.model_parameters import TaylorRuleParameters
 from pyeconomics.utils import verbose_taylor_rule
@@ -126,15 +128,20 @@ def historical_taylor_rule(
     Returns:
         pd.DataFrame: DataFrame with computed Taylor Rule rates.
     """
-    # Fetch historical data for all series
-    inflation = fred_client.fetch_data(indicators.inflation_series_id)
-    unemployment_rate = fred_client.fetch_data(
-        indicators.unemployment_rate_series_id)
-    natural_unemployment = fred_client.fetch_data(
-        indicators.natural_unemployment_series_id)
-    real_interest_rate = fred_client.fetch_data(
-        indicators.real_interest_rate_series_id)
-    fed_rate = fetch_historical_fed_funds_rate()
+    # Fetch historical data for all series concurrently
+    series = fred_client.fetch_many([
+        indicators.inflation_series_id,
+        indicators.unemployment_rate_series_id,
+        indicators.natural_unemployment_series_id,
+        indicators.real_interest_rate_series_id,
+        *FED_FUNDS_RATE_SERIES_IDS
+    ])
+    inflation = series[indicators.inflation_series_id]
+    unemployment_rate = series[indicators.unemployment_rate_series_id]
+    natural_unemployment = series[indicators.natural_unemployment_series_id]
+    real_interest_rate = series[indicators.real_interest_rate_series_id]
+    fed_rate = combine_fed_funds_rate(*(
+        series[series_id] for series_id in FED_FUNDS_RATE_SERIES_IDS))
 
     # Combine into a DataFrame
     data = pd.DataFrame({
@@ -42,6 +42,15 @@ setup(
     long_description_content_type='text/markdown',
     url='https://github.com/nathanramoscfa/pyeconomics',
     install_requires=required,
+    extras_require={
+        'parquet': ['pyarrow>=14'],
+        'async': ['aiohttp'],
+    },
+    entry_points={
+        'console_scripts': [
+            'pyeconomics-prefetch=pyeconomics.api.cache_warmup:main',
+        ],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
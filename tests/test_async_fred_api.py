@@ -0,0 +1,264 @@
+# tests/test_async_fred_api.py
+
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyeconomics.api.async_fred_api import AIOHTTP_AVAILABLE, AsyncFredClient
+from pyeconomics.api.cache_backends import MemoryCacheBackend
+
+pytestmark = pytest.mark.skipif(
+    not AIOHTTP_AVAILABLE, reason="aiohttp is not installed")
+
+OBSERVATIONS = {
+    'UNRATE': [('2024-01-01', '3.7'), ('2024-02-01', '3.9'),
+               ('2024-03-01', '.')],
+    'NROU': [('2024-01-01', '4.4'), ('2024-04-01', '4.4')],
+    'EMPTY': [],
+}
+
+
+class FredStandIn(BaseHTTPRequestHandler):
+    """Serves the FRED observations and series endpoints from
+    OBSERVATIONS."""
+
+    requests = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+    delay = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append((url.path, query))
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            time.sleep(cls.delay)
+            series_id = query.get('series_id')
+            if query.get('api_key') != 'test-key':
+                self._reply(400, {'error_message': 'Bad Request. The value '
+                                  'for variable api_key is not registered.'})
+            elif series_id not in OBSERVATIONS:
+                self._reply(400, {'error_message': 'Bad Request. The series '
+                                  'does not exist.'})
+            elif url.path.endswith('/series/observations'):
+                self._reply(200, {'observations': [
+                    {'date': date, 'value': value}
+                    for date, value in OBSERVATIONS[series_id]]})
+            else:
+                self._reply(200, {'seriess': [
+                    {'id': series_id, 'title': f"{series_id} title"}]})
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fred_server():
+    FredStandIn.requests = []
+    FredStandIn.active = FredStandIn.max_active = 0
+    FredStandIn.delay = 0.0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FredStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/fred"
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(root_url, **kwargs):
+    return AsyncFredClient(
+        api_key='test-key', cache_backend=MemoryCacheBackend(),
+        root_url=root_url, **kwargs)
+
+
+def observation_requests():
+    return [query['series_id'] for path, query in FredStandIn.requests
+            if path.endswith('/series/observations')]
+
+
+def test_fetch_data_parses_observations(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            return await client.fetch_data('UNRATE')
+
+    data = asyncio.run(run())
+
+    assert list(data.index) == list(pd.to_datetime(
+        ['2024-01-01', '2024-02-01', '2024-03-01']))
+    assert data.iloc[:2].tolist() == [3.7, 3.9]
+    assert np.isnan(data.iloc[2])
+
+
+def test_fetch_data_uses_cache(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            first = await client.fetch_data('UNRATE')
+            second = await client.fetch_data('UNRATE')
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    pd.testing.assert_series_equal(first, second)
+    assert observation_requests() == ['UNRATE']
+
+
+def test_fetch_data_coalesces_concurrent_requests(fred_server):
+    FredStandIn.delay = 0.1
+
+    async def run():
+        async with make_client(fred_server) as client:
+            return await asyncio.gather(
+                *(client.fetch_data('UNRATE') for _ in range(4)))
+
+    results = asyncio.run(run())
+
+    assert len(results) == 4
+    assert observation_requests() == ['UNRATE']
+
+
+def test_fetch_data_waiters_do_not_hold_executor_threads(fred_server):
+    FredStandIn.delay = 0.1
+    backend = MemoryCacheBackend()
+
+    async def run():
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=1))
+        clients = [
+            AsyncFredClient(api_key='test-key', cache_backend=backend,
+                            root_url=fred_server)
+            for _ in range(3)]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*(
+                client.fetch_data('UNRATE')
+                for client in clients for _ in range(3))), timeout=10)
+        finally:
+            for client in clients:
+                await client.close()
+
+    results = asyncio.run(run())
+
+    assert len(results) == 9
+    assert observation_requests() == ['UNRATE']
+    results[0].iloc[0] = -1.0
+    assert results[1].iloc[0] == 3.7
+
+
+def test_fetch_data_no_data(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            await client.fetch_data('EMPTY')
+
+    with pytest.raises(ValueError, match="No data found for series ID EMPTY"):
+        asyncio.run(run())
+
+
+def test_fetch_data_reports_fred_errors(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            await client.fetch_data('MISSING')
+
+    with pytest.raises(ValueError, match="series does not exist"):
+        asyncio.run(run())
+
+
+def test_fetch_many_bounds_concurrency(fred_server):
+    FredStandIn.delay = 0.05
+    OBSERVATIONS.update(
+        {f"S{i}": [('2024-01-01', str(i))] for i in range(6)})
+
+    async def run():
+        async with make_client(fred_server, max_concurrency=2) as client:
+            return await client.fetch_many(
+                [f"S{i}" for i in range(6)], as_frame=True)
+
+    try:
+        frame = asyncio.run(run())
+    finally:
+        for i in range(6):
+            OBSERVATIONS.pop(f"S{i}")
+
+    assert list(frame.columns) == [f"S{i}" for i in range(6)]
+    assert frame.iloc[0].tolist() == [float(i) for i in range(6)]
+    assert FredStandIn.max_active <= 2
+
+
+def test_fetch_many_returns_dict_in_order(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            return await client.fetch_many(['NROU', 'UNRATE', 'NROU'])
+
+    results = asyncio.run(run())
+
+    assert list(results) == ['NROU', 'UNRATE']
+    assert results['NROU'].tolist() == [4.4, 4.4]
+
+
+def test_get_latest_value(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            return await client.get_latest_value('NROU')
+
+    assert asyncio.run(run()) == 4.4
+
+
+def test_get_series_name(fred_server):
+    async def run():
+        async with make_client(fred_server) as client:
+            return await client.get_series_name('UNRATE')
+
+    assert asyncio.run(run()) == 'UNRATE title'
+
+
+def test_shares_cache_with_other_clients(fred_server):
+    backend = MemoryCacheBackend()
+
+    async def run():
+        for _ in range(2):
+            async with AsyncFredClient(
+                api_key='test-key', cache_backend=backend,
+                root_url=fred_server
+            ) as client:
+                await client.fetch_data('UNRATE')
+
+    asyncio.run(run())
+
+    assert observation_requests() == ['UNRATE']
+    assert backend.get('fred_series_UNRATE') is not None
+
+
+def test_package_import_does_not_load_aiohttp():
+    result = subprocess.run(
+        [sys.executable, '-c',
+         "import sys, pyeconomics; assert 'aiohttp' not in sys.modules"],
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -101,17 +101,18 @@ def test_balanced_approach_rule(mock_fred_client, mock_fred_data):
 @patch('pyeconomics.models.monetary_policy.balanced_approach_rule.fred_client')
 @patch(
     'pyeconomics.models.monetary_policy.'
-    'balanced_approach_rule.fetch_historical_fed_funds_rate'
+    'balanced_approach_rule.combine_fed_funds_rate'
 )
 def test_historical_balanced_approach_rule(
-    mock_fetch_historical_fed_funds_rate,
+    mock_combine_fed_funds_rate,
     mock_fred_client,
     mock_fred_data
 ):
-    mock_fred_client.fetch_data.side_effect = (
-        lambda series_id: pd.Series([mock_fred_data[series_id]] * 10)
-    )
-    mock_fetch_historical_fed_funds_rate.return_value = (
+    mock_fred_client.fetch_many.side_effect = lambda series_ids: {
+        series_id: pd.Series([mock_fred_data.get(series_id)] * 10)
+        for series_id in series_ids
+    }
+    mock_combine_fed_funds_rate.return_value = (
         pd.Series([mock_fred_data['current_fed_rate']] * 10)
     )
 
@@ -0,0 +1,103 @@
+# tests/test_cache_backends.py
+
+import os
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api.cache_backends import (
+    CacheBackend, FilesystemCacheBackend, MemoryCacheBackend,
+    SQLiteCacheBackend, get_cache_backend
+)
+
+
+@pytest.fixture(params=['filesystem', 'memory', 'sqlite'])
+def backend(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    cache_manager.clear_memory_cache()
+    backend = get_cache_backend(request.param)
+    yield backend
+    cache_manager.clear_memory_cache()
+    if isinstance(backend, SQLiteCacheBackend):
+        backend.cache.close()
+
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range('2000-01-01', periods=100, freq='D')
+    return pd.Series(np.linspace(0.0, 1.0, len(index)), index=index)
+
+
+def test_put_and_get(backend, daily_series):
+    backend.put('test_series', daily_series)
+    pd.testing.assert_series_equal(
+        backend.get('test_series'), daily_series, check_freq=False)
+    assert backend.get('missing') is None
+
+
+def test_get_date_range(backend, daily_series):
+    backend.put('test_series', daily_series)
+    result = backend.get('test_series', start='2000-02-01', end='2000-02-10')
+    assert len(result) == 10
+    assert result.index[0] == pd.Timestamp('2000-02-01')
+
+
+def test_put_many_and_get_many(backend):
+    backend.put_many({'a': 1, 'b': 2})
+    assert backend.get_many(['a', 'b', 'c']) == {'a': 1, 'b': 2}
+
+
+def test_invalidate(backend):
+    backend.put('a', 1)
+    backend.invalidate('a')
+    assert backend.get('a') is None
+    backend.invalidate('missing')
+
+
+def test_stats(backend):
+    backend.put_many({'a': 1, 'b': 2})
+    stats = backend.stats()
+    assert stats['entries'] == 2
+    assert stats['total_bytes'] > 0
+
+
+def test_lock(backend):
+    with backend.lock('a'):
+        backend.put('a', 1)
+    assert backend.get('a', expiry=timedelta(hours=1)) == 1
+
+
+def test_get_cache_backend_by_name():
+    assert isinstance(get_cache_backend('filesystem'), FilesystemCacheBackend)
+    assert isinstance(get_cache_backend('Memory'), MemoryCacheBackend)
+    backend = MemoryCacheBackend()
+    assert get_cache_backend(backend) is backend
+    with pytest.raises(ValueError, match='Unknown cache backend'):
+        get_cache_backend('redis')
+
+
+def test_get_cache_backend_from_environment(monkeypatch):
+    monkeypatch.setenv('PYECONOMICS_CACHE_BACKEND', 'memory')
+    assert isinstance(get_cache_backend(), MemoryCacheBackend)
+    monkeypatch.delenv('PYECONOMICS_CACHE_BACKEND')
+    assert isinstance(get_cache_backend(), FilesystemCacheBackend)
+
+
+def test_base_backend_not_implemented():
+    with pytest.raises(NotImplementedError):
+        CacheBackend().get('a')
+
+
+def test_remove_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    cache_manager.save_to_cache('a', 1)
+    cache_manager.remove_from_cache('a')
+    assert not os.path.exists(cache_manager.cache_filename('a'))
+    assert cache_manager.cache_usage().entries == 0
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,104 @@
+# tests/test_cache_codecs.py
+
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api import cache_integrity
+from pyeconomics.api.cache_backends import (
+    FilesystemCacheBackend, SQLiteCacheBackend
+)
+from pyeconomics.api.cache_codecs import (
+    CODECS, NO_CODEC, check_codec, compress, decompress
+)
+from pyeconomics.api.cache_integrity import seal, unseal
+
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range('2000-01-01', periods=2000, freq='D')
+    return pd.Series(np.round(np.linspace(0.0, 5.0, len(index)), 2),
+                     index=index, name='DFII10')
+
+
+@pytest.fixture
+def pickle_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(cache_manager, 'SERIES_FORMAT', 'pickle')
+    cache_manager.clear_memory_cache()
+    yield
+    cache_manager.clear_memory_cache()
+
+
+@pytest.mark.parametrize('codec', list(CODECS))
+def test_round_trip(codec, daily_series):
+    data = pickle.dumps(daily_series)
+    identifier, payload = compress(data, codec)
+    assert len(payload) < len(data)
+    assert decompress(identifier, payload) == data
+    assert unseal(seal(data, codec)) == data
+
+
+def test_none_leaves_data_unchanged():
+    data = pickle.dumps([1, 2, 3])
+    assert compress(data, 'none') == (NO_CODEC, data)
+    assert decompress(NO_CODEC, data) == data
+
+
+def test_sealed_entry_has_one_header(daily_series):
+    data = pickle.dumps(daily_series)
+    identifier, payload = compress(data, 'zlib')
+    sealed = seal(data, 'zlib')
+    assert sealed.endswith(payload)
+    assert len(sealed) - len(payload) == cache_integrity._HEADER.size
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="Unknown cache codec 'zstd'"):
+        check_codec('zstd')
+
+
+@pytest.mark.parametrize('codec', list(CODECS))
+def test_save_to_cache_compressed(codec, daily_series, pickle_cache):
+    cache_manager.save_to_cache('plain', daily_series, codec='none')
+    cache_manager.save_to_cache('packed', daily_series, codec=codec)
+    assert os.path.getsize(cache_manager.cache_filename('packed')) < \
+        os.path.getsize(cache_manager.cache_filename('plain'))
+
+    cache_manager.clear_memory_cache()
+    pd.testing.assert_series_equal(
+        cache_manager.load_from_cache('packed'), daily_series)
+    pd.testing.assert_series_equal(
+        cache_manager.load_from_cache(
+            'packed', start='2001-01-01', end='2001-01-31'),
+        daily_series['2001-01-01':'2001-01-31'])
+
+
+def test_filesystem_backend_codec(daily_series, pickle_cache):
+    backend = FilesystemCacheBackend(codec='lzma')
+    backend.put('series', daily_series)
+    assert os.path.getsize(cache_manager.cache_filename('series')) < \
+        len(pickle.dumps(daily_series))
+    cache_manager.clear_memory_cache()
+    pd.testing.assert_series_equal(backend.get('series'), daily_series)
+
+
+def test_sqlite_backend_codec(tmp_path, daily_series):
+    plain = SQLiteCacheBackend(str(tmp_path / 'plain.sqlite3'))
+    packed = SQLiteCacheBackend(str(tmp_path / 'packed.sqlite3'), codec='bz2')
+    try:
+        plain.put('series', daily_series)
+        packed.put('series', daily_series)
+        assert packed.stats()['total_bytes'] < plain.stats()['total_bytes']
+        pd.testing.assert_series_equal(packed.get('series'), daily_series)
+    finally:
+        plain.cache.close()
+        packed.cache.close()
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,80 @@
+# tests/test_cache_expiry.py
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from pyeconomics.api.cache_expiry import (
+    CacheExpiryPolicy, ReleaseCutoff, infer_frequency, is_expired, with_grace
+)
+
+NEW_YORK = ZoneInfo('America/New_York')
+
+
+def timestamp(*args) -> float:
+    return datetime(*args, tzinfo=NEW_YORK).timestamp()
+
+
+def test_release_cutoff_same_day():
+    saved_at = timestamp(2024, 6, 3, 10, 30)
+    assert ReleaseCutoff().expires_at(saved_at) == timestamp(2024, 6, 3, 16)
+
+
+def test_release_cutoff_next_day():
+    saved_at = timestamp(2024, 6, 3, 16, 0)
+    assert ReleaseCutoff().expires_at(saved_at) == timestamp(2024, 6, 4, 16)
+
+
+def test_release_cutoff_across_dst_change():
+    saved_at = timestamp(2024, 3, 9, 17, 0)
+    assert ReleaseCutoff().expires_at(saved_at) == timestamp(2024, 3, 10, 16)
+
+
+def test_is_expired_timedelta():
+    assert not is_expired(timedelta(days=1), saved_at=0, now=3600)
+    assert is_expired(timedelta(hours=1), saved_at=0, now=3600)
+
+
+def test_is_expired_release_cutoff():
+    saved_at = timestamp(2024, 6, 3, 15, 0)
+    cutoff = ReleaseCutoff()
+    assert not is_expired(cutoff, saved_at, now=timestamp(2024, 6, 3, 15, 59))
+    assert is_expired(cutoff, saved_at, now=timestamp(2024, 6, 3, 16, 0))
+
+
+def test_with_grace():
+    assert with_grace(timedelta(days=7), timedelta(days=7)) == \
+        timedelta(days=14)
+    saved_at = timestamp(2024, 6, 3, 15, 0)
+    cutoff = with_grace(ReleaseCutoff(), timedelta(hours=1))
+    assert not is_expired(cutoff, saved_at, now=timestamp(2024, 6, 3, 16, 59))
+    assert is_expired(cutoff, saved_at, now=timestamp(2024, 6, 3, 17, 0))
+
+
+def test_expiry_policy_lookup():
+    policy = CacheExpiryPolicy(overrides={'NROU': timedelta(days=30)})
+    assert policy.expiry_for('NROU', 'Q') == timedelta(days=30)
+    assert policy.expiry_for('GDPC1', 'Q') == timedelta(days=7)
+    assert policy.expiry_for('DFII10', 'D') == ReleaseCutoff()
+    assert policy.expiry_for('UNKNOWN') == timedelta(days=1)
+
+
+@pytest.mark.parametrize('freq, expected', [
+    ('D', 'D'), ('B', 'D'), ('W-FRI', 'W'), ('MS', 'M'), ('QS', 'Q'),
+    ('YS', 'A'),
+])
+def test_infer_frequency(freq, expected):
+    index = pd.date_range('2000-01-01', periods=60, freq=freq)
+    assert infer_frequency(pd.Series(1.0, index=index)) == expected
+
+
+def test_infer_frequency_unknown():
+    assert infer_frequency(pd.Series([1.0, 2.0])) is None
+    assert infer_frequency(
+        pd.Series([1.0], index=pd.DatetimeIndex(['2000-01-01']))) is None
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,129 @@
+# tests/test_cache_integrity.py
+
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api import cache_info, reset_cache_info
+from pyeconomics.api.cache_integrity import (
+    CorruptCacheEntryError, seal, unseal
+)
+from pyeconomics.api.mmap_store import MMAP_EXTENSION
+from pyeconomics.api.series_store import PYARROW_AVAILABLE, SERIES_EXTENSION
+from pyeconomics.api.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    cache_manager.clear_memory_cache()
+    reset_cache_info()
+    yield
+    cache_manager.clear_memory_cache()
+    reset_cache_info()
+
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range('2000-01-01', periods=5000, freq='D')
+    return pd.Series(np.linspace(0.0, 5.0, len(index)), index=index)
+
+
+def truncate(filename):
+    with open(filename, 'r+b') as f:
+        f.truncate(os.path.getsize(filename) // 2)
+
+
+def flip_byte(filename, offset=-10):
+    with open(filename, 'r+b') as f:
+        f.seek(offset, os.SEEK_END)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+
+def test_seal_round_trip():
+    assert unseal(seal(b'payload')) == b'payload'
+    assert unseal(b'legacy') == b'legacy'
+
+
+def test_unseal_detects_corruption():
+    sealed = bytearray(seal(b'payload'))
+    sealed[-1] ^= 0xFF
+    with pytest.raises(CorruptCacheEntryError, match='checksum'):
+        unseal(bytes(sealed))
+    with pytest.raises(CorruptCacheEntryError, match='Truncated'):
+        unseal(seal(b'payload')[:6])
+
+
+def test_unseal_rejects_other_format_version():
+    sealed = bytearray(seal(b'payload'))
+    sealed[4] = 99
+    with pytest.raises(CorruptCacheEntryError, match='version 99'):
+        unseal(bytes(sealed))
+
+
+@pytest.mark.parametrize('damage', [truncate, flip_byte])
+def test_corrupt_pickle_is_a_miss(damage, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'SERIES_FORMAT', 'pickle')
+    cache_manager.save_to_cache('key', {'value': list(range(100))})
+    filename = cache_manager.cache_filename('key')
+    damage(filename)
+    cache_manager.clear_memory_cache()
+
+    assert cache_manager.load_from_cache('key') is None
+    assert not os.path.exists(filename)
+    assert cache_manager.cache_usage().entries == 0
+    info = cache_info()
+    assert (info.misses, info.corruptions) == (1, 1)
+
+    cache_manager.save_to_cache('key', {'value': 1})
+    assert cache_manager.load_from_cache('key') == {'value': 1}
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason='pyarrow not installed')
+def test_corrupt_parquet_is_a_miss(daily_series, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'SERIES_FORMAT', 'parquet')
+    cache_manager.save_to_cache('series', daily_series)
+    filename = cache_manager.cache_filename('series', SERIES_EXTENSION)
+    truncate(filename)
+    cache_manager.clear_memory_cache()
+
+    assert cache_manager.load_from_cache('series') is None
+    assert not os.path.exists(filename)
+    assert cache_info().corruptions == 1
+
+
+def test_truncated_mmap_is_a_miss(daily_series, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'SERIES_FORMAT', 'mmap')
+    cache_manager.save_to_cache('series', daily_series)
+    filename = cache_manager.cache_filename('series', MMAP_EXTENSION)
+    truncate(filename)
+    cache_manager.clear_memory_cache()
+
+    assert cache_manager.load_from_cache('series') is None
+    assert cache_info().corruptions == 1
+
+
+def test_sqlite_corrupt_entry_is_deleted(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    cache = SQLiteCache(path)
+    try:
+        cache.save_many({'good': 1, 'bad': 2})
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "UPDATE entries SET data = substr(data, 1, 8) "
+                "WHERE key = 'bad'")
+        assert cache.load_many(['good', 'bad']) == {'good': 1}
+        assert cache.usage()['entries'] == 1
+        assert cache_info().corruptions == 1
+    finally:
+        cache.close()
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -2,13 +2,16 @@
 
 import os
 import shutil
+import time
 from datetime import datetime, timedelta
 from hashlib import sha256
 
 import pytest
 
+import pyeconomics.api.cache_manager as cache_manager
 from pyeconomics.api.cache_manager import (
-    CACHE_DIR, cache_filename, save_to_cache, load_from_cache
+    CACHE_DIR, INDEX_FILENAME, cache_filename, cache_usage,
+    clear_memory_cache, prune, save_to_cache, load_from_cache
 )
 
 
@@ -18,6 +21,7 @@ def setup_and_teardown():
     # Ensure the cache directory exists before each test
     if not os.path.exists(CACHE_DIR):
         os.makedirs(CACHE_DIR)
+    clear_memory_cache()
     yield
     # Cleanup after test
     if os.path.exists(CACHE_DIR):
@@ -67,6 +71,66 @@ def test_load_from_cache_nonexistent_key():
     assert loaded_data is None
 
 
+def test_cache_usage():
+    save_to_cache('key_a', {'value': 1})
+    save_to_cache('key_b', list(range(1000)))
+    usage = cache_usage()
+    assert usage.entries == 2
+    assert usage.total_bytes == (
+        os.path.getsize(cache_filename('key_a')) +
+        os.path.getsize(cache_filename('key_b')))
+
+
+def test_cache_usage_rebuilds_missing_index():
+    save_to_cache('key_a', {'value': 1})
+    save_to_cache('key_b', {'value': 2})
+    os.remove(os.path.join(CACHE_DIR, INDEX_FILENAME))
+    assert cache_usage().entries == 2
+
+
+def test_prune_evicts_least_recently_used():
+    for key in ('key_a', 'key_b', 'key_c'):
+        save_to_cache(key, list(range(1000)))
+        time.sleep(0.01)
+    load_from_cache('key_a')
+    entry_size = os.path.getsize(cache_filename('key_a'))
+
+    removed = prune(max_bytes=entry_size * 2)
+
+    assert removed == ['key_b']
+    assert not os.path.exists(cache_filename('key_b'))
+    assert load_from_cache('key_a') is not None
+    assert load_from_cache('key_c') is not None
+    assert cache_usage().entries == 2
+
+
+def test_prune_removes_old_entries():
+    save_to_cache('old_key', {'value': 1})
+    time.sleep(0.5)
+    save_to_cache('new_key', {'value': 2})
+
+    removed = prune(max_age=timedelta(seconds=0.25))
+
+    assert removed == ['old_key']
+    assert not os.path.exists(cache_filename('old_key'))
+    assert os.path.exists(cache_filename('new_key'))
+
+
+def test_save_to_cache_enforces_max_bytes(monkeypatch):
+    save_to_cache('key_a', list(range(1000)))
+    entry_size = os.path.getsize(cache_filename('key_a'))
+    monkeypatch.setattr(cache_manager, 'MAX_CACHE_BYTES', entry_size * 2)
+    for key in ('key_b', 'key_c', 'key_d'):
+        time.sleep(0.01)
+        save_to_cache(key, list(range(1000)))
+
+    usage = cache_usage()
+    assert usage.entries == 2
+    assert usage.total_bytes <= entry_size * 2
+    assert not os.path.exists(cache_filename('key_a'))
+    assert os.path.exists(cache_filename('key_d'))
+
+
 def test_cache_directory_creation():
     # Ensure the directory exists before running the test
     if not os.path.exists(CACHE_DIR):
@@ -0,0 +1,98 @@
+# tests/test_cache_stats.py
+
+import os
+import time
+
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api import cache_info, reset_cache_info
+from pyeconomics.api.cache_backends import MemoryCacheBackend
+from pyeconomics.api.cache_stats import LatencyHistogram
+from pyeconomics.api.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture(autouse=True)
+def clean_stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    cache_manager.clear_memory_cache()
+    reset_cache_info()
+    yield
+    cache_manager.clear_memory_cache()
+    reset_cache_info()
+
+
+def test_filesystem_counters():
+    cache_manager.save_to_cache('a', {'value': 1})
+    size = os.path.getsize(cache_manager.cache_filename('a'))
+    assert cache_manager.load_from_cache('missing') is None
+    assert cache_manager.load_from_cache('a') == {'value': 1}
+    assert cache_manager.load_from_cache('a') == {'value': 1}
+
+    info = cache_info()
+    assert info.hits == 2
+    assert info.memory_hits == 1
+    assert info.misses == 1
+    assert info.expirations == 0
+    assert info.bytes_written == size
+    assert info.bytes_read == size
+    assert info.hit_ratio == pytest.approx(2 / 3)
+    assert info.load_latency.count == 3
+    assert info.save_latency.count == 1
+
+
+def test_filesystem_expiration():
+    cache_manager.save_to_cache('a', 1)
+    old = time.time() - 2 * 86400
+    os.utime(cache_manager.cache_filename('a'), (old, old))
+    assert cache_manager.load_from_cache('a') is None
+    info = cache_info()
+    assert info.misses == 1
+    assert info.expirations == 1
+
+
+def test_sqlite_counters(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.sqlite3'))
+    try:
+        cache.save_many({'a': 1, 'b': 2})
+        cache.load_many(['a', 'b', 'c'])
+    finally:
+        cache.close()
+    info = cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+    assert info.bytes_read == info.bytes_written > 0
+
+
+def test_memory_backend_counters():
+    backend = MemoryCacheBackend()
+    backend.put('a', 1)
+    backend.get('a')
+    backend.get('b')
+    info = cache_info()
+    assert (info.hits, info.memory_hits, info.misses) == (1, 1, 1)
+
+
+def test_cache_info_is_a_snapshot():
+    info = cache_info()
+    cache_manager.load_from_cache('missing')
+    assert info.misses == 0
+    assert cache_info().misses == 1
+    reset_cache_info()
+    assert cache_info().misses == 0
+    assert cache_info().hit_ratio == 0.0
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    histogram.observe(0.00005)
+    histogram.observe(0.002)
+    histogram.observe(5.0)
+    assert histogram.counts[0] == 1
+    assert histogram.counts[3] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.count == 3
+    assert histogram.mean == pytest.approx(5.00205 / 3)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,74 @@
+# tests/test_cache_warmup.py
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pyeconomics.api.cache_warmup import main, prefetch, required_series
+from pyeconomics.data.economic_indicators import EconomicIndicators
+
+
+def test_required_series_defaults():
+    assert required_series() == [
+        'PCETRIM12M159SFRBDAL', 'UNRATE', 'NROU', 'DFII10',
+        'DFEDTAR', 'DFEDTARU']
+
+
+def test_required_series_custom_indicators():
+    indicators = EconomicIndicators(
+        inflation_series_id='CPIAUCSL', real_interest_rate_series_id='UNRATE')
+    assert required_series(indicators) == [
+        'CPIAUCSL', 'UNRATE', 'NROU', 'DFEDTAR', 'DFEDTARU']
+
+
+def test_prefetch_fetches_every_series():
+    client = MagicMock()
+    client.fetch_data.return_value = pd.Series([1.0])
+
+    results = prefetch(client=client)
+
+    assert results == {series_id: None for series_id in required_series()}
+    assert sorted(call.args[0] for call in client.fetch_data.call_args_list) \
+        == sorted(required_series())
+
+
+def test_prefetch_reports_failures():
+    error = ValueError("No data found for series ID BAD")
+
+    def fetch_data(series_id):
+        if series_id == 'BAD':
+            raise error
+        return pd.Series([1.0])
+
+    client = MagicMock()
+    client.fetch_data.side_effect = fetch_data
+
+    results = prefetch(['GDP', 'BAD', 'GDP'], client=client)
+
+    assert results == {'GDP': None, 'BAD': error}
+    assert client.fetch_data.call_count == 2
+
+
+def test_main(monkeypatch, capsys):
+    prefetched = {}
+
+    def fake_prefetch(series_ids, max_workers):
+        prefetched['series_ids'] = series_ids
+        prefetched['max_workers'] = max_workers
+        return {series_id: None for series_id in series_ids}
+
+    monkeypatch.setattr('pyeconomics.api.cache_warmup.prefetch', fake_prefetch)
+
+    status = main(['GDP', '--inflation-series-id', 'CPIAUCSL',
+                   '--max-workers', '2'])
+
+    assert status == 0
+    assert prefetched['series_ids'][0] == 'CPIAUCSL'
+    assert prefetched['series_ids'][-1] == 'GDP'
+    assert prefetched['max_workers'] == 2
+    assert 'CPIAUCSL' in capsys.readouterr().out
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,158 @@
+# tests/test_file_lock.py
+
+import multiprocessing
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api.file_lock import FileLock
+
+PROCESSES = 8
+ITERATIONS = 25
+SERIES_LENGTH = 20000
+
+
+def make_series(fill: float) -> pd.Series:
+    index = pd.date_range('1950-01-01', periods=SERIES_LENGTH, freq='D')
+    return pd.Series(np.full(SERIES_LENGTH, fill), index=index)
+
+
+def fetch_worker(cache_dir: str, fetch_log: str, results) -> None:
+    """Check the cache under the key lock and 'fetch' the series on a miss."""
+    cache_manager.CACHE_DIR = cache_dir
+    cache_manager.memory_cache.max_entries = 0
+    for _ in range(ITERATIONS):
+        try:
+            data = cache_manager.load_from_cache('hammered_key')
+            if data is None:
+                with cache_manager.cache_lock('hammered_key'):
+                    data = cache_manager.load_from_cache('hammered_key')
+                    if data is None:
+                        with open(fetch_log, 'a') as f:
+                            f.write(f'{os.getpid()}\n')
+                        data = make_series(1.0)
+                        cache_manager.save_to_cache('hammered_key', data)
+            results.put(len(data))
+        except Exception as e:
+            results.put(repr(e))
+
+
+def write_worker(cache_dir: str, fill: float) -> None:
+    """Repeatedly overwrite one entry with a complete series."""
+    cache_manager.CACHE_DIR = cache_dir
+    for _ in range(ITERATIONS):
+        cache_manager.save_to_cache('hammered_key', make_series(fill))
+
+
+def read_worker(cache_dir: str, results) -> None:
+    """Repeatedly read one entry while other processes overwrite it."""
+    cache_manager.CACHE_DIR = cache_dir
+    cache_manager.memory_cache.max_entries = 0
+    for _ in range(ITERATIONS * 4):
+        try:
+            data = cache_manager.load_from_cache('hammered_key')
+            results.put((len(data), data.nunique()))
+        except Exception as e:
+            results.put(repr(e))
+
+
+def test_lock_excludes_other_instances(tmp_path):
+    path = str(tmp_path / 'test.lock')
+    first = FileLock(path)
+    second = FileLock(path)
+    assert first.acquire()
+    assert not second.acquire(timeout=0.05)
+    first.release()
+    assert second.acquire(timeout=0.05)
+    second.release()
+
+
+def test_lock_context_manager(tmp_path):
+    lock = FileLock(str(tmp_path / 'test.lock'))
+    with lock:
+        assert lock.is_locked
+    assert not lock.is_locked
+
+
+def test_lock_already_held(tmp_path):
+    lock = FileLock(str(tmp_path / 'test.lock'))
+    with lock:
+        with pytest.raises(RuntimeError):
+            lock.acquire()
+
+
+def test_lock_between_threads(tmp_path):
+    path = str(tmp_path / 'test.lock')
+    events = []
+
+    def worker(name):
+        with FileLock(path):
+            events.append(f'{name} start')
+            time.sleep(0.02)
+            events.append(f'{name} end')
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for i in range(0, len(events), 2):
+        assert events[i].split()[0] == events[i + 1].split()[0]
+
+
+def test_only_one_process_fetches(tmp_path):
+    fetch_log = str(tmp_path / 'fetches.log')
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=fetch_worker, args=(str(tmp_path), fetch_log, results))
+        for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    lengths = [results.get(timeout=60)
+               for _ in range(PROCESSES * ITERATIONS)]
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    with open(fetch_log) as f:
+        assert len(f.readlines()) == 1
+    assert set(lengths) == {SERIES_LENGTH}
+
+
+def test_readers_never_see_partial_writes(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    cache_manager.save_to_cache('hammered_key', make_series(0.0))
+
+    results = multiprocessing.Queue()
+    writers = [
+        multiprocessing.Process(
+            target=write_worker, args=(str(tmp_path), float(i)))
+        for i in range(PROCESSES // 2)
+    ]
+    readers = [
+        multiprocessing.Process(
+            target=read_worker, args=(str(tmp_path), results))
+        for _ in range(PROCESSES // 2)
+    ]
+    for process in writers + readers:
+        process.start()
+    observed = [results.get(timeout=60)
+                for _ in range(len(readers) * ITERATIONS * 4)]
+    for process in writers + readers:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    assert set(observed) == {(SERIES_LENGTH, 1)}
+    assert not [name for name in os.listdir(tmp_path)
+                if name.endswith('.tmp')]
+
+
+if __name__ == '__main__':
+    pytest.main()
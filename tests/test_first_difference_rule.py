@@ -20,6 +20,12 @@ def mock_fred_client():
         yield mock_fetch_data
 
 
+@pytest.fixture
+def mock_fetch_many():
+    with patch.object(FredClient, 'fetch_many') as mock_fetch_many:
+        yield mock_fetch_many
+
+
 @pytest.fixture
 def sample_fred_data():
     data = {
@@ -79,8 +85,9 @@ def test_first_difference_rule(mock_fred_client, sample_fred_data):
     assert rate == 3.4  # Adjusted expected value based on actual calculation
 
 
-def test_historical_first_difference_rule(mock_fred_client, sample_fred_data):
-    mock_fred_client.side_effect = lambda series_id: sample_fred_data
+def test_historical_first_difference_rule(mock_fetch_many, sample_fred_data):
+    mock_fetch_many.side_effect = (
+        lambda series_ids: dict.fromkeys(series_ids, sample_fred_data))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -111,12 +118,12 @@ def test_historical_first_difference_rule(mock_fred_client, sample_fred_data):
 
 
 def test_historical_first_difference_rule_missing_data(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = [
+    mock_fetch_many.side_effect = lambda series_ids: dict(zip(series_ids, [
         sample_fred_data, sample_fred_data, sample_fred_data,
         sample_fred_data, pd.Series()
-    ]
+    ]))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -190,9 +197,10 @@ def test_first_difference_rule_value_error(mock_fred_client, sample_fred_data):
 
 
 def test_historical_first_difference_rule_exception(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = lambda series_id: None
+    mock_fetch_many.side_effect = (
+        lambda series_ids: dict.fromkeys(series_ids, None))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -213,9 +221,10 @@ def test_historical_first_difference_rule_exception(
 
 
 def test_historical_first_difference_rule_apply_elb(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = lambda series_id: sample_fred_data
+    mock_fetch_many.side_effect = (
+        lambda series_ids: dict.fromkeys(series_ids, sample_fred_data))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -240,13 +249,13 @@ def test_historical_first_difference_rule_apply_elb(
 
 
 def test_historical_first_difference_rule_partial_data(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
     # Mock to return partial data (None for one series)
-    mock_fred_client.side_effect = [
+    mock_fetch_many.side_effect = lambda series_ids: dict(zip(series_ids, [
         sample_fred_data, sample_fred_data, sample_fred_data, None,
         sample_fred_data
-    ]
+    ]))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -267,10 +276,11 @@ def test_historical_first_difference_rule_partial_data(
 
 
 def test_historical_first_difference_rule_apply_elb_lambda(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
     # Mock to return full data
-    mock_fred_client.side_effect = lambda series_id: sample_fred_data
+    mock_fetch_many.side_effect = (
+        lambda series_ids: dict.fromkeys(series_ids, sample_fred_data))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -315,12 +325,12 @@ def test_plot_historical_fdr(mock_show):
 
 
 def test_historical_first_difference_rule_missing_inflation_data(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = [
+    mock_fetch_many.side_effect = lambda series_ids: dict(zip(series_ids, [
         None, sample_fred_data, sample_fred_data,
         sample_fred_data, sample_fred_data
-    ]
+    ]))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -341,12 +351,12 @@ def test_historical_first_difference_rule_missing_inflation_data(
 
 
 def test_historical_first_difference_rule_missing_unemployment_data(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = [
+    mock_fetch_many.side_effect = lambda series_ids: dict(zip(series_ids, [
         sample_fred_data, None, sample_fred_data,
         sample_fred_data, sample_fred_data
-    ]
+    ]))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -367,12 +377,12 @@ def test_historical_first_difference_rule_missing_unemployment_data(
 
 
 def test_historical_first_difference_rule_missing_natural_unemployment_data(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = [
+    mock_fetch_many.side_effect = lambda series_ids: dict(zip(series_ids, [
         sample_fred_data, sample_fred_data, None,
         sample_fred_data, sample_fred_data
-    ]
+    ]))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
@@ -393,12 +403,12 @@ def test_historical_first_difference_rule_missing_natural_unemployment_data(
 
 
 def test_historical_first_difference_rule_missing_fed_rate_data(
-    mock_fred_client, sample_fred_data
+    mock_fetch_many, sample_fred_data
 ):
-    mock_fred_client.side_effect = [
+    mock_fetch_many.side_effect = lambda series_ids: dict(zip(series_ids, [
         sample_fred_data, sample_fred_data, sample_fred_data,
         sample_fred_data, None
-    ]
+    ]))
 
     indicators = EconomicIndicators(
         inflation_series_id='PCETRIM12M159SFRBDAL',
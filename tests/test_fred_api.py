@@ -1,13 +1,33 @@
 # tests/test_fred_api.py
 
 import os
+import sys
+import time
+import warnings
+import subprocess
+import threading
 import datetime
 import pytest
 from unittest.mock import patch, MagicMock
+from urllib.error import HTTPError
 
 import pandas as pd
 
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api.cache_backends import (
+    FilesystemCacheBackend, MemoryCacheBackend
+)
 from pyeconomics.api.fred_api import FredClient
+from pyeconomics.api.rate_limiter import (
+    PRIORITY_BULK, PRIORITY_DEFAULT, PRIORITY_INTERACTIVE, RateLimiter,
+    current_priority, request_priority
+)
+from pyeconomics.api.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from pyeconomics.api.series_info import SeriesInfo
+from pyeconomics.api.vintage_store import VintageHistory
+
+# FredClient.__new__ as defined, before conftest replaces it in each test
+_FRED_CLIENT_NEW = FredClient.__dict__['__new__']
 
 
 @pytest.fixture(scope='module')
@@ -44,19 +64,20 @@ def test_singleton_existing_instance(fred_client):
 
 
 def test_fetch_data_from_cache(fred_client):
-    with patch('pyeconomics.api.fred_api.load_from_cache') as mock_load_cache:
+    with patch.object(fred_client.cache, 'get') as mock_load_cache:
         series_id = 'GDP'
         expected_data = pd.Series([1, 2, 3], name=series_id)
         mock_load_cache.return_value = expected_data
 
         data = fred_client.fetch_data(series_id)
         assert data.equals(expected_data)
-        mock_load_cache.assert_called_once_with(f'fred_series_{series_id}')
+        mock_load_cache.assert_called_once_with(
+            f'fred_series_{series_id}', fred_client.get_cache_expiry(series_id))
 
 
 def test_fetch_data_from_api(fred_client):
-    with patch('pyeconomics.api.fred_api.load_from_cache') as mock_load_cache, \
-        patch('pyeconomics.api.fred_api.save_to_cache') as mock_save_cache, \
+    with patch.object(fred_client.cache, 'get') as mock_load_cache, \
+        patch.object(fred_client.cache, 'put') as mock_save_cache, \
             patch.object(fred_client.client, 'get_series') as mock_get_series:
         mock_load_cache.return_value = None
         series_id = 'GDP'
@@ -66,12 +87,465 @@ def test_fetch_data_from_api(fred_client):
         data = fred_client.fetch_data(series_id)
         assert data.equals(expected_data)
         mock_get_series.assert_called_once_with(series_id)
-        mock_save_cache.assert_called_once_with(f'fred_series_{series_id}',
-                                                expected_data)
+        mock_save_cache.assert_any_call(f'fred_series_{series_id}',
+                                        expected_data)
+        summary = mock_save_cache.call_args_list[-1].args
+        assert summary[0] == f'fred_summary_{series_id}'
+        assert summary[1].length == 3
+
+
+def test_fetch_data_incremental_refresh(fred_client):
+    index = pd.date_range('2024-01-01', periods=30, freq='D')
+    cached = pd.Series(range(30), index=index, dtype='float64')
+    update = pd.Series(
+        [25.5, 26.0, 27.0, 28.0, 29.0, 30.0],
+        index=pd.date_range('2024-01-26', periods=6, freq='D'))
+    with patch.object(fred_client.cache, 'get') as mock_load_cache, \
+        patch.object(fred_client.cache, 'put') as mock_save_cache, \
+        patch.object(fred_client.client, 'get_series') as mock_get_series, \
+        patch.object(fred_client, 'incremental_refresh', True), \
+            patch.object(fred_client, 'revision_window', 5):
+        # Both fresh lookups miss, the expired entry is still available
+        mock_load_cache.side_effect = [None, None, cached]
+        mock_get_series.return_value = update
+
+        data = fred_client.fetch_data('DFII10')
+
+        mock_get_series.assert_called_once_with(
+            'DFII10', observation_start='2024-01-26')
+        assert len(data) == 31
+        assert data.index.is_unique
+        assert data['2024-01-26'] == 25.5
+        assert data.iloc[-1] == 30.0
+        pd.testing.assert_series_equal(data.iloc[:25], cached.iloc[:25])
+        mock_save_cache.assert_any_call('fred_series_DFII10', data)
+
+
+def test_constructor_options():
+    FredClient.reset_instance()
+    backend = MemoryCacheBackend()
+    limiter = RateLimiter(rate=1000)
+    policy = RetryPolicy(max_attempts=2)
+    breaker = CircuitBreaker(failure_threshold=2)
+    transport = MagicMock()
+    # Build the client for real rather than through the conftest stand-in
+    with patch.object(FredClient, '__new__', _FRED_CLIENT_NEW):
+        client = FredClient(
+            api_key='test_api_key', incremental_refresh=True,
+            revision_window=5, cache_expiry={'GDP': datetime.timedelta(1)},
+            cache_backend=backend, stale_while_revalidate=True,
+            max_staleness=datetime.timedelta(days=2),
+            rate_limiter=limiter, retry_policy=policy,
+            circuit_breaker=breaker, stale_if_error=False,
+            transport=transport,
+            metadata_expiry=datetime.timedelta(hours=1))
+    try:
+        assert client.incremental_refresh
+        assert client.revision_window == 5
+        assert client.get_cache_expiry('GDP') == datetime.timedelta(1)
+        assert client.cache is backend
+        assert client.stale_while_revalidate
+        assert client.max_staleness == datetime.timedelta(days=2)
+        assert client.rate_limiter is limiter
+        assert client.retry_policy is policy
+        assert client.circuit_breaker is breaker
+        assert not client.stale_if_error
+        assert client.client.transport is transport
+        assert client.metadata_expiry == datetime.timedelta(hours=1)
+    finally:
+        FredClient.reset_instance()
+
+
+def test_fetch_data_incremental_refresh_without_cache(fred_client):
+    expected_data = pd.Series([1.0, 2.0, 3.0])
+    with patch.object(fred_client.cache, 'get', return_value=None), \
+        patch.object(fred_client.cache, 'put'), \
+        patch.object(fred_client.client, 'get_series') as mock_get_series, \
+            patch.object(fred_client, 'incremental_refresh', True):
+        mock_get_series.return_value = expected_data
+
+        data = fred_client.fetch_data('GDP')
+
+        mock_get_series.assert_called_once_with('GDP')
+        assert data.equals(expected_data)
+
+
+def test_fetch_data_incremental_refresh_no_new_data(fred_client):
+    cached = pd.Series(
+        [1.0, 2.0], index=pd.date_range('2024-01-01', periods=2, freq='D'))
+    with patch.object(fred_client.cache, 'get') as mock_load_cache, \
+        patch.object(fred_client.cache, 'put'), \
+        patch.object(fred_client.client, 'get_series',
+                     return_value=pd.Series([], dtype='float64')), \
+            patch.object(fred_client, 'incremental_refresh', True):
+        mock_load_cache.side_effect = [None, None, cached]
+
+        data = fred_client.fetch_data('GDP')
+
+        assert data.equals(cached)
+
+
+def test_get_cache_expiry(fred_client):
+    assert fred_client.get_cache_expiry('NROU') == datetime.timedelta(days=7)
+    with patch.dict(fred_client.expiry_policy.overrides,
+                    {'NROU': datetime.timedelta(days=30)}):
+        assert fred_client.get_cache_expiry('NROU') == \
+            datetime.timedelta(days=30)
+
+
+def test_fetch_data_learns_frequency(fred_client):
+    data = pd.Series(
+        1.0, index=pd.date_range('2000-01-01', periods=20, freq='QS'))
+    with patch.object(fred_client.cache, 'get', return_value=data), \
+            patch.dict(fred_client.series_frequencies, clear=False):
+        fred_client.fetch_data('GDPC1')
+        assert fred_client.series_frequencies['GDPC1'] == 'Q'
+        assert fred_client.get_cache_expiry('GDPC1') == \
+            datetime.timedelta(days=7)
+
+
+def test_fetch_data_uses_selected_backend(fred_client):
+    backend = MemoryCacheBackend()
+    data = pd.Series([1.0, 2.0])
+    with patch.object(fred_client, 'cache', backend), \
+            patch.object(fred_client.client, 'get_series',
+                         return_value=data) as mock_get_series:
+        fred_client.fetch_data('GDP')
+        fred_client.fetch_data('GDP')
+        mock_get_series.assert_called_once_with('GDP')
+        assert backend.get('fred_series_GDP').equals(data)
+
+
+def test_fetch_data_stale_while_revalidate(fred_client):
+    backend = MemoryCacheBackend()
+    stale = pd.Series([1.0, 2.0])
+    fresh = pd.Series([1.0, 2.0, 3.0])
+    backend.cache.put('fred_series_GDP', stale,
+                      time.time() - datetime.timedelta(days=2).total_seconds())
+    with patch.object(fred_client, 'cache', backend), \
+        patch.object(fred_client, 'stale_while_revalidate', True), \
+            patch.object(fred_client.client, 'get_series',
+                         return_value=fresh) as mock_get_series:
+        data = fred_client.fetch_data('GDP')
+        fred_client.wait_for_refreshes(timeout=5)
+
+        assert data.equals(stale)
+        mock_get_series.assert_called_once_with('GDP')
+        assert backend.get('fred_series_GDP').equals(fresh)
+        assert fred_client.fetch_data('GDP').equals(fresh)
+
+
+def test_fetch_data_stale_beyond_max_staleness(fred_client):
+    backend = MemoryCacheBackend()
+    fresh = pd.Series([1.0, 2.0, 3.0])
+    backend.cache.put('fred_series_GDP', pd.Series([1.0]),
+                      time.time() - datetime.timedelta(days=30).total_seconds())
+    with patch.object(fred_client, 'cache', backend), \
+        patch.object(fred_client, 'stale_while_revalidate', True), \
+            patch.object(fred_client.client, 'get_series', return_value=fresh):
+        assert fred_client.fetch_data('GDP').equals(fresh)
+
+
+def test_background_refresh_failure_keeps_stale_entry(fred_client):
+    backend = MemoryCacheBackend()
+    stale = pd.Series([1.0, 2.0])
+    backend.cache.put('fred_series_GDP', stale,
+                      time.time() - datetime.timedelta(days=2).total_seconds())
+    with patch.object(fred_client, 'cache', backend), \
+        patch.object(fred_client, 'stale_while_revalidate', True), \
+            patch.object(fred_client.client, 'get_series',
+                         side_effect=Exception("API error")):
+        assert fred_client.fetch_data('GDP').equals(stale)
+        fred_client.wait_for_refreshes(timeout=5)
+        assert fred_client.fetch_data('GDP').equals(stale)
+        fred_client.wait_for_refreshes(timeout=5)
+
+
+def _fetch_concurrently(fred_client, series_id, callers):
+    results, errors = [], []
+
+    def fetch():
+        try:
+            results.append(fred_client.fetch_data(series_id))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=fetch) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def _wait_for_callers(fred_client, cache_key, callers):
+    deadline = time.monotonic() + 5
+    while fred_client._flights.in_flight(cache_key) < callers and \
+            time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_fetch_data_coalesces_concurrent_misses(fred_client):
+    data = pd.Series([1.0, 2.0, 3.0])
+
+    def get_series(series_id):
+        _wait_for_callers(fred_client, 'fred_series_GDP', 4)
+        return data
+
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+            patch.object(fred_client.client, 'get_series',
+                         side_effect=get_series) as mock_get_series:
+        results, errors = _fetch_concurrently(fred_client, 'GDP', 4)
+
+    assert errors == []
+    assert len(results) == 4
+    assert len({id(result) for result in results}) == 4
+    for result in results:
+        pd.testing.assert_series_equal(result, data)
+    mock_get_series.assert_called_once_with('GDP')
+
+
+def test_fetch_data_coalesced_callers_share_error(fred_client):
+    def get_series(series_id):
+        _wait_for_callers(fred_client, 'fred_series_GDP', 4)
+        raise Exception("API error")
+
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+            patch.object(fred_client.client, 'get_series',
+                         side_effect=get_series) as mock_get_series:
+        results, errors = _fetch_concurrently(fred_client, 'GDP', 4)
+
+    assert results == []
+    assert [str(e) for e in errors] == ["API error"] * 4
+    assert mock_get_series.call_count == 1
+
+
+def test_requests_wait_for_rate_limiter(fred_client):
+    priorities = []
+    limiter = MagicMock()
+    limiter.acquire.side_effect = lambda: priorities.append(current_priority())
+    data = pd.Series([1.0, 2.0],
+                     index=pd.to_datetime(['2024-01-01', '2024-02-01']))
+
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(fred_client, 'rate_limiter', limiter), \
+            patch.object(fred_client.client, 'get_series', return_value=data):
+        fred_client.fetch_data('GDP')
+        fred_client.get_latest_value('UNRATE')
+        with request_priority(PRIORITY_BULK):
+            fred_client.fetch_many(['NROU', 'GDP'])
+
+    assert priorities == [
+        PRIORITY_DEFAULT, PRIORITY_INTERACTIVE, PRIORITY_BULK]
+
+
+def _server_error():
+    """Raises the error fredapi raises for a 503 response."""
+    try:
+        raise HTTPError('https://api.stlouisfed.org', 503, 'error', None,
+                        None)
+    except HTTPError:
+        raise ValueError("Service Unavailable")
+
+
+def test_fetch_data_retries_transient_errors(fred_client):
+    data = pd.Series([1.0, 2.0])
+    responses = iter([_server_error, _server_error, lambda: data])
+
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(fred_client, 'retry_policy', RetryPolicy(base_delay=0)), \
+        patch.object(fred_client, 'circuit_breaker', CircuitBreaker()), \
+            patch.object(fred_client.client, 'get_series',
+                         side_effect=lambda _: next(responses)()) as mock:
+        assert fred_client.fetch_data('GDP').equals(data)
+        assert mock.call_count == 3
+
+
+def test_fetch_data_gives_up_after_max_attempts(fred_client):
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(fred_client, 'retry_policy',
+                     RetryPolicy(max_attempts=2, base_delay=0)), \
+        patch.object(fred_client, 'circuit_breaker', CircuitBreaker()), \
+            patch.object(fred_client.client, 'get_series',
+                         side_effect=lambda _: _server_error()) as mock:
+        with pytest.raises(ValueError, match="Service Unavailable"):
+            fred_client.fetch_data('GDP')
+        assert mock.call_count == 2
+
+
+def test_open_circuit_fails_fast(fred_client):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(fred_client, 'retry_policy', RetryPolicy(base_delay=0)), \
+        patch.object(fred_client, 'circuit_breaker', breaker), \
+            patch.object(fred_client.client, 'get_series',
+                         side_effect=lambda _: _server_error()) as mock:
+        with pytest.raises(CircuitOpenError):
+            fred_client.fetch_data('GDP')
+        with pytest.raises(CircuitOpenError):
+            fred_client.fetch_data('UNRATE')
+        assert mock.call_count == 2
+
+
+def test_fetch_data_falls_back_to_stale_entry(fred_client):
+    backend = MemoryCacheBackend()
+    stale = pd.Series([1.0, 2.0])
+    backend.cache.put('fred_series_GDP', stale,
+                      time.time() - datetime.timedelta(days=2).total_seconds())
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+
+    with patch.object(fred_client, 'cache', backend), \
+        patch.object(fred_client, 'circuit_breaker', breaker), \
+            patch.object(fred_client.client, 'get_series') as mock:
+        assert fred_client.fetch_data('GDP').equals(stale)
+        with patch.object(fred_client, 'stale_if_error', False):
+            with pytest.raises(CircuitOpenError):
+                fred_client.fetch_data('GDP')
+        mock.assert_not_called()
+
+
+def test_quarterly_series_falls_back_to_stale_entry(fred_client):
+    # NROU expires after 7 days, so an expired entry is at least that old
+    backend = MemoryCacheBackend()
+    stale = pd.Series([4.4, 4.3],
+                      index=pd.to_datetime(['2024-01-01', '2024-04-01']))
+    backend.cache.put('fred_series_NROU', stale,
+                      time.time() - datetime.timedelta(days=10).total_seconds())
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+
+    with patch.object(fred_client, 'cache', backend), \
+        patch.object(fred_client, 'circuit_breaker', breaker), \
+            patch.object(fred_client.client, 'get_series') as mock:
+        assert fred_client.fetch_data('NROU').equals(stale)
+        with patch.object(fred_client, 'stale_while_revalidate', True):
+            assert fred_client.fetch_data('NROU').equals(stale)
+            fred_client.wait_for_refreshes(timeout=5)
+        mock.assert_not_called()
+
+
+def test_point_lookups_use_summary(fred_client):
+    today = pd.Timestamp.today().normalize()
+    data = pd.Series(
+        range(100), index=pd.date_range(end=today, periods=100, freq='D'),
+        dtype='float64')
+    backend = MemoryCacheBackend()
+
+    with patch.object(fred_client, 'cache', backend), \
+            patch.object(fred_client.client, 'get_series', return_value=data):
+        fred_client.fetch_data('DFF')
+
+    with patch.object(fred_client, 'cache', backend), \
+            patch.object(fred_client, 'fetch_data') as mock_fetch_data:
+        assert fred_client.get_latest_value('DFF') == 99.0
+        assert fred_client.get_historical_value('DFF', periods=-12) == 88.0
+        mock_fetch_data.assert_not_called()
+
+        mock_fetch_data.return_value = data
+        assert fred_client.get_historical_value('DFF', periods=-50) == 50.0
+        mock_fetch_data.assert_called_once_with('DFF')
+
+
+def test_fetch_data_refetches_corrupt_entry(fred_client, tmp_path,
+                                            monkeypatch):
+    monkeypatch.setattr(cache_manager, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(cache_manager, 'SERIES_FORMAT', 'pickle')
+    cache_manager.clear_memory_cache()
+    data = pd.Series([1.0, 2.0, 3.0])
+    cache_manager.save_to_cache('fred_series_GDP', data)
+    filename = cache_manager.cache_filename('fred_series_GDP')
+    with open(filename, 'r+b') as f:
+        f.truncate(10)
+    cache_manager.clear_memory_cache()
+
+    with patch.object(fred_client, 'cache', FilesystemCacheBackend()), \
+            patch.object(fred_client.client, 'get_series',
+                         return_value=data) as mock_get_series:
+        assert fred_client.fetch_data('GDP').equals(data)
+        mock_get_series.assert_called_once_with('GDP')
+    cache_manager.clear_memory_cache()
+    assert cache_manager.load_from_cache('fred_series_GDP').equals(data)
+    cache_manager.clear_memory_cache()
+
+
+def test_fetch_vintages(fred_client):
+    releases = pd.DataFrame({
+        'date': ['2024-01-01', '2024-01-01', '2024-02-01'],
+        'realtime_start': ['2024-02-02', '2024-03-08', '2024-03-08'],
+        'value': [3.7, 3.8, 3.9],
+    })
+    backend = MemoryCacheBackend()
+    with patch.object(fred_client, 'cache', backend), \
+            patch.object(fred_client.client, 'get_series_all_releases',
+                         return_value=releases) as mock_releases:
+        first = fred_client.get_series_as_of('UNRATE', '2024-02-29')
+        latest = fred_client.get_series_as_of('UNRATE', '2024-12-31')
+
+        mock_releases.assert_called_once_with('UNRATE')
+        assert first.tolist() == [3.7]
+        assert latest.tolist() == [3.8, 3.9]
+
+
+def test_fetch_vintages_incremental_refresh(fred_client):
+    cached = VintageHistory.from_releases('UNRATE', pd.DataFrame({
+        'date': ['2024-01-01'], 'realtime_start': ['2024-02-02'],
+        'value': [3.7]}))
+    update = pd.DataFrame({
+        'date': ['2024-01-01', '2024-02-01'],
+        'realtime_start': ['2024-02-02', '2024-03-08'],
+        'value': [3.7, 3.9]})
+    with patch.object(fred_client.cache, 'get') as mock_load_cache, \
+        patch.object(fred_client.cache, 'put') as mock_save_cache, \
+        patch.object(fred_client.client, 'get_series_all_releases',
+                     return_value=update) as mock_releases, \
+            patch.object(fred_client, 'incremental_refresh', True):
+        mock_load_cache.side_effect = [None, None, cached]
+
+        history = fred_client.fetch_vintages('UNRATE')
+
+        mock_releases.assert_called_once_with(
+            'UNRATE', realtime_start='2024-02-02')
+        assert len(history) == 2
+        mock_save_cache.assert_called_once_with(
+            'fred_vintages_UNRATE', history)
+
+
+def test_fetch_many(fred_client):
+    backend = MemoryCacheBackend()
+    cached = pd.Series([1.0, 2.0],
+                       index=pd.to_datetime(['2024-01-01', '2024-02-01']))
+    downloaded = pd.Series([3.0],
+                           index=pd.to_datetime(['2024-02-01']))
+    backend.put('fred_series_UNRATE', cached)
+    with patch.object(fred_client, 'cache', backend), \
+            patch.object(fred_client.client, 'get_series',
+                         return_value=downloaded) as mock_get_series:
+        series = fred_client.fetch_many(['NROU', 'UNRATE', 'DFII10', 'NROU'])
+
+        assert list(series) == ['NROU', 'UNRATE', 'DFII10']
+        assert series['UNRATE'].equals(cached)
+        assert series['NROU'].equals(downloaded)
+        assert sorted(call.args[0] for call in
+                      mock_get_series.call_args_list) == ['DFII10', 'NROU']
+
+        frame = fred_client.fetch_many(['UNRATE', 'NROU'], as_frame=True)
+        assert list(frame.columns) == ['UNRATE', 'NROU']
+        assert len(frame) == 2
+        assert mock_get_series.call_count == 2
+
+
+def test_fetch_many_propagates_errors(fred_client):
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+            patch.object(fred_client.client, 'get_series',
+                         return_value=pd.Series([], dtype='float64')):
+        with pytest.raises(ValueError, match="No data found for series ID"):
+            fred_client.fetch_many(['GDP', 'UNRATE'])
 
 
 def test_get_latest_value(fred_client):
-    with patch.object(fred_client, 'fetch_data') as mock_fetch_data:
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+            patch.object(fred_client, 'fetch_data') as mock_fetch_data:
         series_id = 'GDP'
         today = datetime.date.today()
         data = pd.Series(
@@ -86,7 +560,8 @@ def test_get_latest_value(fred_client):
 
 
 def test_get_historical_value(fred_client):
-    with patch.object(fred_client, 'fetch_data') as mock_fetch_data:
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+            patch.object(fred_client, 'fetch_data') as mock_fetch_data:
         series_id = 'GDP'
         data = pd.Series([1, 2, 3], name=series_id)
         mock_fetch_data.return_value = data
@@ -97,7 +572,8 @@ def test_get_historical_value(fred_client):
 
 
 def test_get_series_name(fred_client):
-    with patch.object(
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(
             fred_client.client, 'get_series_info'
     ) as mock_get_series_info:
         series_id = 'GDP'
@@ -108,6 +584,55 @@ def test_get_series_name(fred_client):
         assert series_name == "Gross Domestic Product"
 
 
+def test_get_series_info_cached(fred_client):
+    info = pd.Series({
+        'id': 'UNRATE', 'title': 'Unemployment Rate', 'units': 'Percent',
+        'frequency': 'Monthly', 'frequency_short': 'M',
+        'seasonal_adjustment_short': 'SA',
+        'last_updated': '2024-06-07 07:48:02-05',
+        'observation_start': '1948-01-01', 'observation_end': '2024-05-01'})
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(fred_client, 'series_frequencies', {}), \
+            patch.object(fred_client.client, 'get_series_info',
+                         return_value=info) as mock_get_series_info:
+        first = fred_client.get_series_info('UNRATE')
+        second = fred_client.get_series_info('UNRATE')
+
+        assert first == second
+        assert first.units == 'Percent'
+        assert first.observation_end == pd.Timestamp('2024-05-01')
+        assert fred_client.series_frequencies == {'UNRATE': 'M'}
+        mock_get_series_info.assert_called_once_with('UNRATE')
+
+
+def test_get_series_info_expires(fred_client):
+    backend = MemoryCacheBackend()
+    with patch.object(fred_client, 'cache', backend), \
+        patch.object(fred_client, 'metadata_expiry',
+                     datetime.timedelta(0)), \
+            patch.object(fred_client.client, 'get_series_info',
+                         return_value={'title': 'GDP'}) as mock_info:
+        fred_client.get_series_info('GDP')
+        fred_client.get_series_info('GDP')
+        assert mock_info.call_count == 2
+
+
+def test_get_series_info_many(fred_client):
+    backend = MemoryCacheBackend()
+    backend.put('fred_info_NROU', SeriesInfo('NROU', title='Cached'))
+    with patch.object(fred_client, 'cache', backend), \
+            patch.object(fred_client.client, 'get_series_info',
+                         side_effect=lambda s: {'title': f"{s} title"}
+                         ) as mock_info:
+        infos = fred_client.get_series_info_many(['UNRATE', 'NROU', 'DFII10'])
+
+    assert list(infos) == ['UNRATE', 'NROU', 'DFII10']
+    assert infos['NROU'].title == 'Cached'
+    assert infos['UNRATE'].title == 'UNRATE title'
+    assert sorted(call.args[0] for call in mock_info.call_args_list) == \
+        ['DFII10', 'UNRATE']
+
+
 def test_get_data_or_fetch(fred_client):
     FredClient.reset_instance()  # Reset instance before test
     FredClient._instance = fred_client  # Ensure the instance is set
@@ -220,7 +745,8 @@ def test_get_historical_value_exception_handling(fred_client):
 
 
 def test_get_series_name_exception_handling(fred_client):
-    with patch.object(
+    with patch.object(fred_client, 'cache', MemoryCacheBackend()), \
+        patch.object(
         fred_client.client,
         'get_series_info',
             side_effect=Exception("API error")):
@@ -268,7 +794,8 @@ def test_instance_creation_with_existing_instance():
     with patch.object(
             FredClient, '__new__', wraps=FredClient.__new__) as mock_new:
         first_instance = FredClient(api_key='test_api_key')
-        second_instance = FredClient(api_key='another_test_api_key')
+        with pytest.warns(RuntimeWarning, match='ignoring api_key'):
+            second_instance = FredClient(api_key='another_test_api_key')
 
         assert first_instance is second_instance  # Should be the same instance
         # Ensure __new__ was called twice, but instance creation only once
@@ -276,5 +803,77 @@ def test_instance_creation_with_existing_instance():
         assert first_instance == second_instance
 
 
+def test_existing_instance_warns_about_ignored_options():
+    FredClient.reset_instance()
+    backend = MemoryCacheBackend()
+    with patch.object(FredClient, '__new__', _FRED_CLIENT_NEW):
+        client = FredClient(api_key='test_api_key', cache_backend=backend)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                assert FredClient() is client
+                assert FredClient('test_api_key', cache_backend=backend) \
+                    is client
+            with pytest.warns(RuntimeWarning,
+                              match='ignoring revision_window, cache_backend'):
+                assert FredClient(cache_backend='sqlite',
+                                  revision_window=3) is client
+            assert client.cache is backend
+        finally:
+            FredClient.reset_instance()
+
+
+def test_lazy_client_forwards_to_singleton(fred_client):
+    import pyeconomics.api.fred_api as fred_api
+    lazy = fred_api.LazyFredClient()
+    with patch.object(fred_api.FredClient, '_instance', fred_client), \
+            patch.object(fred_client, 'revision_window', 1):
+        assert lazy.cache is fred_client.cache
+        lazy.revision_window = 7
+        assert fred_client.revision_window == 7
+        assert repr(lazy) == repr(fred_client)
+
+
+def test_instance_published_once_configured():
+    seen = []
+
+    def get_cache_backend(cache_backend):
+        seen.append(FredClient._instance)
+        return MemoryCacheBackend()
+
+    FredClient.reset_instance()
+    with patch.object(FredClient, '__new__', _FRED_CLIENT_NEW), \
+            patch('pyeconomics.api.fred_api.get_cache_backend',
+                  side_effect=get_cache_backend):
+        client = FredClient(api_key='test_api_key')
+    try:
+        assert seen == [None]
+        assert FredClient._instance is client
+        assert client._options == {'api_key': 'test_api_key'}
+    finally:
+        FredClient.reset_instance()
+
+
+def test_import_creates_no_client():
+    script = (
+        "import os\n"
+        "import pyeconomics\n"
+        "from pyeconomics.api.fred_api import FredClient, fred_client\n"
+        "assert FredClient._instance is None\n"
+        "try:\n"
+        "    fred_client.get_latest_value('GDP')\n"
+        "except ValueError:\n"
+        "    pass\n"
+        "assert FredClient._instance is None\n"
+        "os.environ['FRED_API_KEY'] = 'test_api_key'\n"
+        "assert fred_client.api_key == 'test_api_key'\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != 'FRED_API_KEY'}
+    env['PYTHON_KEYRING_BACKEND'] = 'keyring.backends.fail.Keyring'
+    result = subprocess.run([sys.executable, '-c', script], env=env,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
 if __name__ == '__main__':
     pytest.main()
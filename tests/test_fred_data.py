@@ -31,7 +31,8 @@ def mock_fred_data():
 @patch('pyeconomics.api.fred_data.fred_client')
 def test_fetch_historical_fed_funds_rate(mock_fred_client, mock_fred_data):
     dfedtar, dfedtaru = mock_fred_data
-    mock_fred_client.fetch_data.side_effect = [dfedtar, dfedtaru]
+    mock_fred_client.fetch_many.return_value = {
+        'DFEDTAR': dfedtar, 'DFEDTARU': dfedtaru}
 
     result = fetch_historical_fed_funds_rate()
 
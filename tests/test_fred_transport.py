@@ -0,0 +1,161 @@
+# tests/test_fred_transport.py
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fredapi import Fred
+
+from pyeconomics.api.fred_transport import (
+    FredSession, PooledTransport, UrllibTransport
+)
+from pyeconomics.api.retry import is_retryable
+
+OBSERVATIONS = (
+    '<?xml version="1.0" encoding="utf-8" ?>'
+    '<observations>'
+    '<observation realtime_start="2024-06-01" realtime_end="2024-06-01" '
+    'date="2024-01-01" value="3.7"/>'
+    '<observation realtime_start="2024-06-01" realtime_end="2024-06-01" '
+    'date="2024-02-01" value="."/>'
+    '</observations>'
+)
+
+
+class FredStandIn(BaseHTTPRequestHandler):
+    """Answers FRED observation requests over keep-alive connections."""
+
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    drop_after_response = False
+    status = 200
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        if self.status >= 400:
+            body = (f'<error code="{self.status}" '
+                    f'message="Stand-in error {self.status}"/>').encode()
+        else:
+            assert query['api_key'] == ['test-key']
+            body = OBSERVATIONS.encode()
+        self.send_response(self.status)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close without telling the client, like a server timing out an
+        # idle connection
+        self.close_connection = self.drop_after_response
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fred_server():
+    FredStandIn.connections = 0
+    FredStandIn.drop_after_response = False
+    FredStandIn.status = 200
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FredStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/fred"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pooled_transport_reuses_connection(fred_server):
+    transport = PooledTransport()
+    for _ in range(5):
+        transport.get(f"{fred_server}/series/observations?api_key=test-key")
+    transport.close()
+
+    assert FredStandIn.connections == 1
+
+
+def test_urllib_transport_opens_connection_per_request(fred_server):
+    transport = UrllibTransport()
+    for _ in range(3):
+        transport.get(f"{fred_server}/series/observations?api_key=test-key")
+
+    assert FredStandIn.connections == 3
+
+
+def test_pooled_transport_replaces_closed_connection(fred_server):
+    FredStandIn.drop_after_response = True
+    transport = PooledTransport()
+    url = f"{fred_server}/series/observations?api_key=test-key"
+
+    assert transport.get(url) == transport.get(url)
+    assert FredStandIn.connections == 2
+
+
+def test_pooled_transport_shared_between_threads(fred_server):
+    transport = PooledTransport(max_connections=4)
+    url = f"{fred_server}/series/observations?api_key=test-key"
+    threads = [threading.Thread(target=lambda: [
+        transport.get(url) for _ in range(10)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert FredStandIn.connections <= 4
+
+
+def test_pooled_transport_raises_http_error(fred_server):
+    FredStandIn.status = 503
+    transport = PooledTransport()
+
+    with pytest.raises(HTTPError) as exc_info:
+        transport.get(f"{fred_server}/series?api_key=test-key")
+    assert exc_info.value.code == 503
+    assert b'Stand-in error 503' in exc_info.value.read()
+
+
+def test_fred_session_get_series(fred_server):
+    session = FredSession(api_key='test-key', root_url=fred_server)
+    series = session.get_series('UNRATE')
+
+    assert series.iloc[0] == 3.7
+    assert len(series) == 2
+    assert isinstance(session.transport, PooledTransport)
+
+
+def test_fred_session_without_proxy_support(fred_server):
+    # fredapi releases before 0.5.2 have no proxies attribute
+    transport = PooledTransport()
+    session = FredSession(api_key='test-key', transport=transport,
+                          root_url=fred_server)
+    if hasattr(session, 'proxies'):
+        del session.proxies
+
+    with patch.object(transport, 'get', wraps=transport.get) as get:
+        assert session.get_series('UNRATE').iloc[0] == 3.7
+    get.assert_called_once()
+
+
+def test_fred_session_error_is_retryable(fred_server):
+    FredStandIn.status = 503
+    session = FredSession(api_key='test-key', root_url=fred_server)
+
+    with pytest.raises(ValueError, match="Stand-in error 503") as exc_info:
+        session.get_series('UNRATE')
+    assert is_retryable(exc_info.value)
+
+
+def test_fred_session_requires_fetch_data_hook(monkeypatch):
+    monkeypatch.delattr(Fred, '_Fred__fetch_data')
+    with pytest.raises(RuntimeError, match='Fred.__fetch_data'):
+        FredSession('test_api_key', PooledTransport())
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,165 @@
+# tests/test_local_data_source.py
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from pyeconomics.api.cache_backends import MemoryCacheBackend
+from pyeconomics.api.fred_api import FredClient
+from pyeconomics.api.local_data_source import LocalFileDataSource
+from pyeconomics.api.series_info import SeriesInfo
+from pyeconomics.api.series_store import PYARROW_AVAILABLE
+from pyeconomics.models.monetary_policy.taylor_rule import taylor_rule
+
+SERIES = {
+    'PCETRIM12M159SFRBDAL': 2.5,
+    'UNRATE': 4.0,
+    'NROU': 4.5,
+    'DFII10': 1.0,
+    'DFEDTARU': 0.5,
+}
+
+
+def _monthly(value):
+    return pd.Series(
+        [value - 0.5, value],
+        index=pd.to_datetime(['2024-01-01', '2024-02-01']))
+
+
+@pytest.fixture(scope='module')
+def offline_client(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('fred_data')
+    source = LocalFileDataSource(str(directory), series_format='.csv')
+    for series_id, value in SERIES.items():
+        source.save_series(series_id, _monthly(value))
+    source.save_info(SeriesInfo(
+        'UNRATE', title='Unemployment Rate', frequency_short='M',
+        last_updated=pd.Timestamp('2024-03-08 07:44:00')))
+
+    FredClient.reset_instance()
+    client = FredClient(data_dir=str(directory),
+                        cache_backend=MemoryCacheBackend())
+    yield client
+    FredClient.reset_instance()
+
+
+def test_csv_round_trip(tmp_path):
+    source = LocalFileDataSource(str(tmp_path), series_format='.csv')
+    data = _monthly(3.0)
+    source.save_series('UNRATE', data)
+
+    assert source.series_ids() == ['UNRATE']
+    pd.testing.assert_series_equal(
+        source.fetch_data('UNRATE'), data, check_names=False,
+        check_freq=False)
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason='pyarrow not installed')
+def test_parquet_round_trip_replaces_csv(tmp_path):
+    LocalFileDataSource(str(tmp_path), series_format='.csv').save_series(
+        'UNRATE', _monthly(1.0))
+    source = LocalFileDataSource(str(tmp_path), series_format='.parquet')
+    source.save_series('UNRATE', _monthly(3.0))
+
+    assert os.listdir(tmp_path) == ['UNRATE.parquet']
+    assert source.fetch_data('UNRATE').tolist() == [2.5, 3.0]
+
+
+def test_skips_rewriting_unchanged_series(tmp_path):
+    source = LocalFileDataSource(str(tmp_path), series_format='.csv')
+    source.save_series('UNRATE', _monthly(3.0))
+    path = tmp_path / 'UNRATE.csv'
+    os.utime(path, ns=(0, 0))
+
+    source.save_series('UNRATE', _monthly(3.0))
+    assert path.stat().st_mtime_ns == 0
+    assert not isinstance(source._saved['UNRATE'], pd.Series)
+
+    source.save_series('UNRATE', _monthly(4.0))
+    assert path.stat().st_mtime_ns != 0
+    assert source.get_latest_value('UNRATE') == 4.0
+
+
+def test_reads_fred_download_with_missing_values(tmp_path):
+    (tmp_path / 'DFF.csv').write_text(
+        'observation_date,DFF\n2024-01-01,5.33\n2024-01-02,.\n')
+    data = LocalFileDataSource(str(tmp_path)).fetch_data('DFF')
+
+    assert isinstance(data.index, pd.DatetimeIndex)
+    assert data.iloc[0] == 5.33
+    assert pd.isna(data.iloc[1])
+
+
+def test_reloads_changed_file(tmp_path):
+    source = LocalFileDataSource(str(tmp_path), series_format='.csv')
+    source.save_series('UNRATE', _monthly(3.0))
+    assert source.get_latest_value('UNRATE') == 3.0
+
+    path = tmp_path / 'UNRATE.csv'
+    path.write_text('date,UNRATE\n2024-01-01,4.0\n')
+    os.utime(path, ns=(0, 0))
+    assert source.get_latest_value('UNRATE') == 4.0
+
+
+def test_missing_series(tmp_path):
+    source = LocalFileDataSource(str(tmp_path))
+    with pytest.raises(ValueError, match='No data found for series ID X'):
+        source.fetch_data('X')
+    assert source.get_series_info('X') == SeriesInfo('X', title='X')
+
+
+def test_unsupported_format(tmp_path):
+    with pytest.raises(ValueError, match='Unsupported series format'):
+        LocalFileDataSource(str(tmp_path), series_format='.xlsx')
+
+
+def test_offline_client_needs_no_api_key(offline_client):
+    assert offline_client.client is None
+    assert offline_client.get_latest_value('UNRATE') == 4.0
+    assert offline_client.get_historical_value('UNRATE') == 4.0
+    assert offline_client.get_series_name('UNRATE') == 'Unemployment Rate'
+    assert offline_client.get_series_info('UNRATE').last_updated == \
+        pd.Timestamp('2024-03-08 07:44:00')
+    assert list(offline_client.fetch_many(['UNRATE', 'NROU'])) == \
+        ['UNRATE', 'NROU']
+
+
+def test_offline_client_has_no_vintages(offline_client):
+    with pytest.raises(ValueError, match='not available offline'):
+        offline_client.fetch_vintages('UNRATE')
+
+
+def test_taylor_rule_offline(offline_client):
+    with patch('pyeconomics.models.monetary_policy.taylor_rule.fred_client',
+               offline_client):
+        assert taylor_rule(verbose=False) == pytest.approx(4.25)
+
+
+def test_recording_replays_offline(offline_client, tmp_path):
+    fred = MagicMock()
+    fred.get_series.return_value = _monthly(7.0)
+    fred.get_series_info.return_value = {
+        'title': 'Gross Domestic Product', 'frequency_short': 'Q'}
+    with patch.object(offline_client, 'local_source', None), \
+            patch.object(offline_client, 'client', fred), \
+            patch.object(offline_client, 'cache', MemoryCacheBackend()):
+        offline_client.start_recording(str(tmp_path))
+        try:
+            offline_client.get_latest_value('GDP')
+            offline_client.get_series_name('GDP')
+            # A cache hit is recorded too, without downloading again
+            offline_client.fetch_many(['GDP'])
+        finally:
+            offline_client.stop_recording()
+    fred.get_series.assert_called_once()
+
+    replay = LocalFileDataSource(str(tmp_path))
+    assert replay.series_ids() == ['GDP']
+    assert replay.get_latest_value('GDP') == 7.0
+    assert replay.get_series_name('GDP') == 'Gross Domestic Product'
+
+
+if __name__ == '__main__':
+    pytest.main()
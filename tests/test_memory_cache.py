@@ -0,0 +1,128 @@
+# tests/test_memory_cache.py
+
+import os
+import shutil
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api.cache_manager import (
+    CACHE_DIR, clear_memory_cache, load_from_cache, save_to_cache
+)
+from pyeconomics.api.memory_cache import MemoryCache, estimate_size
+
+
+@pytest.fixture(scope='function', autouse=True)
+def setup_and_teardown():
+    """Setup and teardown for tests."""
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+    if os.path.exists(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+
+
+def test_get_and_put():
+    cache = MemoryCache()
+    cache.put('key', {'value': 42}, time.time())
+    assert cache.get('key') == {'value': 42}
+    assert cache.get('missing') is None
+
+
+def test_get_expired_entry():
+    cache = MemoryCache()
+    cache.put('key', {'value': 42}, time.time() - 7200)
+    assert cache.get('key', expiry=timedelta(hours=1)) is None
+    assert cache.get('key', expiry=timedelta(hours=3)) == {'value': 42}
+
+
+def test_evicts_least_recently_used_by_count():
+    cache = MemoryCache(max_entries=2)
+    cache.put('a', 1, time.time())
+    cache.put('b', 2, time.time())
+    cache.get('a')
+    cache.put('c', 3, time.time())
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_evicts_by_total_bytes():
+    series = pd.Series(range(1000), dtype='float64')
+    size = estimate_size(series)
+    cache = MemoryCache(max_bytes=int(size * 2.5))
+    for key in ('a', 'b', 'c'):
+        cache.put(key, series, time.time())
+    assert len(cache) == 2
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get('a') is None
+
+
+def test_oversized_entry_not_cached():
+    cache = MemoryCache(max_bytes=10)
+    cache.put('key', pd.Series(range(100)), time.time())
+    assert len(cache) == 0
+
+
+def test_disabled_cache():
+    cache = MemoryCache(max_entries=0)
+    cache.put('key', 1, time.time())
+    assert cache.get('key') is None
+
+
+def test_returned_series_is_detached():
+    cache = MemoryCache()
+    cache.put('key', pd.Series([1.0, 2.0], name='original'), time.time())
+    first = cache.get('key')
+    first.name = 'changed'
+    assert cache.get('key').name == 'original'
+
+
+def test_mutating_returned_series_leaves_cache_intact():
+    series = pd.Series([1.0, 2.0],
+                       index=pd.to_datetime(['2024-01-01', '2024-02-01']))
+    save_to_cache('test_key', series)
+    first = load_from_cache('test_key')
+    first.index.name = 'X'
+    first.iloc[0] = 99.0
+
+    second = load_from_cache('test_key')
+    assert second.index.name is None
+    assert second.iloc[0] == 1.0
+
+
+def test_repeated_loads_skip_disk():
+    save_to_cache('test_key', {'value': 42})
+    assert load_from_cache('test_key') == {'value': 42}
+    with patch('pyeconomics.api.cache_manager.os.path.exists') as exists, \
+            patch('builtins.open') as mock_open:
+        assert load_from_cache('test_key') == {'value': 42}
+        exists.assert_not_called()
+        mock_open.assert_not_called()
+
+
+def test_save_invalidates_memory_entry():
+    save_to_cache('test_key', {'value': 42})
+    load_from_cache('test_key')
+    save_to_cache('test_key', {'value': 43})
+    assert load_from_cache('test_key') == {'value': 43}
+
+
+def test_memory_entry_expires_with_disk_entry():
+    save_to_cache('test_key', {'value': 42})
+    load_from_cache('test_key')
+    assert cache_manager.memory_cache.get('test_key') is not None
+    # The memory tier uses the file modification time as the saved time
+    assert load_from_cache('test_key', expiry=timedelta(0)) is None
+    assert cache_manager.memory_cache.get(
+        'test_key', expiry=timedelta(0)) is None
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,92 @@
+# tests/test_mmap_store.py
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api.cache_manager import (
+    CACHE_DIR, cache_filename, clear_memory_cache, load_from_cache,
+    save_to_cache
+)
+from pyeconomics.api.mmap_store import (
+    MMAP_EXTENSION, is_mappable_series, read_mapped_series,
+    write_mapped_series
+)
+
+
+@pytest.fixture(scope='function', autouse=True)
+def setup_and_teardown():
+    """Setup and teardown for tests."""
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+    if os.path.exists(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range('2000-01-01', periods=5000, freq='D')
+    return pd.Series(np.linspace(0.0, 5.0, len(index)), index=index)
+
+
+def test_is_mappable_series(daily_series):
+    assert is_mappable_series(daily_series)
+    assert not is_mappable_series(daily_series.rename('DFII10'))
+    assert not is_mappable_series(daily_series.astype('float32'))
+    assert not is_mappable_series(pd.Series([1.0, 2.0]))
+    assert not is_mappable_series(daily_series.iloc[:0])
+
+
+def test_read_returns_memory_mapped_series(tmp_path, daily_series):
+    filename = str(tmp_path / f'series{MMAP_EXTENSION}')
+    write_mapped_series(filename, daily_series)
+    result = read_mapped_series(filename)
+    pd.testing.assert_series_equal(result, daily_series, check_freq=False)
+    assert isinstance(result.values, np.memmap)
+    assert not result.values.flags.writeable
+
+
+def test_read_date_range(tmp_path, daily_series):
+    filename = str(tmp_path / f'series{MMAP_EXTENSION}')
+    write_mapped_series(filename, daily_series)
+    result = read_mapped_series(filename, start='2005-01-01', end='2005-06-30')
+    expected = daily_series.loc['2005-01-01':'2005-06-30']
+    pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_save_to_cache_mmap_format(daily_series):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'mmap')
+        save_to_cache('test_series', daily_series)
+        save_to_cache('test_dict', {'value': 42})
+    assert os.path.exists(cache_filename('test_series', MMAP_EXTENSION))
+    assert os.path.exists(cache_filename('test_dict'))
+
+    result = load_from_cache('test_series')
+    pd.testing.assert_series_equal(result, daily_series, check_freq=False)
+    assert not result.values.flags.writeable
+    # Memory tier hits still share the mapped pages
+    assert np.shares_memory(load_from_cache('test_series').values,
+                            result.values)
+
+
+def test_save_to_cache_replaces_mmap_entry(daily_series):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'mmap')
+        save_to_cache('test_series', daily_series)
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'pickle')
+        save_to_cache('test_series', daily_series * 2)
+    assert not os.path.exists(cache_filename('test_series', MMAP_EXTENSION))
+    pd.testing.assert_series_equal(
+        load_from_cache('test_series'), daily_series * 2)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pandas as pd
 
+from pyeconomics.api.series_info import SeriesInfo
 from pyeconomics.data.economic_indicators import EconomicIndicators
 
 from pyeconomics.models.monetary_policy.monetary_policy_rules import (
@@ -20,11 +21,15 @@ class TestMonetaryPolicyRules(unittest.TestCase):
 
     @patch(
         'pyeconomics.models.monetary_policy.'
-        'monetary_policy_rules.fred_client.get_series_name')
-    def test_print_fred_series_names(self, mock_get_series_name):
-        mock_get_series_name.side_effect = lambda x: f"Mocked Name for {x}"
+        'monetary_policy_rules.fred_client.get_series_info_many')
+    def test_print_fred_series_names(self, mock_get_series_info_many):
+        mock_get_series_info_many.side_effect = lambda ids: {
+            series_id: SeriesInfo(series_id, title=f"Mocked Name for "
+                                                   f"{series_id}")
+            for series_id in ids}
         print_fred_series_names()
-        self.assertEqual(mock_get_series_name.call_count, 4)
+        mock_get_series_info_many.assert_called_once_with(
+            ['PCETRIM12M159SFRBDAL', 'UNRATE', 'NROU', 'DFII10'])
 
     @patch('pyeconomics.models.monetary_policy.monetary_policy_rules.datetime')
     def test_print_verbose_output(self, mock_datetime):
@@ -0,0 +1,83 @@
+# tests/test_rate_limiter.py
+
+import threading
+import time
+
+import pytest
+
+from pyeconomics.api.rate_limiter import (
+    PRIORITY_BULK, PRIORITY_DEFAULT, PRIORITY_INTERACTIVE, RateLimiter,
+    current_priority, request_priority
+)
+
+
+def test_burst_then_limit():
+    limiter = RateLimiter(rate=3, period=60)
+    assert all(limiter.acquire(timeout=0) for _ in range(3))
+    assert not limiter.acquire(timeout=0.05)
+
+
+def test_tokens_refill_over_time():
+    limiter = RateLimiter(rate=1, period=0.1)
+    assert limiter.acquire(timeout=0)
+    start = time.monotonic()
+    assert limiter.acquire(timeout=1)
+    assert time.monotonic() - start >= 0.05
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_state_file_shared_between_limiters(tmp_path):
+    path = str(tmp_path / 'fred.bucket')
+    first = RateLimiter(rate=2, period=60, path=path)
+    second = RateLimiter(rate=2, period=60, path=path)
+
+    assert first.acquire(timeout=0)
+    assert second.acquire(timeout=0)
+    assert not first.acquire(timeout=0)
+    assert not second.acquire(timeout=0)
+
+
+def test_corrupt_state_file_starts_full(tmp_path):
+    path = tmp_path / 'fred.bucket'
+    path.write_bytes(b'\x01')
+    limiter = RateLimiter(rate=1, period=60, path=str(path))
+    assert limiter.acquire(timeout=0)
+
+
+def test_higher_priority_served_first():
+    limiter = RateLimiter(rate=1, period=0.2)
+    assert limiter.acquire(timeout=0)
+    served = []
+
+    def request(priority):
+        limiter.acquire(priority)
+        served.append(priority)
+
+    bulk = threading.Thread(target=request, args=(PRIORITY_BULK,))
+    bulk.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(
+        target=request, args=(PRIORITY_INTERACTIVE,))
+    interactive.start()
+    bulk.join(2)
+    interactive.join(2)
+
+    assert served == [PRIORITY_INTERACTIVE, PRIORITY_BULK]
+
+
+def test_request_priority_context():
+    assert current_priority() == PRIORITY_DEFAULT
+    with request_priority(PRIORITY_BULK):
+        assert current_priority() == PRIORITY_BULK
+        with request_priority(PRIORITY_INTERACTIVE):
+            assert current_priority() == PRIORITY_INTERACTIVE
+        assert current_priority() == PRIORITY_BULK
+    assert current_priority() == PRIORITY_DEFAULT
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,99 @@
+# tests/test_retry.py
+
+import socket
+import time
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from pyeconomics.api.retry import (
+    CircuitBreaker, CircuitOpenError, RetryPolicy, is_retryable
+)
+
+
+def fred_error(code):
+    """Builds the ValueError fredapi raises for an HTTP error response."""
+    try:
+        raise HTTPError('https://api.stlouisfed.org', code, 'error', None,
+                        None)
+    except HTTPError:
+        try:
+            raise ValueError(f"FRED error {code}")
+        except ValueError as e:
+            return e
+
+
+@pytest.mark.parametrize('code', [429, 500, 502, 503, 504])
+def test_retryable_status_codes(code):
+    assert is_retryable(fred_error(code))
+
+
+@pytest.mark.parametrize('code', [400, 404])
+def test_client_errors_not_retryable(code):
+    assert not is_retryable(fred_error(code))
+
+
+def test_network_errors_retryable():
+    assert is_retryable(URLError('connection refused'))
+    assert is_retryable(socket.timeout('timed out'))
+    assert is_retryable(ConnectionResetError())
+
+
+def test_other_errors_not_retryable():
+    assert not is_retryable(ValueError("No data found for series ID X"))
+    assert not is_retryable(CircuitOpenError("open"))
+
+
+def test_delay_bounded_by_backoff():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for attempt, cap in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+        delays = [policy.delay(attempt) for _ in range(50)]
+        assert all(0 <= delay <= cap for delay in delays)
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+
+
+def test_half_open_allows_one_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.state == 'half-open'
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == 'closed'
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == 'open'
+
+
+if __name__ == '__main__':
+    pytest.main()
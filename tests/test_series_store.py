@@ -0,0 +1,131 @@
+# tests/test_series_store.py
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyeconomics.api.cache_manager as cache_manager
+from pyeconomics.api.cache_manager import (
+    CACHE_DIR, PICKLE_EXTENSION, cache_filename, clear_memory_cache,
+    load_from_cache, save_to_cache
+)
+from pyeconomics.api.mmap_store import MMAP_EXTENSION
+from pyeconomics.api.series_store import (
+    SERIES_EXTENSION, is_storable_series, read_series, write_series
+)
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture(scope='function', autouse=True)
+def setup_and_teardown():
+    """Setup and teardown for tests."""
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+    clear_memory_cache()
+    yield
+    if os.path.exists(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range('2000-01-01', periods=10000, freq='D', name='DATE')
+    return pd.Series(
+        np.linspace(0.0, 5.0, len(index)), index=index, name='DFII10')
+
+
+def test_is_storable_series(daily_series):
+    assert is_storable_series(daily_series)
+    assert not is_storable_series(pd.Series([1, 2, 3]))
+    assert not is_storable_series({'value': 42})
+    assert not is_storable_series(daily_series.astype(str))
+
+
+def test_write_and_read_series(tmp_path, daily_series):
+    filename = str(tmp_path / f'series{SERIES_EXTENSION}')
+    write_series(filename, daily_series)
+    result = read_series(filename)
+    pd.testing.assert_series_equal(result, daily_series, check_freq=False)
+
+
+def test_read_series_date_range(tmp_path, daily_series):
+    filename = str(tmp_path / f'series{SERIES_EXTENSION}')
+    write_series(filename, daily_series)
+    result = read_series(filename, start='2010-01-01', end='2010-12-31')
+    expected = daily_series.loc['2010-01-01':'2010-12-31']
+    pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_save_to_cache_uses_series_store(daily_series):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'parquet')
+        save_to_cache('test_series', daily_series)
+    assert os.path.exists(cache_filename('test_series', SERIES_EXTENSION))
+    assert not os.path.exists(cache_filename('test_series'))
+    result = load_from_cache('test_series')
+    pd.testing.assert_series_equal(result, daily_series, check_freq=False)
+
+
+def test_save_to_cache_pickle_format(daily_series):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'pickle')
+        save_to_cache('test_series', daily_series)
+    assert os.path.exists(cache_filename('test_series'))
+    assert not os.path.exists(
+        cache_filename('test_series', SERIES_EXTENSION))
+    result = load_from_cache('test_series', start='2001-01-01')
+    pd.testing.assert_series_equal(result, daily_series.loc['2001-01-01':])
+
+
+def test_switching_format_replaces_entry(daily_series):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'pickle')
+        save_to_cache('test_series', daily_series)
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'parquet')
+        save_to_cache('test_series', daily_series * 2)
+    assert not os.path.exists(cache_filename('test_series'))
+    result = load_from_cache('test_series')
+    pd.testing.assert_series_equal(
+        result, daily_series * 2, check_freq=False)
+
+
+def test_load_from_cache_series_date_range(daily_series):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', 'parquet')
+        save_to_cache('test_series', daily_series)
+    result = load_from_cache('test_series', end='2000-01-31')
+    assert len(result) == 31
+    assert result.index[-1] == pd.Timestamp('2000-01-31')
+
+
+@pytest.mark.parametrize('series_format, extension', [
+    ('pickle', PICKLE_EXTENSION),
+    ('parquet', SERIES_EXTENSION),
+    ('mmap', MMAP_EXTENSION),
+])
+def test_partial_date_range_matches_memory_tier(
+        daily_series, series_format, extension):
+    # Only unnamed series with an unnamed index are memory-mapped
+    daily_series = daily_series.rename(None).rename_axis(None)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache_manager, 'SERIES_FORMAT', series_format)
+        save_to_cache('test_series', daily_series)
+    expected = daily_series.loc['2000-02':'2000-03']
+    clear_memory_cache()
+    from_disk = load_from_cache('test_series', start='2000-02', end='2000-03')
+    from_memory = load_from_cache(
+        'test_series', start='2000-02', end='2000-03')
+
+    assert len(from_disk) == 60
+    assert os.path.exists(cache_filename('test_series', extension))
+    for result in (from_disk, from_memory):
+        pd.testing.assert_series_equal(
+            result, expected, check_freq=False, check_names=False)
+
+
+if __name__ == '__main__':
+    pytest.main()
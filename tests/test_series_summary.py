@@ -0,0 +1,80 @@
+# tests/test_series_summary.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyeconomics.api.series_summary import SeriesSummary
+
+
+@pytest.fixture
+def monthly():
+    return pd.Series(
+        np.arange(120, dtype='float64'),
+        index=pd.date_range('2015-01-01', periods=120, freq='MS'))
+
+
+def test_latest_value_matches_full_series(monthly):
+    summary = SeriesSummary.from_series(monthly, as_of='2020-06-15', tail=6)
+    for day in ['2020-06-15', '2020-07-01', '2021-03-31', '2030-01-01']:
+        expected = monthly[:day].iloc[-1]
+        assert summary.covers_latest(pd.Timestamp(day))
+        assert summary.latest_value(pd.Timestamp(day)) == expected
+
+
+def test_latest_value_before_as_of_not_covered(monthly):
+    summary = SeriesSummary.from_series(monthly, as_of='2020-06-15')
+    assert not summary.covers_latest(pd.Timestamp('2020-06-14'))
+
+
+def test_current_holds_future_observations():
+    projections = pd.Series(
+        [4.4, 4.3, 4.2],
+        index=pd.to_datetime(['2024-01-01', '2024-04-01', '2024-07-01']))
+    summary = SeriesSummary.from_series(projections, as_of='2024-02-15')
+
+    assert summary.current.tolist() == [4.4, 4.3, 4.2]
+    assert summary.latest_value(pd.Timestamp('2024-02-15')) == 4.4
+    assert summary.latest_value(pd.Timestamp('2024-05-01')) == 4.3
+
+
+def test_series_starting_after_as_of():
+    future = pd.Series(
+        [1.0], index=pd.to_datetime(['2024-06-01']))
+    summary = SeriesSummary.from_series(future, as_of='2024-01-01')
+    assert summary.latest_value(pd.Timestamp('2024-01-01')) is None
+    assert summary.latest_value(pd.Timestamp('2024-06-01')) == 1.0
+
+
+@pytest.mark.parametrize('periods', [-1, -2, -6])
+def test_historical_value_matches_full_series(monthly, periods):
+    summary = SeriesSummary.from_series(monthly, tail=6)
+    assert summary.covers_lag(periods)
+    assert summary.historical_value(periods) == monthly.iloc[periods]
+
+
+def test_lag_beyond_tail_not_covered(monthly):
+    summary = SeriesSummary.from_series(monthly, tail=6)
+    assert not summary.covers_lag(-7)
+    assert not summary.covers_lag(0)
+
+
+def test_short_series_fully_covered():
+    data = pd.Series([1.0, 2.0, 3.0])
+    summary = SeriesSummary.from_series(data, tail=6)
+
+    assert summary.current is None
+    assert not summary.covers_latest(pd.Timestamp.today())
+    assert summary.covers_lag(0)
+    assert summary.historical_value(0) == 1.0
+    assert summary.historical_value(-2) == 2.0
+    assert summary.historical_value(-3) is None
+
+
+def test_nbytes(monthly):
+    summary = SeriesSummary.from_series(monthly, tail=6)
+    assert 0 < summary.nbytes < monthly.memory_usage(index=True)
+
+
+if __name__ == '__main__':
+    pytest.main()
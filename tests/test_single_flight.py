@@ -0,0 +1,119 @@
+# tests/test_single_flight.py
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from pyeconomics.api.single_flight import SingleFlight
+
+
+def run_concurrently(flight, key, function, callers):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, function))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def wait_for_callers(flight, key, callers):
+    deadline = time.monotonic() + 5
+    while flight.in_flight(key) < callers and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_do_returns_result():
+    flight = SingleFlight()
+    assert flight.do('key', lambda x, y=0: x + y, 1, y=2) == 3
+    assert flight.in_flight('key') == 0
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def function():
+        calls.append(1)
+        release.wait(5)
+        return 'result'
+
+    threads, results, errors = run_concurrently(flight, 'key', function, 5)
+    wait_for_callers(flight, 'key', 5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ['result'] * 5
+    assert errors == []
+    assert flight.in_flight('key') == 0
+
+
+def test_concurrent_calls_share_error():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def function():
+        release.wait(5)
+        raise ValueError("failed")
+
+    threads, results, errors = run_concurrently(flight, 'key', function, 3)
+    wait_for_callers(flight, 'key', 3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == []
+    assert len(errors) == 3
+    assert all(isinstance(e, ValueError) for e in errors)
+
+
+def test_waiters_receive_independent_copies():
+    flight = SingleFlight()
+    release = threading.Event()
+    series = pd.Series([1.0, 2.0])
+
+    def function():
+        release.wait(5)
+        return series
+
+    threads, results, errors = run_concurrently(flight, 'key', function, 3)
+    wait_for_callers(flight, 'key', 3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    series.iloc[0] = -1.0
+
+    assert errors == []
+    assert sum(result is series for result in results) == 1
+    assert sorted(result.iloc[0] for result in results) == [-1.0, 1.0, 1.0]
+
+
+def test_different_keys_run_independently():
+    flight = SingleFlight()
+    assert flight.do('a', lambda: 1) == 1
+    assert flight.do('b', lambda: 2) == 2
+
+
+def test_key_is_released_after_error():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        flight.do('key', fail)
+    assert flight.do('key', lambda: 'retried') == 'retried'
+
+
+if __name__ == '__main__':
+    pytest.main()
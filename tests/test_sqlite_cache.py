@@ -0,0 +1,129 @@
+# tests/test_sqlite_cache.py
+
+import gc
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyeconomics.api.cache_expiry import ReleaseCutoff
+from pyeconomics.api.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.sqlite3'))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def daily_series():
+    index = pd.date_range('2000-01-01', periods=1000, freq='D')
+    return pd.Series(np.linspace(0.0, 5.0, len(index)), index=index,
+                     name='DFII10')
+
+
+def test_save_and_load(cache, daily_series):
+    cache.save('test_series', daily_series)
+    cache.save('test_dict', {'value': 42})
+    pd.testing.assert_series_equal(cache.load('test_series'), daily_series)
+    assert cache.load('test_dict') == {'value': 42}
+    assert cache.load('missing') is None
+
+
+def test_database_uses_wal(cache):
+    cache.save('test_key', 1)
+    mode = cache._connection().execute('PRAGMA journal_mode').fetchone()[0]
+    assert mode == 'wal'
+
+
+def test_load_expired(cache):
+    cache.save('test_key', 1)
+    cache._connection().execute(
+        'UPDATE entries SET saved_at = ?', (time.time() - 2 * 86400,))
+    assert cache.load('test_key') is None
+    assert cache.load('test_key', expiry=timedelta(days=3)) == 1
+    assert cache.load('test_key', expiry=ReleaseCutoff()) is None
+
+
+def test_save_many_and_load_many(cache, daily_series):
+    cache.save_many({'a': 1, 'b': daily_series, 'c': 'three'})
+    results = cache.load_many(['a', 'b', 'missing', 'c'])
+    assert set(results) == {'a', 'b', 'c'}
+    assert results['a'] == 1
+    pd.testing.assert_series_equal(results['b'], daily_series)
+
+
+def test_load_many_large_batch(cache):
+    cache.save_many({f'key_{i}': i for i in range(1200)})
+    results = cache.load_many(f'key_{i}' for i in range(1500))
+    assert results == {f'key_{i}': i for i in range(1200)}
+
+
+def test_invalidate_and_clear(cache):
+    cache.save_many({'a': 1, 'b': 2})
+    cache.invalidate('a')
+    assert cache.load_many(['a', 'b']) == {'b': 2}
+    cache.clear()
+    assert cache.usage() == {'entries': 0, 'total_bytes': 0}
+
+
+def test_usage(cache):
+    cache.save_many({'a': 1, 'b': 2})
+    usage = cache.usage()
+    assert usage['entries'] == 2
+    assert usage['total_bytes'] > 0
+
+
+def test_export(cache, tmp_path, daily_series):
+    cache.save('test_series', daily_series)
+    copy_path = str(tmp_path / 'copy.sqlite3')
+    cache.export(copy_path)
+    copy = SQLiteCache(copy_path)
+    try:
+        pd.testing.assert_series_equal(copy.load('test_series'), daily_series)
+    finally:
+        copy.close()
+
+
+def test_concurrent_threads(cache):
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(50):
+                cache.save(f'key_{n}_{i}', i)
+                assert cache.load(f'key_{n}_{i}') == i
+        except (AssertionError, sqlite3.Error) as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert cache.usage()['entries'] == 200
+
+
+def test_thread_connection_closed_on_exit(cache):
+    connections = []
+    thread = threading.Thread(
+        target=lambda: connections.append(cache._connection()))
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    with pytest.raises(sqlite3.ProgrammingError, match='closed'):
+        connections[0].execute('SELECT 1')
+    assert cache.usage()['entries'] == 0
+    assert len(cache._finalizers) == 1
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -88,14 +88,15 @@ def test_taylor_rule(mock_fred_client, mock_fred_data):
 
 @patch('pyeconomics.models.monetary_policy.taylor_rule.fred_client')
 @patch('pyeconomics.models.monetary_policy.'
-       'taylor_rule.fetch_historical_fed_funds_rate')
+       'taylor_rule.combine_fed_funds_rate')
 def test_historical_taylor_rule(
-        mock_fetch_historical_fed_funds_rate, mock_fred_client, mock_fred_data
+        mock_combine_fed_funds_rate, mock_fred_client, mock_fred_data
 ):
-    mock_fred_client.fetch_data.side_effect = (
-        lambda series_id: pd.Series([mock_fred_data[series_id]] * 10)
-    )
-    mock_fetch_historical_fed_funds_rate.return_value = (
+    mock_fred_client.fetch_many.side_effect = lambda series_ids: {
+        series_id: pd.Series([mock_fred_data.get(series_id)] * 10)
+        for series_id in series_ids
+    }
+    mock_combine_fed_funds_rate.return_value = (
         pd.Series([mock_fred_data['current_fed_rate']] * 10)
     )
 
@@ -129,10 +130,8 @@ def test_historical_taylor_rule(
 def test_historical_taylor_rule_missing_data(
         mock_fred_client, mock_fred_data
 ):
-    mock_fred_client.side_effect = [
-        mock_fred_data, mock_fred_data, mock_fred_data, mock_fred_data,
-        pd.Series()
-    ]
+    mock_fred_client.fetch_many.side_effect = ValueError(
+        "No data found for series ID real_interest_rate")
 
     indicators = EconomicIndicators(
         inflation_series_id='inflation_rate',
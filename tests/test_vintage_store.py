@@ -0,0 +1,71 @@
+# tests/test_vintage_store.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyeconomics.api.memory_cache import estimate_size
+from pyeconomics.api.vintage_store import VintageHistory
+
+
+@pytest.fixture
+def releases():
+    """Stand-in for Fred.get_series_all_releases('UNRATE')."""
+    rows = [
+        # date, realtime_start, value
+        ('2024-01-01', '2024-02-02', 3.7),
+        ('2024-01-01', '2024-03-08', 3.7),  # restated unchanged
+        ('2024-01-01', '2025-01-10', 3.8),  # annual revision
+        ('2024-02-01', '2024-03-08', 3.9),
+        ('2024-02-01', '2025-01-10', 3.9),  # restated unchanged
+        ('2024-03-01', '2024-04-05', 3.8),
+        ('2024-03-01', '2024-05-03', float('nan')),
+    ]
+    # Columns arrive as objects, like fredapi returns them
+    return pd.DataFrame(
+        rows, columns=['date', 'realtime_start', 'value'], dtype=object
+    ).sample(frac=1.0, random_state=0)
+
+
+@pytest.fixture
+def history(releases):
+    return VintageHistory.from_releases('UNRATE', releases)
+
+
+def test_from_releases_keeps_only_changes(history):
+    assert len(history) == 5
+    assert history.dates.dtype == np.dtype('datetime64[ns]')
+    assert list(history.vintage_dates.strftime('%Y-%m-%d')) == [
+        '2024-02-02', '2024-03-08', '2024-04-05', '2024-05-03', '2025-01-10']
+
+
+def test_as_of(history):
+    pd.testing.assert_series_equal(
+        history.as_of('2024-03-31'),
+        pd.Series([3.7, 3.9], index=pd.DatetimeIndex(
+            ['2024-01-01', '2024-02-01']), name='UNRATE'))
+    latest = history.as_of()
+    assert latest['2024-01-01'] == 3.8
+    assert np.isnan(latest['2024-03-01'])
+    assert history.as_of('2024-04-05')['2024-03-01'] == 3.8
+    assert history.as_of('2000-01-01').empty
+
+
+def test_merge(history):
+    update = VintageHistory.from_releases('UNRATE', pd.DataFrame({
+        'date': ['2024-02-01', '2024-04-01'],
+        'realtime_start': ['2025-01-10', '2025-01-10'],
+        'value': [3.9, 3.9],
+    }))
+    merged = history.merge(update)
+    assert len(merged) == 6
+    assert merged.as_of()['2024-04-01'] == 3.9
+    assert merged.as_of('2024-12-31').index[-1] == pd.Timestamp('2024-03-01')
+
+
+def test_size_estimate(history):
+    assert estimate_size(history) == history.nbytes == 5 * 3 * 8
+
+
+if __name__ == '__main__':
+    pytest.main()